@@ -0,0 +1,42 @@
+# bench_adders.py
+import argparse
+import random
+
+from src.adders import ARCHITECTURES, trace_stats
+
+
+def load_trace(path: str) -> list[tuple[int, int]]:
+    """Трасса операндов: по паре целых через пробел в строке"""
+    pairs = []
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                a, b = line.split()[:2]
+                pairs.append((int(a), int(b)))
+    return pairs
+
+
+def random_trace(width: int, count: int, seed: int = 0) -> list[tuple[int, int]]:
+    rng = random.Random(seed)
+    return [(rng.getrandbits(width), rng.getrandbits(width)) for _ in range(count)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Сравнение схем сумматоров по глубине, площади и задержке на трассе')
+    parser.add_argument('--trace', help='файл с парами операндов (по умолчанию случайные)')
+    parser.add_argument('--widths', nargs='+', type=int, default=[8, 16, 32, 64, 128])
+    parser.add_argument('--count', type=int, default=200, help='число случайных пар')
+    args = parser.parse_args(argv)
+
+    trace = load_trace(args.trace) if args.trace else None
+    print(f'{"разрядность":>11} | {"схема":>15} | {"глубина":>7} | {"вентилей":>8} | {"ср. задержка":>12} | {"макс.":>5}')
+    print('-' * 74)
+    for width in args.widths:
+        pairs = trace or random_trace(width, args.count)
+        for item in trace_stats(pairs, width, list(ARCHITECTURES)):
+            print(f'{width:>11} | {item.architecture:>15} | {item.depth:>7} | {item.gates:>8} | '
+                  f'{item.mean_delay:>12.2f} | {item.max_delay:>5}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+# bench_multiplier.py
+import random
+import timeit
+
+from src.binary_codes import BinaryNumber
+from src.multiplier import multiply, MULTIPLIERS
+import src.utils as utils
+
+
+def make_operands(width: int, count: int, seed: int = 0) -> list[tuple[int, int]]:
+    rng = random.Random(seed)
+    low, high = -2 ** (width - 1), 2 ** (width - 1) - 1
+    return [(rng.randint(low, high), rng.randint(low, high)) for _ in range(count)]
+
+
+def bench_current(operands: list[tuple[int, int]], width: int) -> None:
+    for a, b in operands:
+        utils.multiplication(BinaryNumber(a, width), BinaryNumber(b, width))
+
+
+def bench_mode(operands: list[tuple[int, int]], width: int, mode: str) -> None:
+    for a, b in operands:
+        multiply(a, b, width, mode)
+
+
+def main():
+    count = 200
+    print(f'{"разрядность":>11} | {"метод":>12} | {"операций/с":>12}')
+    print('-' * 41)
+    for width in (8, 32, 64, 128, 512):
+        operands = make_operands(width, count)
+        runs = [('current', lambda: bench_current(operands, width))]
+        runs += [(mode, lambda mode=mode: bench_mode(operands, width, mode)) for mode in MULTIPLIERS]
+        for name, run in runs:
+            elapsed = min(timeit.repeat(run, number=1, repeat=3))
+            print(f'{width:>11} | {name:>12} | {count / elapsed:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
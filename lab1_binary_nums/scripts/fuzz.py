@@ -0,0 +1,26 @@
+# fuzz.py
+import argparse
+import sys
+
+from src.fuzz import OPERATIONS, run_harness, format_report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Сравнение операций lab1 с эталонами на случайных и граничных операндах')
+    parser.add_argument('--budget', type=float, default=10.0, help='общий бюджет времени, с')
+    parser.add_argument('--ops', nargs='+', choices=list(OPERATIONS), help='проверяемые операции (по умолчанию все)')
+    parser.add_argument('--widths', nargs='+', type=int, default=[8, 16, 32], help='разрядности целочисленных операций')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-cases', type=int, help='предел числа случаев на операцию')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    stats = run_harness(args.ops, args.budget, tuple(args.widths), args.seed, args.max_cases)
+    print(format_report(stats))
+    return 1 if any(item.mismatches for item in stats) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,20 @@
 # main.py
+import argparse
+import csv
+import io
+import json
+import math
+import struct
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
 from src.binary_codes import BinaryNumber
+from src.bitops import fits_in
+from src.float_parse import parse_float
 from src.ieee754 import IEEE754Float, add_ieee754
+from src.softfloat import f32_add
 import src.utils as utils
 
 
@@ -67,7 +81,183 @@ def handle_binary_operation(choice: int, num1: BinaryNumber, num2: BinaryNumber)
         print(f'Ошибка: {e}')
 
 
-def main():
+# Разрядность слова целочисленных операций пакетного режима
+BATCH_WIDTH = 32
+
+
+def _int_operand(value) -> int:
+    number = int(str(value))
+    if not fits_in(number, BATCH_WIDTH):
+        raise ValueError(f'Операнд {number} не помещается в {BATCH_WIDTH} бит')
+    return number
+
+
+def _int_operation(operation, converter, check=None):
+    def run(a, b):
+        a, b = _int_operand(a), _int_operand(b)
+        if check is not None:
+            check(a, b)
+        return converter(operation(BinaryNumber(a, BATCH_WIDTH), BinaryNumber(b, BATCH_WIDTH)))
+    return run
+
+
+def _check_product(a: int, b: int) -> None:
+    """Произведение в прямом коде должно поместиться в модуль слова"""
+    if abs(a * b) >= 1 << (BATCH_WIDTH - 1):
+        raise ValueError(f'Произведение не помещается в {BATCH_WIDTH} бит')
+
+
+def _float_operand(value) -> int:
+    """Слово binary32 для строки или числа из JSON (в том числе inf, nan и 1e999)"""
+    return parse_float(value if isinstance(value, str) else repr(float(value)))
+
+
+def _float_sum(a, b) -> float:
+    """Сумма в binary32 с округлением к ближайшему чётному (softfloat.f32_add)"""
+    word = f32_add(_float_operand(a), _float_operand(b))
+    return struct.unpack('>f', struct.pack('>I', word))[0]
+
+
+# Операции пакетного режима: имя -> функция от двух операндов (строк или чисел из JSON)
+BATCH_OPERATIONS = {
+    'add': _int_operation(utils.sum_in_compl_code, utils.twos_complement_to_decimal),
+    'sub': _int_operation(utils.subtraction, utils.twos_complement_to_decimal),
+    'mul': _int_operation(utils.multiplication, utils.binary_to_decimal, _check_product),
+    'div': _int_operation(utils.division, utils.binary_fraction_to_decimal),
+    'fadd': _float_sum,
+}
+
+
+def _parse_line(line: str, fmt: str) -> tuple:
+    if fmt == 'jsonl':
+        record = json.loads(line)
+        return str(record['op']), record['a'], record['b']
+    fields = next(csv.reader([line]))
+    if len(fields) != 3:
+        raise ValueError('Ожидается строка вида операция,a,b')
+    return fields[0].strip(), fields[1].strip(), fields[2].strip()
+
+
+def _json_value(value):
+    """Бесконечности и NaN записываются строками 'inf', '-inf', 'nan': в строгом JSON их нет"""
+    if isinstance(value, float) and not math.isfinite(value):
+        return repr(value)
+    return value
+
+
+def _format_result(fmt: str, op: str, a, b, result=None, error: str | None = None) -> str:
+    if fmt == 'jsonl':
+        record = {'op': op, 'a': _json_value(a), 'b': _json_value(b)}
+        if error is None:
+            record['result'] = _json_value(result)
+        else:
+            record['error'] = error
+        return json.dumps(record, ensure_ascii=False, allow_nan=False)
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='').writerow([op, a, b, result if error is None else f'error: {error}'])
+    return buffer.getvalue()
+
+
+def process_line(line: str, fmt: str) -> str:
+    """Выполняет одну операцию и возвращает строку результата в том же формате"""
+    op = a = b = ''
+    try:
+        op, a, b = _parse_line(line, fmt)
+        if op not in BATCH_OPERATIONS:
+            raise ValueError(f'Неизвестная операция: {op}')
+        return _format_result(fmt, op, a, b, BATCH_OPERATIONS[op](a, b))
+    except (ValueError, KeyError, TypeError, ArithmeticError) as e:
+        return _format_result(fmt, op, a, b, error=str(e))
+
+
+def process_chunk(lines: list[str], fmt: str) -> list[str]:
+    return [process_line(line, fmt) for line in lines]
+
+
+def _detect_format(line: str) -> str:
+    return 'jsonl' if line.lstrip().startswith('{') else 'csv'
+
+
+def _chunks(lines, chunk_size: int):
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(source, target, fmt: str = 'auto', chunk_size: int = 1000, workers: int = 0) -> int:
+    """
+    Потоково обрабатывает операции из source и пишет результаты в target.
+    Пустые строки и комментарии (#) пропускаются. В памяти держится не больше
+    нескольких блоков по chunk_size строк; при workers > 0 блоки считаются в пуле процессов.
+    Возвращает число обработанных строк.
+    """
+    lines = (line.strip() for line in source)
+    lines = (line for line in lines if line and not line.startswith('#'))
+    first = next(lines, None)
+    if first is None:
+        return 0
+    if fmt == 'auto':
+        fmt = _detect_format(first)
+
+    def all_lines():
+        yield first
+        yield from lines
+
+    processed = 0
+
+    def write(results: list[str]) -> None:
+        nonlocal processed
+        target.write('\n'.join(results) + '\n')
+        processed += len(results)
+
+    if workers <= 0:
+        for chunk in _chunks(all_lines(), chunk_size):
+            write(process_chunk(chunk, fmt))
+        return processed
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(all_lines(), chunk_size):
+            pending.append(pool.submit(process_chunk, chunk, fmt))
+            if len(pending) >= 2 * workers:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    return processed
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Арифметика в двоичных кодах и IEEE-754')
+    parser.add_argument('--batch', nargs='?', const='-', metavar='FILE',
+                        help='неинтерактивный режим: читать операции из файла или stdin (-)')
+    parser.add_argument('--output', default='-', metavar='FILE', help='куда писать результаты (по умолчанию stdout)')
+    parser.add_argument('--format', choices=('auto', 'csv', 'jsonl'), default='auto', help='формат строк')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='строк в одном блоке обработки')
+    parser.add_argument('--workers', type=int, default=0, help='число процессов (0 - без пула)')
+    return parser.parse_args(argv)
+
+
+def batch_main(args: argparse.Namespace) -> int:
+    source = sys.stdin if args.batch == '-' else open(args.batch, encoding='utf-8')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        run_batch(source, target, args.format, args.chunk_size, args.workers)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    return 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.batch is not None:
+        return batch_main(args)
+
     while True:
         display_menu()
         try:
@@ -96,14 +286,14 @@ def main():
             n1 = input_float('Введите первое дробное число: ')
             try:
                 num1 = IEEE754Float.from_decimal(n1)
-            except ValueError as e:
+            except (ValueError, OverflowError) as e:
                 print(f'Ошибка: {e}')
                 continue
                 
             n2 = input_float('Введите второе дробное число: ')
             try:
                 num2 = IEEE754Float.from_decimal(n2)
-            except ValueError as e:
+            except (ValueError, OverflowError) as e:
                 print(f'Ошибка: {e}')
                 continue
             
@@ -0,0 +1,297 @@
+from functools import lru_cache
+from math import isqrt
+from typing import NamedTuple
+
+from src.bitops import mask, word_params
+from src.bitslice import transpose, untranspose
+
+# Вентили с единичной задержкой: двухвходовые and, or, xor и мультиплексор 2:1
+_AND, _OR, _XOR, _MUX = 'and', 'or', 'xor', 'mux'
+
+# Размер блока сумматора с ускоренным переносом
+CLA_BLOCK = 4
+
+
+class AdderResult(NamedTuple):
+    sum: int # младшие width бит суммы
+    carry_out: int # перенос из старшего разряда
+    overflow: int # переполнение в дополнительном коде
+
+
+class AdderCost(NamedTuple):
+    depth: int # число вентилей на критическом пути
+    gates: int # общее число вентилей
+
+
+class TraceStats(NamedTuple):
+    architecture: str
+    width: int
+    depth: int
+    gates: int
+    mean_delay: float # средняя задержка установления выходов на трассе
+    max_delay: int
+
+
+class Netlist:
+    """
+    Схема сумматора из вентилей. Провода нумеруются подряд: сначала входы
+    a[0..width-1], b[0..width-1], входной перенос и константы 0 и 1, затем выходы вентилей.
+    """
+
+    def __init__(self, width: int):
+        self.width = width
+        self.a = list(range(width))
+        self.b = list(range(width, 2 * width))
+        self.carry_in = 2 * width
+        self.zero = 2 * width + 1
+        self.one = 2 * width + 2
+        self.inputs = 2 * width + 3
+        self.gates: list[tuple] = [] # (операция, провода входов)
+        self.levels = [0] * self.inputs # глубина каждого провода
+        self.sums: list[int] = []
+        self.carry_out = self.zero
+
+    def gate(self, op: str, *inputs: int) -> int:
+        self.gates.append((op, inputs))
+        self.levels.append(max(self.levels[wire] for wire in inputs) + 1)
+        return len(self.levels) - 1
+
+    def tree(self, op: str, wires: list[int]) -> int:
+        """Сбалансированное дерево двухвходовых вентилей"""
+        while len(wires) > 1:
+            paired = [self.gate(op, wires[i], wires[i + 1]) for i in range(0, len(wires) - 1, 2)]
+            wires = paired + wires[len(wires) - len(wires) % 2:]
+        return wires[0]
+
+    @property
+    def cost(self) -> AdderCost:
+        outputs = self.sums + [self.carry_out]
+        return AdderCost(max(self.levels[wire] for wire in outputs), len(self.gates))
+
+    def evaluate(self, a_slices: list[int], b_slices: list[int], carry_in: int, lanes_mask: int) -> list[int]:
+        """Вычисляет все провода; каждый провод - срез битов по дорожкам"""
+        values = a_slices + b_slices + [carry_in, 0, lanes_mask]
+        append = values.append
+        for op, inputs in self.gates:
+            if op == _AND:
+                append(values[inputs[0]] & values[inputs[1]])
+            elif op == _OR:
+                append(values[inputs[0]] | values[inputs[1]])
+            elif op == _XOR:
+                append(values[inputs[0]] ^ values[inputs[1]])
+            else:
+                select = values[inputs[0]]
+                append((select & values[inputs[1]]) | (~select & values[inputs[2]]))
+        return values
+
+    def settle_time(self, a: int, b: int, carry_in: int = 0) -> int:
+        """
+        Задержка установления выходов для конкретных операндов: вентиль and (or)
+        с уже установившимся нулём (единицей) на входе не ждёт второй вход.
+        """
+        values = self.evaluate([(a >> i) & 1 for i in range(self.width)],
+                               [(b >> i) & 1 for i in range(self.width)], carry_in, 1)
+        times = [0] * self.inputs
+        for op, inputs in self.gates:
+            if op in (_AND, _OR):
+                controlling = 0 if op == _AND else 1
+                decided = [times[wire] for wire in inputs if values[wire] == controlling]
+                times.append((min(decided) if decided else max(times[wire] for wire in inputs)) + 1)
+            elif op == _XOR:
+                times.append(max(times[wire] for wire in inputs) + 1)
+            else:
+                chosen = inputs[1] if values[inputs[0]] else inputs[2]
+                times.append(max(times[inputs[0]], times[chosen]) + 1)
+        return max(times[wire] for wire in self.sums + [self.carry_out])
+
+
+def _propagate_generate(net: Netlist) -> tuple[list[int], list[int]]:
+    p = [net.gate(_XOR, a, b) for a, b in zip(net.a, net.b)]
+    g = [net.gate(_AND, a, b) for a, b in zip(net.a, net.b)]
+    return p, g
+
+
+def _ripple(net: Netlist, p: list[int], g: list[int], carry: int) -> tuple[list[int], int]:
+    """Цепочка переносов c[i+1] = g[i] | p[i] & c[i]; возвращает суммы и перенос"""
+    sums = []
+    for p_i, g_i in zip(p, g):
+        sums.append(net.gate(_XOR, p_i, carry))
+        carry = net.gate(_OR, g_i, net.gate(_AND, p_i, carry))
+    return sums, carry
+
+
+def build_ripple(width: int) -> Netlist:
+    """Сумматор с последовательным переносом, как цикл в sum_in_compl_code"""
+    net = Netlist(width)
+    p, g = _propagate_generate(net)
+    net.sums, net.carry_out = _ripple(net, p, g, net.carry_in)
+    return net
+
+
+def build_carry_lookahead(width: int, block: int = CLA_BLOCK) -> Netlist:
+    """
+    Сумматор с ускоренным переносом: внутри блока переносы раскрываются в сумму произведений
+    c[j+1] = g[j] | p[j] g[j-1] | ... | p[j]..p[0] c, между блоками перенос идёт через
+    групповые сигналы G и P.
+    """
+    net = Netlist(width)
+    p, g = _propagate_generate(net)
+    carry = net.carry_in
+    for start in range(0, width, block):
+        indices = range(start, min(start + block, width))
+        carries = [carry]
+        for j in indices:
+            terms = [g[j]]
+            for k in range(j - 1, start - 2, -1):
+                source = g[k] if k >= start else carry
+                terms.append(net.tree(_AND, [p[m] for m in range(k + 1, j + 1)] + [source]))
+            carries.append(net.tree(_OR, terms) if j < indices[-1] else None)
+        group_generate = net.tree(_OR, [net.tree(_AND, [p[m] for m in range(k + 1, indices[-1] + 1)] + [g[k]])
+                                        for k in indices])
+        group_propagate = net.tree(_AND, [p[m] for m in indices])
+        net.sums += [net.gate(_XOR, p[j], carries[j - start]) for j in indices]
+        carry = net.gate(_OR, group_generate, net.gate(_AND, group_propagate, carry))
+    net.carry_out = carry
+    return net
+
+
+def build_carry_select(width: int, block: int | None = None) -> Netlist:
+    """
+    Сумматор с выбором переноса: каждый блок, кроме первого, считается дважды
+    (при переносе 0 и 1), результат выбирается мультиплексором по пришедшему переносу.
+    """
+    block = block or max(2, isqrt(width))
+    net = Netlist(width)
+    p, g = _propagate_generate(net)
+    sums, carry = _ripple(net, p[:block], g[:block], net.carry_in)
+    net.sums = sums
+    for start in range(block, width, block):
+        part = slice(start, start + block)
+        sums0, carry0 = _ripple(net, p[part], g[part], net.zero)
+        sums1, carry1 = _ripple(net, p[part], g[part], net.one)
+        net.sums += [net.gate(_MUX, carry, s1, s0) for s0, s1 in zip(sums0, sums1)]
+        carry = net.gate(_MUX, carry, carry1, carry0)
+    net.carry_out = carry
+    return net
+
+
+class _Prefix:
+    """Узлы параллельного префиксного сумматора: (G, P) группы [low, i]"""
+
+    def __init__(self, net: Netlist, p: list[int], g: list[int]):
+        self.net = net
+        # Входной перенос вносится в генерацию нулевого разряда
+        self.generate = [net.gate(_OR, g[0], net.gate(_AND, p[0], net.carry_in))] + g[1:]
+        self.propagate = p[:]
+        self.low = list(range(len(p)))
+
+    def combine(self, high: int, low: int) -> None:
+        """(G, P)[high] = (G_h | P_h & G_l, P_h & P_l); P не нужен, если группа дошла до нуля"""
+        net = self.net
+        self.generate[high] = net.gate(_OR, self.generate[high],
+                                       net.gate(_AND, self.propagate[high], self.generate[low]))
+        if self.low[low] > 0:
+            self.propagate[high] = net.gate(_AND, self.propagate[high], self.propagate[low])
+        self.low[high] = self.low[low]
+
+    def finish(self, p: list[int]) -> None:
+        net = self.net
+        carries = [net.carry_in] + self.generate
+        net.sums = [net.gate(_XOR, p_i, carry) for p_i, carry in zip(p, carries)]
+        net.carry_out = carries[-1]
+
+
+def build_kogge_stone(width: int) -> Netlist:
+    """Префиксный сумматор Когге-Стоуна: log2(width) уровней, на каждом уровне все узлы"""
+    net = Netlist(width)
+    p, g = _propagate_generate(net)
+    prefix = _Prefix(net, p, g)
+    distance = 1
+    while distance < width:
+        # Обход сверху вниз: узел i - distance ещё хранит значение предыдущего уровня
+        for i in range(width - 1, distance - 1, -1):
+            prefix.combine(i, i - distance)
+        distance *= 2
+    prefix.finish(p)
+    return net
+
+
+def build_brent_kung(width: int) -> Netlist:
+    """Префиксный сумматор Брента-Кунга: дерево свёртки и обратное дерево, около 2 * width узлов"""
+    net = Netlist(width)
+    p, g = _propagate_generate(net)
+    prefix = _Prefix(net, p, g)
+    distance = 1
+    while distance < width:
+        for i in range(2 * distance - 1, width, 2 * distance):
+            prefix.combine(i, i - distance)
+        distance *= 2
+    distance //= 2
+    while distance >= 1:
+        for i in range(3 * distance - 1, width, 2 * distance):
+            prefix.combine(i, i - distance)
+        distance //= 2
+    prefix.finish(p)
+    return net
+
+
+ARCHITECTURES = {
+    'ripple': build_ripple,
+    'carry_lookahead': build_carry_lookahead,
+    'carry_select': build_carry_select,
+    'kogge_stone': build_kogge_stone,
+    'brent_kung': build_brent_kung,
+}
+
+
+@lru_cache(maxsize=None)
+def netlist(architecture: str, width: int) -> Netlist:
+    if architecture not in ARCHITECTURES:
+        raise ValueError(f"Неизвестная архитектура сумматора: {architecture}")
+    if width < 1:
+        raise ValueError("Разрядность должна быть положительной")
+    return ARCHITECTURES[architecture](width)
+
+
+def cost(architecture: str, width: int) -> AdderCost:
+    """Логическая глубина и число вентилей сумматора"""
+    return netlist(architecture, width).cost
+
+
+def add_batch(values1: list[int], values2: list[int], width: int = 32, architecture: str = 'ripple',
+              carry_in: int = 0) -> list[AdderResult]:
+    """Складывает пары слов одной схемой, по паре на битовую дорожку"""
+    if len(values1) != len(values2):
+        raise ValueError("Списки операндов должны иметь одинаковую длину")
+    net = netlist(architecture, width)
+    lanes = len(values1)
+    all_lanes = mask(lanes)
+    values = net.evaluate(transpose(values1, width), transpose(values2, width),
+                          all_lanes if carry_in else 0, all_lanes)
+    sums = untranspose([values[wire] for wire in net.sums], lanes)
+    carries = values[net.carry_out]
+    word_mask, sign = word_params(width)
+    results = []
+    for lane, (word1, word2, total) in enumerate(zip(values1, values2, sums)):
+        word1, word2 = word1 & word_mask, word2 & word_mask
+        overflow = 1 if ~(word1 ^ word2) & (word1 ^ total) & sign else 0
+        results.append(AdderResult(total, (carries >> lane) & 1, overflow))
+    return results
+
+
+def add(a: int, b: int, width: int = 32, architecture: str = 'ripple', carry_in: int = 0) -> AdderResult:
+    """Складывает два слова разрядности width выбранной схемой"""
+    return add_batch([a], [b], width, architecture, carry_in)[0]
+
+
+def trace_stats(pairs: list[tuple[int, int]], width: int, architectures: list[str] | None = None) -> list[TraceStats]:
+    """Сравнивает схемы на трассе операндов: статические глубина и площадь и фактическая задержка"""
+    stats = []
+    for architecture in architectures or list(ARCHITECTURES):
+        net = netlist(architecture, width)
+        word_mask = mask(width)
+        delays = [net.settle_time(a & word_mask, b & word_mask) for a, b in pairs]
+        depth, gates = net.cost
+        stats.append(TraceStats(architecture, width, depth, gates,
+                                sum(delays) / len(delays) if delays else 0.0, max(delays, default=0)))
+    return stats
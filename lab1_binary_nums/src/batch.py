@@ -0,0 +1,138 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from src.bitops import word_params
+
+
+class BatchResult(NamedTuple):
+    bits: np.ndarray # матрица (N, width) из uint8, старший бит первым
+    decimal: np.ndarray # десятичные значения результатов (int64)
+    overflow: np.ndarray # флаги переполнения (bool)
+
+
+def _check_width(width: int) -> None:
+    if not 1 <= width <= 64:
+        raise ValueError("Пакетный режим поддерживает разрядность от 1 до 64 бит")
+
+
+def bits_to_words(bits: np.ndarray) -> np.ndarray:
+    """Переводит матрицу бит (N, width) в массив слов uint64"""
+    bits = np.asarray(bits)
+    if bits.ndim != 2:
+        raise ValueError("Ожидается матрица бит формы (N, width)")
+    _check_width(bits.shape[1])
+    if np.any((bits != 0) & (bits != 1)):
+        raise ValueError("Матрица бит должна состоять только из 0 и 1")
+    words = np.zeros(bits.shape[0], dtype=np.uint64)
+    for column in bits.T:
+        words = (words << np.uint64(1)) | column.astype(np.uint64)
+    return words
+
+
+def words_to_bits(words: np.ndarray, width: int) -> np.ndarray:
+    """Переводит массив слов uint64 в матрицу бит (N, width), старший бит первым"""
+    _check_width(width)
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    return ((words[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+
+
+def words_to_decimal(words: np.ndarray, width: int) -> np.ndarray:
+    """Интерпретирует слова как числа в дополнительном коде"""
+    _check_width(width)
+    if width == 64:
+        return words.view(np.int64)
+    signed = words.astype(np.int64)
+    negative = (words >> np.uint64(width - 1)) & np.uint64(1)
+    return signed - (negative.astype(np.int64) << width)
+
+
+def to_words(operands, width: int = 32) -> np.ndarray:
+    """
+    Приводит операнды к словам дополнительного кода разрядности width.
+    Принимает одномерный массив целых или матрицу бит (N, width) из uint8.
+    """
+    _check_width(width)
+    operands = np.asarray(operands)
+    if operands.ndim == 2:
+        if operands.shape[1] != width:
+            raise ValueError("Число столбцов матрицы бит должно совпадать с разрядностью")
+        return bits_to_words(operands)
+    if operands.ndim != 1:
+        raise ValueError("Ожидается одномерный массив чисел или матрица бит")
+
+    # Диапазон проверяется до приведения к int64: иначе большие числа Python
+    # вызывают OverflowError, а uint64 от 2^63 молча заворачиваются в отрицательные
+    if operands.dtype == object:
+        if not all(isinstance(value, (int, np.integer)) and not isinstance(value, bool) for value in operands):
+            raise ValueError("Операнды должны быть целыми числами")
+    elif operands.dtype.kind not in 'iu':
+        raise ValueError("Операнды должны быть целыми числами")
+    word_mask, sign = word_params(width)
+    if np.any(operands < -sign) or np.any(operands >= sign):
+        raise ValueError("Операнд не помещается в заданную разрядность")
+    if operands.dtype == object:
+        return (operands & word_mask).astype(np.uint64)
+    return operands.astype(np.int64).view(np.uint64) & np.uint64(word_mask)
+
+
+def _prepare(operands1, operands2, width: int) -> tuple[np.ndarray, np.ndarray]:
+    words1 = to_words(operands1, width)
+    words2 = to_words(operands2, width)
+    if words1.shape != words2.shape:
+        raise ValueError("Массивы операндов должны иметь одинаковую длину")
+    return words1, words2
+
+
+def _sign_bits(words: np.ndarray, width: int) -> np.ndarray:
+    return ((words >> np.uint64(width - 1)) & np.uint64(1)).astype(bool)
+
+
+def _result(words: np.ndarray, width: int, overflow: np.ndarray) -> BatchResult:
+    return BatchResult(words_to_bits(words, width), words_to_decimal(words, width), overflow)
+
+
+def batch_sum(operands1, operands2, width: int = 32) -> BatchResult:
+    """Пакетный аналог sum_in_compl_code: сложение в дополнительном коде"""
+    words1, words2 = _prepare(operands1, operands2, width)
+    word_mask = np.uint64(word_params(width)[0])
+    result = (words1 + words2) & word_mask
+    sign1, sign2 = _sign_bits(words1, width), _sign_bits(words2, width)
+    overflow = (sign1 == sign2) & (sign1 != _sign_bits(result, width))
+    return _result(result, width, overflow)
+
+
+def batch_subtraction(operands1, operands2, width: int = 32) -> BatchResult:
+    """Пакетный аналог subtraction: прибавление дополнительного кода вычитаемого с обратным знаком"""
+    words1, words2 = _prepare(operands1, operands2, width)
+    word_mask = np.uint64(word_params(width)[0])
+    negated = (~words2 + np.uint64(1)) & word_mask
+    result = (words1 + negated) & word_mask
+    sign1, sign2 = _sign_bits(words1, width), _sign_bits(words2, width)
+    overflow = (sign1 != sign2) & (sign1 != _sign_bits(result, width))
+    return _result(result, width, overflow)
+
+
+def batch_multiplication(operands1, operands2, width: int = 32) -> BatchResult:
+    """
+    Пакетный аналог multiplication: модули перемножаются, от произведения
+    остаются младшие разряды слова, а старший бит заменяется знаком.
+    Результат в прямом коде.
+    """
+    words1, words2 = _prepare(operands1, operands2, width)
+    word_mask, sign = word_params(width)
+    sign1, sign2 = _sign_bits(words1, width), _sign_bits(words2, width)
+    magnitude1 = np.where(sign1, (~words1 + np.uint64(1)) & np.uint64(word_mask), words1)
+    magnitude2 = np.where(sign2, (~words2 + np.uint64(1)) & np.uint64(word_mask), words2)
+
+    product = magnitude1 * magnitude2 # младшие 64 бита произведения
+    nonzero = np.where(magnitude1 == 0, np.uint64(1), magnitude1)
+    wrapped = (magnitude1 != 0) & (product // nonzero != magnitude2)
+    overflow = wrapped | (product >= np.uint64(sign))
+
+    result_sign = (sign1 != sign2).astype(np.uint64) << np.uint64(width - 1)
+    result = (product & np.uint64(sign - 1)) | result_sign
+    bits = words_to_bits(result, width)
+    decimal = (result & np.uint64(sign - 1)).astype(np.int64)
+    decimal = np.where(sign1 != sign2, -decimal, decimal)
+    return BatchResult(bits, decimal, overflow)
@@ -1,76 +1,116 @@
+from src.bitops import mask, int_to_bits, fits_in
+
+
 class BinaryNumber:
+    """
+    Целое число и его прямой, обратный и дополнительный коды.
+    Коды вычисляются лениво при первом обращении и кэшируются;
+    кэш сбрасывается сменой знака или разрядности.
+    """
 
-    def __init__(self, decimal_num: int) -> None:
+    def __init__(self, decimal_num: int, bits: int = 32) -> None:
+        if bits < 1:
+            raise ValueError("Разрядность должна быть положительной")
         self._decimal_num = decimal_num
-        self._sign_bit: list[int] = [0]
-        self._binary_num: list[int] = [] # прямой код
-        self._reverse_code: list[int] = [] # обратный код
-        self._compl_code: list[int] = [] # дополнительный код
+        self._bits = bits # разрядность слова
+        self._sign_bit: list[int] | None = None # None - знак определяется по значению
+        self._binary_num: list[int] | None = None # прямой код
+        self._reverse_code: list[int] | None = None # обратный код
+        self._compl_code: list[int] | None = None # дополнительный код
 
 
     @property
     def decimal_num(self) -> int:
         return self._decimal_num
 
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    @property
+    def overflow(self) -> bool:
+        """Не помещается ли число в дополнительный код текущей разрядности"""
+        return not fits_in(self._decimal_num, self._bits)
+
     @property
     def sign_bit(self) -> list[int]:
+        if self._sign_bit is None:
+            return [1] if self._decimal_num < 0 else [0]
         return self._sign_bit
     
     @property
     def binary_num(self) -> list[int]:
+        if self._binary_num is None:
+            self.dec_to_bin()
         return self._binary_num
     
     @property
     def reverse_code(self) -> list[int]:
+        if self._reverse_code is None:
+            self.bin_to_reverse_code()
         return self._reverse_code
     
     @property
     def compl_code(self) -> list[int]:
+        if self._compl_code is None:
+            self.rev_code_to_compl_code()
         return self._compl_code
+
+    def _invalidate_codes(self) -> None:
+        """Сбрасывает кэш всех кодов"""
+        self._binary_num = None
+        self._reverse_code = None
+        self._compl_code = None
     
     def negation_of_decimal_num(self):
         """Меняет знак числа на противоположный"""
+        self._sign_bit = [1] if self.sign_bit == [0] else [0]
         self._decimal_num = -self._decimal_num
-        if self._sign_bit == [0]:
-            self._sign_bit = [1]
-        elif self._sign_bit == [1]:
-            self._sign_bit = [0]
+        self._invalidate_codes()
 
-        self._binary_num = []
-        self._reverse_code = []
-        self._compl_code = []
+    def negated(self) -> 'BinaryNumber':
+        """Возвращает новое число с противоположным знаком, не изменяя текущее"""
+        result = type(self)(-self._decimal_num, self._bits)
+        result._sign_bit = [1] if self.sign_bit == [0] else [0]
+        return result
 
-    def dec_to_bin(self, bits = 32) -> list[int]:
-        """Перевод десятичного целого числа в двоичный вид как массив бит"""
-        self._binary_num = []
+    def dec_to_bin(self, bits = None) -> list[int]:
+        """
+        Перевод десятичного целого числа в двоичный вид как массив бит.
+        Заданная разрядность запоминается и используется остальными кодами.
+        """
+        if bits is None:
+            bits = self._bits
+        if self._binary_num is not None and bits == self._bits:
+            return self._binary_num
+        self._invalidate_codes()
+        self._bits = bits
         if self._decimal_num == 0:
             self._binary_num = [0] * bits
             self._sign_bit = [0]
             return self._binary_num
 
-        result = []
         n = self._decimal_num
 
         if self._decimal_num < 0:
-            self._binary_num = [1]
             n *= -1
             self._sign_bit = [1]
 
-        while n > 0:
-            result.insert(0, n % 2)
-            n //= 2
-        self._binary_num = [0] * (bits - len(result)) + result
+        self._binary_num = int_to_bits(n, bits)
 
         return self._binary_num
 
     def bin_to_reverse_code(self) -> list[int]:
         """Перевод бинарного числа в обратный код"""
-        self._reverse_code = []
-        if self._sign_bit == [0]:
-            self._reverse_code = self._binary_num
+        if self._reverse_code is not None:
+            return self._reverse_code
+        binary_num = self.binary_num
+        if self.sign_bit == [0]:
+            self._reverse_code = binary_num
             return self._reverse_code
         
-        for n in self._binary_num:
+        self._reverse_code = []
+        for n in binary_num:
             if n == 0:
                 self._reverse_code.append(1)
             else:
@@ -80,20 +120,271 @@ class BinaryNumber:
 
     def rev_code_to_compl_code(self) -> list[int]:
         """Перевод обратного кода в дополнительный"""
-        self._compl_code = []
-        if self._sign_bit == [0]:
-            self._compl_code = self._binary_num
+        if self._compl_code is not None:
+            return self._compl_code
+        if self.sign_bit == [0]:
+            self._compl_code = self.binary_num
             return self._compl_code
         
+        compl_code = []
         overflow = 0
-        one = [1] + [0] * 31
-        rev_num = self._reverse_code[::-1]
+        one = [1] + [0] * (self._bits - 1)
+        rev_num = self.reverse_code[::-1]
 
         for buff in zip(one, rev_num):
             value = buff[0] + buff[1] + overflow
             overflow = value // 2
-            self._compl_code.append(value % 2)
+            compl_code.append(value % 2)
         
-        self._compl_code = self._compl_code[::-1]
+        self._compl_code = compl_code[::-1]
+
+        return self._compl_code
+
+
+class PackedBinaryNumber(BinaryNumber):
+    """
+    Вариант BinaryNumber, который хранит прямой, обратный и дополнительный коды
+    как целые числа, маскированные по ширине слова.
+    Списки бит строятся только при обращении к соответствующим свойствам.
+    """
+
+    def __init__(self, decimal_num: int, bits: int = 32) -> None:
+        super().__init__(decimal_num, bits)
+        # None - код ещё не вычислен
+        self._binary_int: int | None = None
+        self._reverse_int: int | None = None
+        self._compl_int: int | None = None
+        self._binary_len = 0
+        self._reverse_len = 0
+        self._compl_len = 0
 
-        return self._compl_code
\ No newline at end of file
+    @property
+    def binary_num(self) -> list[int]:
+        if self._binary_num is None:
+            self._binary_num = int_to_bits(self.binary_int, self._binary_len)
+        return self._binary_num
+
+    @property
+    def reverse_code(self) -> list[int]:
+        if self._reverse_code is None:
+            self._reverse_code = int_to_bits(self.reverse_int, self._reverse_len)
+        return self._reverse_code
+
+    @property
+    def compl_code(self) -> list[int]:
+        if self._compl_code is None:
+            self._compl_code = int_to_bits(self.compl_int, self._compl_len)
+        return self._compl_code
+
+    @property
+    def binary_int(self) -> int:
+        if self._binary_int is None:
+            self.pack_dec_to_bin()
+        return self._binary_int
+
+    @property
+    def reverse_int(self) -> int:
+        if self._reverse_int is None:
+            self.pack_reverse_code()
+        return self._reverse_int
+
+    @property
+    def compl_int(self) -> int:
+        if self._compl_int is None:
+            self.pack_compl_code()
+        return self._compl_int
+
+    def _invalidate_codes(self) -> None:
+        super()._invalidate_codes()
+        self._binary_int = None
+        self._reverse_int = None
+        self._compl_int = None
+
+    def pack_dec_to_bin(self, bits = None) -> int:
+        """Строит прямой код (модуль числа) как целое без построения списка"""
+        if bits is None:
+            bits = self._bits
+        if self._binary_int is not None and bits == self._bits:
+            return self._binary_int
+        self._invalidate_codes()
+        self._bits = bits
+        magnitude = self._decimal_num
+        if magnitude == 0:
+            self._sign_bit = [0]
+        elif magnitude < 0:
+            magnitude = -magnitude
+            self._sign_bit = [1]
+
+        self._binary_int = magnitude
+        self._binary_len = max(bits, magnitude.bit_length())
+        return self._binary_int
+
+    def pack_reverse_code(self) -> int:
+        """Строит обратный код как целое инверсией бит прямого кода"""
+        if self._reverse_int is not None:
+            return self._reverse_int
+        binary_int = self.binary_int
+        self._reverse_len = self._binary_len
+        if self.sign_bit == [0]:
+            self._reverse_int = binary_int
+        else:
+            self._reverse_int = ~binary_int & mask(self._binary_len)
+        return self._reverse_int
+
+    def pack_compl_code(self) -> int:
+        """Строит дополнительный код как целое прибавлением единицы к обратному"""
+        if self._compl_int is not None:
+            return self._compl_int
+        if self.sign_bit == [0]:
+            self._compl_int = self.binary_int
+            self._compl_len = self._binary_len
+        else:
+            reverse_int = self.reverse_int
+            width = min(self._bits, self._reverse_len)
+            word_mask = mask(width)
+            self._compl_int = ((reverse_int & word_mask) + 1) & word_mask
+            self._compl_len = width
+        return self._compl_int
+
+    def convert_packed(self, bits = None) -> None:
+        """Строит все три кода без материализации списков бит"""
+        self.pack_dec_to_bin(bits)
+        self.pack_reverse_code()
+        self.pack_compl_code()
+
+    def dec_to_bin(self, bits = None) -> list[int]:
+        """Перевод десятичного целого числа в двоичный вид как массив бит"""
+        self.pack_dec_to_bin(bits)
+        return self.binary_num
+
+    def bin_to_reverse_code(self) -> list[int]:
+        """Перевод бинарного числа в обратный код"""
+        self.pack_reverse_code()
+        return self.reverse_code
+
+    def rev_code_to_compl_code(self) -> list[int]:
+        """Перевод обратного кода в дополнительный"""
+        self.pack_compl_code()
+        return self.compl_code
+
+
+# Кэш интернированных экземпляров FrozenBinaryNumber по ключу (класс, значение, разрядность)
+_INTERNED: dict[tuple[type, int, int], 'FrozenBinaryNumber'] = {}
+
+
+class FrozenBinaryNumber:
+    """
+    Неизменяемый и хэшируемый вариант BinaryNumber без __dict__.
+    Хранит только значение и разрядность, коды строятся из них при обращении.
+    Малые значения интернируются: одинаковые операнды разделяют один экземпляр.
+    """
+
+    __slots__ = ('_decimal_num', '_bits', '_compl_int')
+
+    INTERN_MIN = -1024
+    INTERN_MAX = 1023
+
+    def __new__(cls, decimal_num: int, bits: int = 32) -> 'FrozenBinaryNumber':
+        interned = cls.INTERN_MIN <= decimal_num <= cls.INTERN_MAX
+        if interned:
+            cached = _INTERNED.get((cls, decimal_num, bits))
+            if cached is not None:
+                return cached
+        if bits < 1:
+            raise ValueError("Разрядность должна быть положительной")
+
+        self = object.__new__(cls)
+        object.__setattr__(self, '_decimal_num', decimal_num)
+        object.__setattr__(self, '_bits', bits)
+        object.__setattr__(self, '_compl_int', decimal_num & mask(bits))
+        if interned:
+            _INTERNED[(cls, decimal_num, bits)] = self
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenBinaryNumber неизменяем")
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenBinaryNumber неизменяем")
+
+    def __reduce__(self):
+        return type(self), (self._decimal_num, self._bits)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrozenBinaryNumber):
+            return NotImplemented
+        return self._decimal_num == other._decimal_num and self._bits == other._bits
+
+    def __hash__(self) -> int:
+        return hash((self._decimal_num, self._bits))
+
+    def __repr__(self) -> str:
+        return f'FrozenBinaryNumber({self._decimal_num}, bits={self._bits})'
+
+    @property
+    def decimal_num(self) -> int:
+        return self._decimal_num
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    @property
+    def overflow(self) -> bool:
+        """Не помещается ли число в дополнительный код текущей разрядности"""
+        return not fits_in(self._decimal_num, self._bits)
+
+    @property
+    def sign_bit(self) -> list[int]:
+        return [1] if self._decimal_num < 0 else [0]
+
+    @property
+    def binary_int(self) -> int:
+        return abs(self._decimal_num)
+
+    @property
+    def reverse_int(self) -> int:
+        if self._decimal_num >= 0:
+            return self._decimal_num
+        return ~(-self._decimal_num) & mask(self._binary_len())
+
+    @property
+    def compl_int(self) -> int:
+        """Слово дополнительного кода, усечённое до разрядности и при переполнении"""
+        return self._compl_int
+
+    @property
+    def binary_num(self) -> list[int]:
+        return int_to_bits(self.binary_int, self._binary_len())
+
+    @property
+    def reverse_code(self) -> list[int]:
+        return int_to_bits(self.reverse_int, self._binary_len())
+
+    @property
+    def compl_code(self) -> list[int]:
+        if self._decimal_num >= 0:
+            return self.binary_num
+        return int_to_bits(self._compl_int, self._bits)
+
+    def _binary_len(self, bits: int | None = None) -> int:
+        return max(self._bits if bits is None else bits, abs(self._decimal_num).bit_length())
+
+    def negation_of_decimal_num(self):
+        raise TypeError("FrozenBinaryNumber неизменяем, используйте negated()")
+
+    def negated(self) -> 'FrozenBinaryNumber':
+        """Возвращает число с противоположным знаком"""
+        return type(self)(-self._decimal_num, self._bits)
+
+    def dec_to_bin(self, bits = None) -> list[int]:
+        """Прямой код; для другой разрядности строится новый список без изменения числа"""
+        return int_to_bits(self.binary_int, self._binary_len(bits))
+
+    def bin_to_reverse_code(self) -> list[int]:
+        """Перевод бинарного числа в обратный код"""
+        return self.reverse_code
+
+    def rev_code_to_compl_code(self) -> list[int]:
+        """Перевод обратного кода в дополнительный"""
+        return self.compl_code
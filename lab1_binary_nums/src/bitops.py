@@ -0,0 +1,74 @@
+# Таблицы побайтового перевода строятся один раз при импорте:
+# байт -> кортеж из 8 бит (старший первым) и бит 0/1 -> ASCII-цифра для int(..., 2)
+_BYTE_TO_BITS = tuple(tuple((byte >> (7 - i)) & 1 for i in range(8)) for byte in range(256))
+_BIT_TO_DIGIT = bytes.maketrans(b'\x00\x01', b'01')
+
+
+def mask(width: int) -> int:
+    """Маска из width младших единичных бит"""
+    return (1 << width) - 1
+
+
+def int_to_bits(value: int, length: int) -> list[int]:
+    """
+    Переводит неотрицательное целое в список бит (старший бит первым) по байту за шаг.
+    Список дополняется нулями слева до length, но не обрезается.
+    """
+    if value == 0:
+        return [0] * length
+    bit_length = value.bit_length()
+    byte_count = (bit_length + 7) >> 3
+    result = []
+    extend = result.extend
+    for byte in value.to_bytes(byte_count, 'big'):
+        extend(_BYTE_TO_BITS[byte])
+    start = 8 * byte_count - max(length, bit_length)
+    return result[start:] if start >= 0 else [0] * -start + result
+
+
+def bits_to_int(bits) -> int:
+    """
+    Переводит последовательность бит (старший бит первым) в неотрицательное целое.
+    Список из 0 и 1 переводится целиком через bytes; прочие последовательности
+    (кортежи, массивы NumPy, списки с другими значениями) - поразрядно, как взвешенная сумма.
+    """
+    if type(bits) is list:
+        if not bits:
+            return 0
+        try:
+            digits = bytes(bits)
+        except (TypeError, ValueError):
+            digits = None
+        if digits is not None and not digits.translate(None, b'\x00\x01'):
+            return int(digits.translate(_BIT_TO_DIGIT), 2)
+    result = 0
+    for bit in bits:
+        result = (result << 1) + int(bit)
+    return result
+
+
+# Маски и знаковые биты стандартных разрядностей считаются один раз
+_WORD_PARAMS = {width: ((1 << width) - 1, 1 << (width - 1)) for width in (8, 16, 32, 64, 128)}
+
+
+def word_params(width: int) -> tuple[int, int]:
+    """Возвращает (маска, знаковый бит) для слова заданной разрядности"""
+    params = _WORD_PARAMS.get(width)
+    if params is None:
+        if width < 1:
+            raise ValueError("Разрядность должна быть положительной")
+        params = ((1 << width) - 1, 1 << (width - 1))
+    return params
+
+
+def to_signed(value: int, width: int) -> int:
+    """Интерпретирует младшие width бит значения как число в дополнительном коде"""
+    word_mask, sign = word_params(width)
+    value &= word_mask
+    return value - (sign << 1) if value & sign else value
+
+
+def fits_in(value: int, width: int) -> bool:
+    """Помещается ли число в дополнительный код разрядности width"""
+    sign = word_params(width)[1]
+    return -sign <= value < sign
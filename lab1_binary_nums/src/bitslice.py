@@ -0,0 +1,102 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from src.bitops import mask, to_signed, word_params
+
+
+class BitslicedResult(NamedTuple):
+    sums: list[int] # результаты по дорожкам в дополнительном коде
+    carry_out: list[int] # перенос из старшего разряда по дорожкам
+    overflow: list[int] # флаги переполнения по дорожкам
+
+
+def _bit_matrix(words: list[int], width: int) -> np.ndarray:
+    """Матрица бит (len(words), width) из неотрицательных слов, младший разряд первым"""
+    size = (width + 7) // 8
+    data = b''.join(word.to_bytes(size, 'little') for word in words)
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(len(words), size)
+    return np.unpackbits(rows, axis=1, bitorder='little')[:, :width]
+
+
+def _pack_rows(bits: np.ndarray) -> list[int]:
+    """Собирает каждую строку матрицы бит в число, младший разряд первым"""
+    packed = np.packbits(bits, axis=1, bitorder='little')
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+
+def transpose(words: list[int], width: int) -> list[int]:
+    """
+    Транспонирует пачку слов: i-й срез содержит i-й бит каждого слова,
+    бит k среза принадлежит дорожке k. Срезы идут от младшего разряда.
+    """
+    if not words:
+        return [0] * width
+    word_mask = word_params(width)[0]
+    return _pack_rows(_bit_matrix([word & word_mask for word in words], width).T)
+
+
+def untranspose(slices: list[int], lanes: int) -> list[int]:
+    """Обратное преобразование: собирает слова дорожек из битовых срезов"""
+    if lanes == 0:
+        return []
+    all_lanes = mask(lanes)
+    return _pack_rows(_bit_matrix([bit_slice & all_lanes for bit_slice in slices], lanes).T)
+
+
+def ripple_carry_slices(slices1: list[int], slices2: list[int], carry_in: int = 0) -> tuple[list[int], int, int]:
+    """
+    Сумматор с последовательным переносом над битовыми срезами.
+    Уравнения полного сумматора вычисляются один раз на разряд сразу для всех дорожек.
+    Возвращает (срезы суммы, срез переноса из старшего разряда, срез переполнения).
+    """
+    carry = carry_in
+    carry_into_msb = carry_in
+    sum_slices = []
+    for a, b in zip(slices1, slices2):
+        half = a ^ b
+        sum_slices.append(half ^ carry)
+        carry_into_msb = carry
+        carry = (a & b) | (carry & half)
+    return sum_slices, carry, carry ^ carry_into_msb
+
+
+def _lane_flags(flag_slice: int, lanes: int) -> list[int]:
+    return [(flag_slice >> lane) & 1 for lane in range(lanes)]
+
+
+def _result(sum_slices: list[int], carry: int, overflow: int, lanes: int, width: int) -> BitslicedResult:
+    sums = [to_signed(word, width) for word in untranspose(sum_slices, lanes)]
+    return BitslicedResult(sums, _lane_flags(carry, lanes), _lane_flags(overflow, lanes))
+
+
+def bitsliced_add(values1: list[int], values2: list[int], width: int = 32) -> BitslicedResult:
+    """Складывает пары чисел в дополнительном коде, по одной паре на дорожку"""
+    if len(values1) != len(values2):
+        raise ValueError("Списки операндов должны иметь одинаковую длину")
+    lanes = len(values1)
+    sum_slices, carry, overflow = ripple_carry_slices(transpose(values1, width), transpose(values2, width))
+    return _result(sum_slices, carry, overflow, lanes, width)
+
+
+def bitsliced_subtraction(values1: list[int], values2: list[int], width: int = 32) -> BitslicedResult:
+    """Вычитает пары чисел: a + обратный код b + 1 (входной перенос во всех дорожках)"""
+    if len(values1) != len(values2):
+        raise ValueError("Списки операндов должны иметь одинаковую длину")
+    lanes = len(values1)
+    all_lanes = mask(lanes)
+    inverted = [bit_slice ^ all_lanes for bit_slice in transpose(values2, width)]
+    sum_slices, carry, overflow = ripple_carry_slices(transpose(values1, width), inverted, all_lanes)
+    return _result(sum_slices, carry, overflow, lanes, width)
+
+
+def bitsliced_negate(values: list[int], width: int = 32) -> BitslicedResult:
+    """
+    Аналог rev_code_to_compl_code для пачки чисел: инверсия всех бит
+    и прибавление единицы через тот же сумматор.
+    """
+    lanes = len(values)
+    all_lanes = mask(lanes)
+    inverted = [bit_slice ^ all_lanes for bit_slice in transpose(values, width)]
+    sum_slices, carry, overflow = ripple_carry_slices(inverted, [0] * width, all_lanes)
+    return _result(sum_slices, carry, overflow, lanes, width)
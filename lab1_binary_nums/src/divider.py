@@ -0,0 +1,121 @@
+from fractions import Fraction
+from typing import NamedTuple
+
+from src.bitops import int_to_bits, mask
+
+
+class Quotient(NamedTuple):
+    magnitude: int # модуль частного, масштабированный на 2 ** frac_bits
+    remainder: int # масштабированное делимое минус делитель, умноженный на модуль частного
+    frac_bits: int # число дробных бит
+    sign: int # 0 (положительное) или 1 (отрицательное), как в utils.division
+
+    @property
+    def value(self) -> int:
+        """Частное со знаком в формате с фиксированной точкой"""
+        return -self.magnitude if self.sign else self.magnitude
+
+    def to_fraction(self) -> Fraction:
+        return Fraction(self.value, 1 << self.frac_bits)
+
+    def to_bit_list(self) -> tuple[list, int]:
+        """Представление в формате utils.division: ([целая часть, None, дробная часть], знак)"""
+        integer_part = self.magnitude >> self.frac_bits
+        integer_bits = int_to_bits(integer_part, 1) if integer_part else [0]
+        fraction_bits = int_to_bits(self.magnitude & mask(self.frac_bits), self.frac_bits)
+        return integer_bits + [None] + fraction_bits, self.sign
+
+
+def _quotient_length(dividend: int, divisor: int) -> int:
+    """Число бит частного: делимое меньше divisor * 2 ** length"""
+    return max(0, dividend.bit_length() - divisor.bit_length() + 1)
+
+
+def restoring_divide(dividend: int, divisor: int) -> tuple[int, int]:
+    """Деление с восстановлением остатка: пробное вычитание в каждом разряде"""
+    remainder = dividend
+    quotient = 0
+    for j in range(_quotient_length(dividend, divisor) - 1, -1, -1):
+        remainder -= divisor << j
+        if remainder < 0:
+            remainder += divisor << j # восстановление
+        else:
+            quotient |= 1 << j
+    return quotient, remainder
+
+
+def non_restoring_divide(dividend: int, divisor: int) -> tuple[int, int]:
+    """
+    Деление без восстановления остатка: знак остатка определяет,
+    вычитать или прибавлять делитель на следующем шаге.
+    Остаток корректируется один раз в конце.
+    """
+    remainder = dividend
+    quotient = 0
+    length = _quotient_length(dividend, divisor)
+    for j in range(length - 1, -1, -1):
+        if remainder >= 0:
+            remainder -= divisor << j
+        else:
+            remainder += divisor << j
+        if remainder >= 0:
+            quotient |= 1 << j
+    if remainder < 0:
+        remainder += divisor
+    return quotient, remainder
+
+
+def srt_divide(dividend: int, divisor: int) -> tuple[int, int]:
+    """
+    SRT-деление по основанию 2 с цифрами частного {-1, 0, 1}.
+    Цифра выбирается сравнением остатка с половиной нормализованного диапазона
+    делителя, поэтому полное сравнение с делителем не нужно.
+    """
+    remainder = dividend
+    positive = 0
+    negative = 0
+    half_range = 1 << (divisor.bit_length() - 1)
+    for j in range(_quotient_length(dividend, divisor) - 1, -1, -1):
+        threshold = half_range << j
+        if remainder >= threshold:
+            remainder -= divisor << j
+            positive |= 1 << j
+        elif remainder < -threshold:
+            remainder += divisor << j
+            negative |= 1 << j
+    quotient = positive - negative # перевод из избыточной формы
+    if remainder < 0:
+        quotient -= 1
+        remainder += divisor
+    return quotient, remainder
+
+
+DIVIDERS = {
+    'restoring': restoring_divide,
+    'non_restoring': non_restoring_divide,
+    'srt': srt_divide,
+}
+
+
+def divide(dividend: int, divisor: int, frac_bits: int = 5, method: str = 'restoring', rounding: bool = False) -> Quotient:
+    """
+    Делит два целых числа, получая frac_bits бит дробной части.
+    Без округления дробная часть отбрасывается (как в utils.division),
+    с округлением частное округляется к ближайшему, при равенстве — к чётному.
+    """
+    if method not in DIVIDERS:
+        raise ValueError(f"Неизвестный метод деления: {method}")
+    if frac_bits < 0:
+        raise ValueError("Число дробных бит не может быть отрицательным")
+    if divisor == 0:
+        raise ValueError("Деление на ноль невозможно")
+
+    sign = 0 if (dividend < 0) == (divisor < 0) else 1
+    divisor = abs(divisor)
+    quotient, remainder = DIVIDERS[method](abs(dividend) << frac_bits, divisor)
+    if rounding:
+        doubled = remainder << 1
+        if doubled > divisor or (doubled == divisor and quotient & 1):
+            quotient += 1
+            remainder -= divisor
+    return Quotient(quotient, remainder, frac_bits, sign)
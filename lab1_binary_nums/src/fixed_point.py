@@ -0,0 +1,229 @@
+import re
+from fractions import Fraction
+from typing import NamedTuple
+
+from src.bitops import bits_to_int, int_to_bits, mask
+
+# Режимы округления при отбрасывании дробных разрядов
+ROUND_FLOOR = 'floor' # арифметический сдвиг вправо
+ROUND_TOWARD_ZERO = 'toward_zero'
+ROUND_HALF_UP = 'half_up' # прибавить половину младшего разряда и сдвинуть
+ROUND_NEAREST_EVEN = 'nearest_even'
+ROUNDING_MODES = (ROUND_FLOOR, ROUND_TOWARD_ZERO, ROUND_HALF_UP, ROUND_NEAREST_EVEN)
+
+# Поведение при выходе за диапазон формата
+OVERFLOW_SATURATE = 'saturate'
+OVERFLOW_WRAP = 'wrap'
+OVERFLOW_ERROR = 'error'
+OVERFLOW_MODES = (OVERFLOW_SATURATE, OVERFLOW_WRAP, OVERFLOW_ERROR)
+
+_FORMAT_RE = re.compile(r'(U?)Q(\d+)\.(\d+)')
+
+
+class QFormat(NamedTuple):
+    int_bits: int # целые разряды без знакового
+    frac_bits: int
+    signed: bool = True
+
+    @property
+    def width(self) -> int:
+        return self.int_bits + self.frac_bits + (1 if self.signed else 0)
+
+    @property
+    def min_raw(self) -> int:
+        return -(1 << (self.width - 1)) if self.signed else 0
+
+    @property
+    def max_raw(self) -> int:
+        return (1 << (self.width - 1 if self.signed else self.width)) - 1
+
+    def __str__(self) -> str:
+        return f"{'' if self.signed else 'U'}Q{self.int_bits}.{self.frac_bits}"
+
+    @staticmethod
+    def parse(text: str) -> 'QFormat':
+        """Разбирает запись вида 'Q1.15' или 'UQ8.8'"""
+        match = _FORMAT_RE.fullmatch(text.strip())
+        if not match:
+            raise ValueError(f"Некорректный формат с фиксированной точкой: {text}")
+        return QFormat(int(match[2]), int(match[3]), not match[1])
+
+
+def _check_rounding(rounding: str) -> None:
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Неизвестный режим округления: {rounding}")
+
+
+def round_div(numerator: int, denominator: int, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    """Частное целых, округлённое выбранным способом"""
+    _check_rounding(rounding)
+    if denominator == 0:
+        raise ValueError("Деление на ноль невозможно")
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator) # частное округлено вниз, остаток неотрицателен
+    if remainder == 0 or rounding == ROUND_FLOOR:
+        return quotient
+    if rounding == ROUND_TOWARD_ZERO:
+        return quotient + 1 if numerator < 0 else quotient
+    doubled = remainder << 1
+    if rounding == ROUND_HALF_UP:
+        return quotient + 1 if doubled >= denominator else quotient
+    return quotient + 1 if doubled > denominator or (doubled == denominator and quotient & 1) else quotient
+
+
+def round_shift(value: int, shift: int, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    """Сдвигает value на shift разрядов вправо (влево при отрицательном shift) с округлением"""
+    if shift <= 0:
+        return value << -shift
+    if rounding == ROUND_FLOOR:
+        return value >> shift
+    return round_div(value, 1 << shift, rounding)
+
+
+def fit(raw: int, fmt: QFormat, overflow: str = OVERFLOW_SATURATE) -> int:
+    """Приводит целое к диапазону формата: насыщение, перенос по модулю или ошибка"""
+    if fmt.min_raw <= raw <= fmt.max_raw:
+        return raw
+    if overflow == OVERFLOW_SATURATE:
+        return fmt.max_raw if raw > fmt.max_raw else fmt.min_raw
+    if overflow == OVERFLOW_WRAP:
+        raw &= mask(fmt.width)
+        return raw - (1 << fmt.width) if fmt.signed and raw > fmt.max_raw else raw
+    if overflow == OVERFLOW_ERROR:
+        raise ValueError(f"Значение не помещается в формат {fmt}")
+    raise ValueError(f"Неизвестный режим переполнения: {overflow}")
+
+
+def q_add(a: int, b: int, fmt: QFormat, overflow: str = OVERFLOW_SATURATE) -> int:
+    return fit(a + b, fmt, overflow)
+
+
+def q_sub(a: int, b: int, fmt: QFormat, overflow: str = OVERFLOW_SATURATE) -> int:
+    return fit(a - b, fmt, overflow)
+
+
+def q_mul(a: int, b: int, fmt: QFormat, rounding: str = ROUND_NEAREST_EVEN, overflow: str = OVERFLOW_SATURATE) -> int:
+    """Произведение имеет 2n дробных разрядов, лишние n отбрасываются с округлением"""
+    return fit(round_shift(a * b, fmt.frac_bits, rounding), fmt, overflow)
+
+
+def q_div(a: int, b: int, fmt: QFormat, rounding: str = ROUND_NEAREST_EVEN, overflow: str = OVERFLOW_SATURATE) -> int:
+    """Делимое расширяется на n дробных разрядов, чтобы частное осталось в формате"""
+    return fit(round_div(a << fmt.frac_bits, b, rounding), fmt, overflow)
+
+
+def q_convert(raw: int, source: QFormat, target: QFormat, rounding: str = ROUND_NEAREST_EVEN,
+              overflow: str = OVERFLOW_SATURATE) -> int:
+    """Переводит число из одного формата в другой"""
+    return fit(round_shift(raw, source.frac_bits - target.frac_bits, rounding), target, overflow)
+
+
+class FixedPoint:
+    """
+    Число с фиксированной точкой: целое raw, масштабированное на 2 ** -frac_bits.
+    Операции над числами одного формата дают число того же формата.
+    """
+    __slots__ = ('raw', 'fmt', 'rounding', 'overflow')
+
+    def __init__(self, raw: int, fmt: QFormat, rounding: str = ROUND_NEAREST_EVEN,
+                 overflow: str = OVERFLOW_SATURATE):
+        _check_rounding(rounding)
+        if overflow not in OVERFLOW_MODES:
+            raise ValueError(f"Неизвестный режим переполнения: {overflow}")
+        self.raw = fit(raw, fmt, overflow)
+        self.fmt = fmt
+        self.rounding = rounding
+        self.overflow = overflow
+
+    @staticmethod
+    def from_fraction(value, fmt: QFormat, rounding: str = ROUND_NEAREST_EVEN,
+                      overflow: str = OVERFLOW_SATURATE) -> 'FixedPoint':
+        """Строит число из int, Fraction или десятичной строки без участия float"""
+        value = Fraction(value)
+        raw = round_div(value.numerator << fmt.frac_bits, value.denominator, rounding)
+        return FixedPoint(raw, fmt, rounding, overflow)
+
+    @staticmethod
+    def from_division(result: tuple, fmt: QFormat, rounding: str = ROUND_NEAREST_EVEN,
+                      overflow: str = OVERFLOW_SATURATE) -> 'FixedPoint':
+        """Строит число из результата utils.division: ([целая часть, None, дробная часть], знак)"""
+        bits, sign = result
+        if None not in bits:
+            raise ValueError("Список должен содержать None как разделитель между целой и дробной частями")
+        separator = bits.index(None)
+        magnitude = bits_to_int(bits[:separator] + bits[separator + 1:])
+        frac_bits = len(bits) - separator - 1
+        raw = round_shift(-magnitude if sign else magnitude, frac_bits - fmt.frac_bits, rounding)
+        return FixedPoint(raw, fmt, rounding, overflow)
+
+    def to_fraction(self) -> Fraction:
+        return Fraction(self.raw, 1 << self.fmt.frac_bits)
+
+    def to_bit_list(self) -> tuple[list, int]:
+        """Представление в формате utils.division: ([целая часть, None, дробная часть], знак)"""
+        magnitude = abs(self.raw)
+        integer_part = magnitude >> self.fmt.frac_bits
+        integer_bits = int_to_bits(integer_part, 1) if integer_part else [0]
+        fraction_bits = int_to_bits(magnitude & mask(self.fmt.frac_bits), self.fmt.frac_bits)
+        return integer_bits + [None] + fraction_bits, 1 if self.raw < 0 else 0
+
+    def convert(self, fmt: QFormat) -> 'FixedPoint':
+        raw = q_convert(self.raw, self.fmt, fmt, self.rounding, self.overflow)
+        return FixedPoint(raw, fmt, self.rounding, self.overflow)
+
+    def _other_raw(self, other) -> int:
+        if isinstance(other, FixedPoint):
+            if other.fmt != self.fmt:
+                raise ValueError("Операнды должны быть в одном формате")
+            return other.raw
+        if isinstance(other, int):
+            return fit(other << self.fmt.frac_bits, self.fmt, self.overflow)
+        return NotImplemented
+
+    def _result(self, raw: int) -> 'FixedPoint':
+        return FixedPoint(raw, self.fmt, self.rounding, self.overflow)
+
+    def __add__(self, other):
+        raw = self._other_raw(other)
+        if raw is NotImplemented:
+            return raw
+        return self._result(q_add(self.raw, raw, self.fmt, self.overflow))
+
+    def __sub__(self, other):
+        raw = self._other_raw(other)
+        if raw is NotImplemented:
+            return raw
+        return self._result(q_sub(self.raw, raw, self.fmt, self.overflow))
+
+    def __mul__(self, other):
+        raw = self._other_raw(other)
+        if raw is NotImplemented:
+            return raw
+        return self._result(q_mul(self.raw, raw, self.fmt, self.rounding, self.overflow))
+
+    def __truediv__(self, other):
+        raw = self._other_raw(other)
+        if raw is NotImplemented:
+            return raw
+        return self._result(q_div(self.raw, raw, self.fmt, self.rounding, self.overflow))
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __neg__(self) -> 'FixedPoint':
+        return self._result(fit(-self.raw, self.fmt, self.overflow))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        return self.fmt == other.fmt and self.raw == other.raw
+
+    def __hash__(self) -> int:
+        return hash((self.raw, self.fmt))
+
+    def __float__(self) -> float:
+        return self.raw / (1 << self.fmt.frac_bits)
+
+    def __repr__(self) -> str:
+        return f"FixedPoint({self.to_fraction()}, {self.fmt})"
@@ -0,0 +1,113 @@
+import numpy as np
+
+from src.fixed_point import (
+    QFormat, ROUND_FLOOR, ROUND_TOWARD_ZERO, ROUND_HALF_UP, ROUND_NEAREST_EVEN,
+    OVERFLOW_SATURATE, OVERFLOW_WRAP, OVERFLOW_ERROR
+)
+
+# Произведение двух чисел и расширенное делимое должны помещаться в int64:
+# модуль значения занимает не больше MAX_WIDTH - 1 бит (Q0.31 и Q1.30 проходят, UQ0.32 - нет)
+MAX_WIDTH = 32
+
+
+def _check_format(fmt: QFormat) -> None:
+    if fmt.int_bits + fmt.frac_bits > MAX_WIDTH - 1:
+        raise ValueError(f"Пакетные операции поддерживают знаковые форматы до {MAX_WIDTH} бит "
+                         f"и беззнаковые до {MAX_WIDTH - 1}")
+
+
+def to_raw(values) -> np.ndarray:
+    """Пачка сырых целых значений в виде int64"""
+    return np.asarray(values, dtype=np.int64)
+
+
+def _operands(values, fmt: QFormat) -> np.ndarray:
+    """Сырые значения формата fmt; выход за диапазон - ошибка, а не перенос в int64"""
+    values = np.asarray(values)
+    if np.any(values < fmt.min_raw) or np.any(values > fmt.max_raw):
+        raise ValueError(f"Значение не помещается в формат {fmt}")
+    return to_raw(values)
+
+
+def round_div(numerator: np.ndarray, denominator: np.ndarray, rounding: str = ROUND_NEAREST_EVEN) -> np.ndarray:
+    """Поэлементное частное с округлением; делители должны быть ненулевыми"""
+    numerator = np.asarray(numerator, dtype=np.int64)
+    denominator = np.asarray(denominator, dtype=np.int64)
+    if np.any(denominator == 0):
+        raise ValueError("Деление на ноль невозможно")
+    negative = denominator < 0
+    numerator = np.where(negative, -numerator, numerator)
+    denominator = np.where(negative, -denominator, denominator)
+    quotient, remainder = np.divmod(numerator, denominator) # округление вниз, остаток неотрицателен
+    if rounding == ROUND_FLOOR:
+        return quotient
+    if rounding == ROUND_TOWARD_ZERO:
+        return quotient + ((remainder != 0) & (numerator < 0))
+    doubled = remainder << 1
+    if rounding == ROUND_HALF_UP:
+        return quotient + (doubled >= denominator)
+    if rounding == ROUND_NEAREST_EVEN:
+        return quotient + ((doubled > denominator) | ((doubled == denominator) & (quotient & 1 == 1)))
+    raise ValueError(f"Неизвестный режим округления: {rounding}")
+
+
+def round_shift(values: np.ndarray, shift: int, rounding: str = ROUND_NEAREST_EVEN) -> np.ndarray:
+    """Поэлементный сдвиг вправо на shift разрядов с округлением"""
+    values = np.asarray(values, dtype=np.int64)
+    if shift <= 0:
+        return values << -shift
+    if rounding == ROUND_FLOOR:
+        return values >> shift
+    half = np.int64(1 << (shift - 1))
+    if rounding == ROUND_HALF_UP:
+        return (values + half) >> shift
+    quotient = values >> shift
+    remainder = values & ((1 << shift) - 1)
+    if rounding == ROUND_TOWARD_ZERO:
+        return quotient + ((remainder != 0) & (values < 0))
+    if rounding == ROUND_NEAREST_EVEN:
+        return quotient + ((remainder > half) | ((remainder == half) & (quotient & 1 == 1)))
+    raise ValueError(f"Неизвестный режим округления: {rounding}")
+
+
+def fit(values: np.ndarray, fmt: QFormat, overflow: str = OVERFLOW_SATURATE) -> np.ndarray:
+    """Поэлементно приводит значения к диапазону формата"""
+    if overflow == OVERFLOW_SATURATE:
+        return np.clip(values, fmt.min_raw, fmt.max_raw)
+    if overflow == OVERFLOW_WRAP:
+        wrapped = values & ((1 << fmt.width) - 1)
+        if fmt.signed:
+            wrapped = np.where(wrapped > fmt.max_raw, wrapped - (1 << fmt.width), wrapped)
+        return wrapped
+    if overflow == OVERFLOW_ERROR:
+        if np.any((values < fmt.min_raw) | (values > fmt.max_raw)):
+            raise ValueError(f"Значение не помещается в формат {fmt}")
+        return values
+    raise ValueError(f"Неизвестный режим переполнения: {overflow}")
+
+
+def batch_add(a, b, fmt: QFormat, overflow: str = OVERFLOW_SATURATE) -> np.ndarray:
+    _check_format(fmt)
+    return fit(_operands(a, fmt) + _operands(b, fmt), fmt, overflow)
+
+
+def batch_sub(a, b, fmt: QFormat, overflow: str = OVERFLOW_SATURATE) -> np.ndarray:
+    _check_format(fmt)
+    return fit(_operands(a, fmt) - _operands(b, fmt), fmt, overflow)
+
+
+def batch_mul(a, b, fmt: QFormat, rounding: str = ROUND_NEAREST_EVEN, overflow: str = OVERFLOW_SATURATE) -> np.ndarray:
+    _check_format(fmt)
+    return fit(round_shift(_operands(a, fmt) * _operands(b, fmt), fmt.frac_bits, rounding), fmt, overflow)
+
+
+def batch_div(a, b, fmt: QFormat, rounding: str = ROUND_NEAREST_EVEN, overflow: str = OVERFLOW_SATURATE) -> np.ndarray:
+    _check_format(fmt)
+    return fit(round_div(_operands(a, fmt) << fmt.frac_bits, _operands(b, fmt), rounding), fmt, overflow)
+
+
+def batch_convert(values, source: QFormat, target: QFormat, rounding: str = ROUND_NEAREST_EVEN,
+                  overflow: str = OVERFLOW_SATURATE) -> np.ndarray:
+    _check_format(source)
+    _check_format(target)
+    return fit(round_shift(_operands(values, source), source.frac_bits - target.frac_bits, rounding), target, overflow)
@@ -0,0 +1,63 @@
+from fractions import Fraction
+from typing import NamedTuple
+
+from src.float_format import FloatFormat
+from src.softfloat import ROUND_NEAREST_EVEN, convert, is_inf, is_nan, to_fraction, ulp
+
+
+class Conversion(NamedTuple):
+    source: int # исходное слово
+    result: int # слово в целевом формате
+    abs_error: Fraction # модуль разности результата и исходного значения
+    rel_error: float # относительная погрешность
+    ulp_error: float # погрешность в единицах младшего разряда целевого формата
+    overflow: bool # конечное число стало бесконечностью
+    underflow: bool # ненулевое число стало нулём
+
+
+class ConversionReport(NamedTuple):
+    count: int
+    exact: int # число преобразований без потери точности
+    overflow: int
+    underflow: int
+    max_abs_error: Fraction
+    max_rel_error: float
+    max_ulp_error: float
+    mean_ulp_error: float
+
+
+def convert_with_error(word: int, source: FloatFormat, target: FloatFormat,
+                       rounding: str = ROUND_NEAREST_EVEN) -> Conversion:
+    """Переводит одно число и вычисляет погрешность округления"""
+    result = convert(word, source, target, rounding)
+    if is_nan(word, source) or is_inf(word, source):
+        return Conversion(word, result, Fraction(0), 0.0, 0.0, False, False)
+    value = to_fraction(word, source)
+    if is_inf(result, target):
+        return Conversion(word, result, Fraction(0), float('inf'), float('inf'), True, False)
+    error = abs(to_fraction(result, target) - value)
+    rel_error = float(error / abs(value)) if value else 0.0
+    underflow = value != 0 and (result & ~target.sign_mask) == 0
+    return Conversion(word, result, error, rel_error, float(error / ulp(result, target)), False, underflow)
+
+
+def convert_batch(words, source: FloatFormat, target: FloatFormat,
+                  rounding: str = ROUND_NEAREST_EVEN) -> list[Conversion]:
+    """Переводит пачку слов из формата source в формат target"""
+    return [convert_with_error(int(word), source, target, rounding) for word in words]
+
+
+def conversion_report(conversions: list[Conversion]) -> ConversionReport:
+    """Сводка погрешностей по пачке преобразований"""
+    finite = [item for item in conversions if not item.overflow]
+    ulp_errors = [item.ulp_error for item in finite]
+    return ConversionReport(
+        count=len(conversions),
+        exact=sum(1 for item in finite if item.abs_error == 0),
+        overflow=len(conversions) - len(finite),
+        underflow=sum(1 for item in conversions if item.underflow),
+        max_abs_error=max((item.abs_error for item in finite), default=Fraction(0)),
+        max_rel_error=max((item.rel_error for item in finite), default=0.0),
+        max_ulp_error=max(ulp_errors, default=0.0),
+        mean_ulp_error=sum(ulp_errors) / len(ulp_errors) if ulp_errors else 0.0,
+    )
@@ -0,0 +1,54 @@
+class FloatFormat:
+    """
+    Двоичный формат с плавающей точкой IEEE-754: exp_bits бит порядка
+    и man_bits бит мантиссы (без скрытой единицы), плюс бит знака.
+    """
+
+    def __init__(self, exp_bits: int, man_bits: int, name: str | None = None):
+        if exp_bits < 2 or man_bits < 1:
+            raise ValueError("Формат должен иметь не меньше 2 бит порядка и 1 бита мантиссы")
+        self.exp_bits = exp_bits
+        self.man_bits = man_bits
+        self.name = name or f'e{exp_bits}m{man_bits}'
+        self.width = 1 + exp_bits + man_bits
+        self.bias = (1 << (exp_bits - 1)) - 1
+        self.exp_max = (1 << exp_bits) - 1 # порядок бесконечностей и NaN
+        self.emin = 1 - self.bias # наименьший порядок нормализованных чисел
+        self.emax = self.exp_max - 1 - self.bias
+        self.sign_shift = exp_bits + man_bits
+        self.sign_mask = 1 << self.sign_shift
+        self.man_mask = (1 << man_bits) - 1
+        self.hidden_bit = 1 << man_bits
+        self.quiet_bit = 1 << (man_bits - 1)
+        self.inf = self.exp_max << man_bits
+        self.default_nan = self.inf | self.quiet_bit
+        self.max_finite = self.inf - 1
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FloatFormat):
+            return NotImplemented
+        return (self.exp_bits, self.man_bits) == (other.exp_bits, other.man_bits)
+
+    def __hash__(self) -> int:
+        return hash((self.exp_bits, self.man_bits))
+
+    def __repr__(self) -> str:
+        return f"FloatFormat({self.exp_bits}, {self.man_bits}, '{self.name}')"
+
+
+BINARY16 = FloatFormat(5, 10, 'binary16')
+BFLOAT16 = FloatFormat(8, 7, 'bfloat16')
+BINARY32 = FloatFormat(8, 23, 'binary32')
+BINARY64 = FloatFormat(11, 52, 'binary64')
+
+FORMATS = {fmt.name: fmt for fmt in (BINARY16, BFLOAT16, BINARY32, BINARY64)}
+
+
+def get_format(name: str) -> FloatFormat:
+    """Возвращает формат по имени: 'binary32' или 'eXmY' для произвольного формата"""
+    if name in FORMATS:
+        return FORMATS[name]
+    exp_bits, _, man_bits = name[1:].partition('m')
+    if not (name.startswith('e') and exp_bits.isdigit() and man_bits.isdigit()):
+        raise ValueError(f"Неизвестный формат: {name}")
+    return FloatFormat(int(exp_bits), int(man_bits))
@@ -0,0 +1,117 @@
+import re
+import struct
+from decimal import Decimal
+from fractions import Fraction
+from math import log2
+
+from src.float_format import FloatFormat, BINARY32, BINARY64
+from src.softfloat import ROUND_NEAREST_EVEN, convert, from_fraction, pack
+
+_DECIMAL_RE = re.compile(r'\s*([+-]?)(?:(\d*)(?:\.(\d*))?(?:[eE]([+-]?\d+))?|(inf|infinity)|(nan))\s*',
+                         re.IGNORECASE)
+
+_LOG2_10 = log2(10)
+
+
+def _is_midpoint(word: int, fmt: FloatFormat) -> bool:
+    """Лежит ли число binary64 ровно посередине между соседними числами формата fmt"""
+    exponent = (word >> 52) & 0x7FF
+    sig = (word & ((1 << 52) - 1)) | (1 << 52 if exponent else 0)
+    if sig == 0:
+        return False
+    exp = max(exponent, 1) - 1075
+    target_exp = max(sig.bit_length() - 1 + exp, fmt.emin) - fmt.man_bits
+    shift = target_exp - exp
+    return shift > 0 and sig & ((1 << shift) - 1) == 1 << (shift - 1)
+
+
+def _fast_path_allowed(fmt: FloatFormat, rounding: str) -> bool:
+    """
+    Двойное округление (строка -> binary64 -> fmt) безопасно для округления к ближайшему,
+    если все числа формата и середины между ними представимы в binary64.
+    """
+    return (rounding == ROUND_NEAREST_EVEN and fmt.man_bits + 2 <= 53
+            and fmt.emax <= 1023 and fmt.emin - fmt.man_bits - 1 >= -1074)
+
+
+def _significant_digits(fmt: FloatFormat) -> int:
+    """
+    Сколько значащих десятичных цифр достаточно для правильного округления:
+    середины между числами формата кратны 2 ** (emin - man_bits - 1)
+    и имеют не больше этого числа цифр.
+    """
+    return fmt.man_bits - fmt.emin + fmt.man_bits + 4
+
+
+def _from_scientific(sign: int, digits: str, exponent: int, fmt: FloatFormat, rounding: str) -> int:
+    """
+    Округляет значение (-1) ** sign * digits * 10 ** exponent. Лишние цифры
+    заменяются одной ненулевой (sticky), при огромных порядках берётся число,
+    которое округляется так же (заведомо за переполнением или ниже половины
+    наименьшего денормализованного числа), чтобы не строить 10 ** exponent.
+    """
+    digits = digits.lstrip('0')
+    if not digits:
+        return pack(sign, 0, 0, fmt)
+    limit = _significant_digits(fmt)
+    if len(digits) > limit:
+        tail = digits[limit:].rstrip('0')
+        exponent += len(digits) - limit
+        digits = digits[:limit]
+        if tail:
+            digits, exponent = digits + '1', exponent - 1
+    magnitude = (len(digits) + exponent) * _LOG2_10 # log2 значения с точностью до log2(10)
+    if magnitude - _LOG2_10 > fmt.emax + 2:
+        value = Fraction(1 << (fmt.emax + 2))
+    elif magnitude < fmt.emin - fmt.man_bits - 2:
+        value = Fraction(1, 1 << (fmt.man_bits - fmt.emin + 2))
+    elif exponent >= 0:
+        value = Fraction(int(digits) * 10 ** exponent)
+    else:
+        value = Fraction(int(digits), 10 ** -exponent)
+    return from_fraction(-value if sign else value, rounding, fmt)
+
+
+def parse_float(text: str, fmt: FloatFormat = BINARY32, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    """
+    Переводит десятичную строку в слово формата fmt с правильным округлением.
+    Быстрый путь: корректно округлённое float(text) и перевод binary64 -> fmt;
+    если результат попал на середину между числами fmt, значение
+    пересчитывается точно в целых числах.
+    """
+    match = _DECIMAL_RE.fullmatch(text)
+    if not match or not (match[2] or match[3] or match[5] or match[6]):
+        raise ValueError(f"Некорректная десятичная запись: {text!r}")
+    sign_text, integer, fraction, exponent, infinity, nan = match.groups()
+    sign = 1 if sign_text == '-' else 0
+    if nan:
+        return pack(sign, 0, 0, fmt) | fmt.default_nan
+    if infinity:
+        return pack(sign, 0, 0, fmt) | fmt.inf
+
+    if _fast_path_allowed(fmt, rounding):
+        word = struct.unpack('>Q', struct.pack('>d', float(text)))[0]
+        if not _is_midpoint(word, fmt):
+            return convert(word, BINARY64, fmt, rounding)
+
+    fraction = fraction or ''
+    return _from_scientific(sign, (integer or '') + fraction, int(exponent or 0) - len(fraction), fmt, rounding)
+
+
+def from_value(value, fmt: FloatFormat = BINARY32, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    """
+    Правильно округлённое слово формата fmt для строки, Fraction, Decimal или int.
+    """
+    if isinstance(value, str):
+        return parse_float(value, fmt, rounding)
+    if isinstance(value, Decimal):
+        if value.is_nan():
+            return fmt.default_nan
+        sign = 1 if value.is_signed() else 0
+        if value.is_infinite():
+            return pack(sign, 0, 0, fmt) | fmt.inf
+        _, digits, exponent = value.as_tuple()
+        return _from_scientific(sign, ''.join(map(str, digits)), exponent, fmt, rounding)
+    if isinstance(value, (Fraction, int)):
+        return from_fraction(Fraction(value), rounding, fmt)
+    raise TypeError(f"Неподдерживаемый тип значения: {type(value).__name__}")
@@ -0,0 +1,329 @@
+import math
+import random
+import struct
+import time
+from itertools import chain, count
+from typing import Callable, NamedTuple
+
+from src.binary_codes import BinaryNumber
+from src.ieee754 import IEEE754Float, add_ieee754
+from src.softfloat import f32_add
+import src.utils as utils
+
+# Каноническое слово NaN для сравнения с эталоном
+QUIET_NAN = 0x7FC00000
+
+
+class Operation(NamedTuple):
+    name: str
+    run: Callable # (a, b, width) -> результат проверяемой реализации
+    reference: Callable # (a, b, width) -> ожидаемый результат
+    edge_values: Callable # width -> граничные значения операндов
+    random_value: Callable # (rng, width) -> случайный операнд
+    shrink_values: Callable # (value, width) -> более простые операнды того же вида
+    uses_width: bool = True # операции с плавающей точкой не зависят от разрядности
+
+
+class Mismatch(NamedTuple):
+    a: int # операнды после упрощения
+    b: int
+    width: int
+    expected: object
+    actual: object
+    found: tuple[int, int] # операнды, на которых расхождение было найдено
+
+
+class OperationStats(NamedTuple):
+    name: str
+    cases: int
+    mismatches: int
+    examples: list[Mismatch] # первые найденные расхождения
+    ops_per_sec: float
+    p50_us: float # процентили задержки одного вызова, мкс
+    p90_us: float
+    p99_us: float
+
+
+def _bits(value: int, width: int) -> list[int]:
+    """Эталонное представление: младшие width бит value, старший бит первым"""
+    return [(value >> i) & 1 for i in range(width - 1, -1, -1)]
+
+
+def _signed(value: int, width: int) -> int:
+    value &= (1 << width) - 1
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+def int_edge_values(width: int) -> list[int]:
+    """Ноль, ±1, границы разрядности и степени двойки со знаком"""
+    low, high = -(1 << (width - 1)), (1 << (width - 1)) - 1
+    powers = [1 << k for k in range(1, width - 1)]
+    values = [0, 1, -1, low, low + 1, high, high - 1] + powers + [-p for p in powers]
+    return list(dict.fromkeys(values))
+
+
+def int_random_value(rng: random.Random, width: int) -> int:
+    return rng.randint(-(1 << (width - 1)), (1 << (width - 1)) - 1)
+
+
+def int_shrink_values(value: int, width: int) -> list[int]:
+    """Ноль, половина, модуль без младшей единицы и на единицу меньше: модуль строго убывает"""
+    if value == 0:
+        return []
+    sign = -1 if value < 0 else 1
+    magnitude = abs(value)
+    candidates = [0, magnitude >> 1, magnitude & (magnitude - 1), magnitude - 1]
+    return list(dict.fromkeys(sign * c for c in candidates if c < magnitude))
+
+
+def _call(function: Callable, *args):
+    """Результат вызова или имя исключения, чтобы ошибки тоже сравнивались"""
+    try:
+        return function(*args)
+    except (ValueError, ZeroDivisionError) as error:
+        return type(error).__name__
+
+
+def _sum(a: int, b: int, width: int) -> list[int]:
+    return utils.sum_in_compl_code(BinaryNumber(a, width), BinaryNumber(b, width))
+
+
+def _subtraction(a: int, b: int, width: int) -> list[int]:
+    return utils.subtraction(BinaryNumber(a, width), BinaryNumber(b, width))
+
+
+def _multiplication(a: int, b: int, width: int) -> list[int]:
+    return utils.multiplication(BinaryNumber(a, width), BinaryNumber(b, width))
+
+
+def _multiplication_reference(a: int, b: int, width: int) -> list[int]:
+    """Прямой код: знак и младшие width - 1 бит модуля произведения"""
+    return [int((a < 0) != (b < 0))] + _bits(abs(a) * abs(b), width - 1)
+
+
+def _division(a: int, b: int, width: int) -> tuple:
+    return utils.division(BinaryNumber(a, width), BinaryNumber(b, width))
+
+
+def _division_reference(a: int, b: int, width: int) -> tuple:
+    """Модуль частного с 5 дробными битами, отброшенный остаток"""
+    if b == 0:
+        raise ValueError("Деление на ноль невозможно")
+    magnitude = (abs(a) << 5) // abs(b)
+    integer_bits = [int(digit) for digit in bin(magnitude >> 5)[2:]]
+    return integer_bits + [None] + _bits(magnitude, 5), int((a < 0) != (b < 0))
+
+
+def normal_float_edge_values(width: int) -> list[int]:
+    """Положительные нормализованные числа binary32: 1, степени двойки, границы диапазона"""
+    words = [0x3F800000, 0x00800000, 0x7F7FFFFF, 0x7F000000, 0x3F800001, 0x3FFFFFFF, 0x4B800000, 0x33800000]
+    return words + [exponent << 23 for exponent in range(1, 255, 23)]
+
+
+def normal_float_random_value(rng: random.Random, width: int) -> int:
+    return (rng.randint(1, 254) << 23) | rng.getrandbits(23)
+
+
+def normal_float_shrink_values(word: int, width: int) -> list[int]:
+    """
+    Нормализованные числа проще word: без мантиссы, без младшей единицы мантиссы
+    и с экспонентой на шаг ближе к единице.
+    """
+    exponent, mantissa = word >> 23, word & 0x7FFFFF
+    candidates = []
+    if mantissa:
+        candidates += [exponent << 23, word & ~(mantissa & -mantissa)]
+    if exponent != 127:
+        candidates.append(((exponent + (1 if exponent < 127 else -1)) << 23) | mantissa)
+    return list(dict.fromkeys(candidates))
+
+
+def float_edge_values(width: int) -> list[int]:
+    """
+    Граничные слова binary32 обоих знаков: нули, ±1, наименьшее и наибольшее денормализованные,
+    бесконечности и положительные нормализованные границы с отрицательными парами
+    """
+    normals = normal_float_edge_values(width)
+    specials = [0x00000000, 0x80000000, 0xBF800000, 0x00000001, 0x007FFFFF, 0x80000001, 0x807FFFFF,
+                0x7F800000, 0xFF800000]
+    return list(dict.fromkeys(specials + normals + [word | 0x80000000 for word in normals]))
+
+
+def float_random_value(rng: random.Random, width: int) -> int:
+    """Любое слово binary32, кроме NaN: знак, экспонента от 0 (денормализованные) до 255 (бесконечность)"""
+    exponent = rng.randint(0, 255)
+    mantissa = 0 if exponent == 255 else rng.getrandbits(23)
+    return (rng.getrandbits(1) << 31) | (exponent << 23) | mantissa
+
+
+def float_shrink_values(word: int, width: int) -> list[int]:
+    """Ноль, тот же модуль без знака, затем упрощения модуля, как у нормализованных чисел"""
+    sign, magnitude = word & 0x80000000, word & 0x7FFFFFFF
+    candidates = [0] if word else []
+    if sign:
+        candidates.append(magnitude)
+    if magnitude:
+        candidates += [sign | value for value in normal_float_shrink_values(magnitude, width) if value]
+    return list(dict.fromkeys(value for value in candidates if value != word))
+
+
+def _float_value(word: int) -> float:
+    return struct.unpack('>f', struct.pack('>I', word))[0]
+
+
+def _float_sum_reference(a: int, b: int, width: int) -> int:
+    """
+    Сумма в binary64 правильно округлена, упаковка в binary32 округляет к ближайшему
+    (двойное округление суммы двух binary32 безопасно). Переполнение даёт бесконечность
+    со знаком суммы, любой NaN - каноническое слово QUIET_NAN.
+    """
+    total = _float_value(a) + _float_value(b)
+    if math.isnan(total):
+        return QUIET_NAN
+    try:
+        return struct.unpack('>I', struct.pack('>f', total))[0]
+    except OverflowError:
+        return 0xFF800000 if total < 0 else 0x7F800000
+
+
+def _legacy_float_sum_reference(a: int, b: int, width: int) -> int:
+    """add_ieee754 сообщает о переполнении исключением"""
+    result = _float_sum_reference(a, b, width)
+    if result == 0x7F800000:
+        raise ValueError("Переполнение экспоненты")
+    return result
+
+
+def _add_ieee754(a: int, b: int, width: int) -> int:
+    """
+    add_ieee754 складывает только положительные нормализованные числа,
+    поэтому его операнды берутся из normal_float_* генераторов.
+    """
+    return add_ieee754(IEEE754Float.from_word(a), IEEE754Float.from_word(b)).to_word()
+
+
+def _f32_add(a: int, b: int, width: int) -> int:
+    """Знак и содержимое NaN стандарт не фиксирует, поэтому любой NaN сводится к QUIET_NAN"""
+    word = f32_add(a, b)
+    return QUIET_NAN if (word & 0x7F800000) == 0x7F800000 and word & 0x7FFFFF else word
+
+
+OPERATIONS = {
+    'sum_in_compl_code': Operation('sum_in_compl_code', _sum, lambda a, b, width: _bits(a + b, width),
+                                   int_edge_values, int_random_value, int_shrink_values),
+    'subtraction': Operation('subtraction', _subtraction, lambda a, b, width: _bits(a - b, width),
+                             int_edge_values, int_random_value, int_shrink_values),
+    'multiplication': Operation('multiplication', _multiplication, _multiplication_reference,
+                                int_edge_values, int_random_value, int_shrink_values),
+    'division': Operation('division', _division, _division_reference, int_edge_values, int_random_value,
+                          int_shrink_values),
+    'add_ieee754': Operation('add_ieee754', _add_ieee754, _legacy_float_sum_reference, normal_float_edge_values,
+                             normal_float_random_value, normal_float_shrink_values, uses_width=False),
+    'f32_add': Operation('f32_add', _f32_add, _float_sum_reference, float_edge_values, float_random_value,
+                         float_shrink_values, uses_width=False),
+}
+
+
+def generate_cases(operation: Operation, widths: tuple[int, ...], seed: int = 0):
+    """Сначала все пары граничных значений для каждой разрядности, затем бесконечный поток случайных пар"""
+    rng = random.Random(seed)
+    if not operation.uses_width:
+        widths = (32,)
+    edges = (
+        (a, b, width)
+        for width in widths
+        for values in (operation.edge_values(width),)
+        for a in values for b in values
+    )
+    randoms = (
+        (operation.random_value(rng, width), operation.random_value(rng, width), width)
+        for _ in count() for width in widths
+    )
+    return chain(edges, randoms)
+
+
+def is_mismatch(operation: Operation, a: int, b: int, width: int) -> bool:
+    """Расходится ли реализация с эталоном на данных операндах"""
+    return _call(operation.run, a, b, width) != _call(operation.reference, a, b, width)
+
+
+def shrink(operation: Operation, a: int, b: int, width: int, max_steps: int = 2000) -> Mismatch:
+    """
+    Жадно упрощает операнды расхождения: берётся первый более простой операнд,
+    на котором результаты всё ещё различаются, пока такие есть или не исчерпан max_steps.
+    """
+    found = (a, b)
+    steps = 0
+    improved = True
+    while improved and steps < max_steps:
+        improved = False
+        candidates = chain(((value, b) for value in operation.shrink_values(a, width)),
+                           ((a, value) for value in operation.shrink_values(b, width)))
+        for x, y in candidates:
+            steps += 1
+            if is_mismatch(operation, x, y, width):
+                a, b, improved = x, y, True
+                break
+            if steps >= max_steps:
+                break
+    return Mismatch(a, b, width, _call(operation.reference, a, b, width), _call(operation.run, a, b, width), found)
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))] / 1000
+
+
+def run_operation(operation: Operation, budget: float, widths: tuple[int, ...] = (8, 16, 32), seed: int = 0,
+                  max_cases: int | None = None, max_examples: int = 5) -> OperationStats:
+    """
+    Сравнивает реализацию с эталоном, пока не истечёт бюджет времени (в секундах)
+    или не будет проверено max_cases пар. Первые max_examples расхождений упрощаются.
+    """
+    latencies = []
+    mismatches = 0
+    examples = []
+    deadline = time.perf_counter() + budget
+    for a, b, width in generate_cases(operation, widths, seed):
+        if time.perf_counter() >= deadline or (max_cases is not None and len(latencies) >= max_cases):
+            break
+        start = time.perf_counter_ns()
+        actual = _call(operation.run, a, b, width)
+        latencies.append(time.perf_counter_ns() - start)
+        expected = _call(operation.reference, a, b, width)
+        if actual != expected:
+            mismatches += 1
+            if len(examples) < max_examples:
+                examples.append(shrink(operation, a, b, width))
+    latencies.sort()
+    total = sum(latencies) / 1e9
+    return OperationStats(operation.name, len(latencies), mismatches, examples,
+                          len(latencies) / total if total else 0.0,
+                          _percentile(latencies, 0.5), _percentile(latencies, 0.9), _percentile(latencies, 0.99))
+
+
+def run_harness(names: list[str] | None = None, budget: float = 1.0, widths: tuple[int, ...] = (8, 16, 32),
+                seed: int = 0, max_cases: int | None = None) -> list[OperationStats]:
+    """Запускает выбранные операции, деля бюджет времени между ними поровну"""
+    names = list(OPERATIONS) if names is None else names
+    for name in names:
+        if name not in OPERATIONS:
+            raise ValueError(f"Неизвестная операция: {name}")
+    share = budget / len(names) if names else 0
+    return [run_operation(OPERATIONS[name], share, widths, seed, max_cases) for name in names]
+
+
+def format_report(stats: list[OperationStats]) -> str:
+    lines = [f'{"операция":>18} | {"случаев":>8} | {"ошибок":>7} | {"операций/с":>11} | '
+             f'{"p50, мкс":>9} | {"p90, мкс":>9} | {"p99, мкс":>9}',
+             '-' * 90]
+    for item in stats:
+        lines.append(f'{item.name:>18} | {item.cases:>8} | {item.mismatches:>7} | {item.ops_per_sec:>11.0f} | '
+                     f'{item.p50_us:>9.1f} | {item.p90_us:>9.1f} | {item.p99_us:>9.1f}')
+    for item in stats:
+        for example in item.examples:
+            lines.append(f'{item.name}: a={example.a} b={example.b} разрядность={example.width} '
+                         f'ожидалось {example.expected}, получено {example.actual} '
+                         f'(найдено на a={example.found[0]} b={example.found[1]})')
+    return '\n'.join(lines)
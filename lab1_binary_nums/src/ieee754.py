@@ -1,24 +1,31 @@
 # ieee754.py
 import math
 
+from src.float_format import FloatFormat, BINARY32
+from src.float_parse import from_value
+from src.instrumentation import CarryChain, current as current_recorder
+from src.softfloat import ROUND_NEAREST_EVEN, convert
+
 class IEEE754Float:
-    def __init__(self, sign: int, exponent: int, mantissa: list):
+    def __init__(self, sign: int, exponent: int, mantissa: list, fmt: FloatFormat = BINARY32):
         """
-        Инициализация числа в формате IEEE-754 (32 бита).
+        Инициализация числа в формате IEEE-754 (по умолчанию 32 бита).
         """
         self.sign = sign
         self.exponent = exponent
-        self.mantissa = mantissa[:23]  # Ограничиваем до 23 бит
+        self.mantissa = mantissa[:fmt.man_bits]  # Ограничиваем разрядностью мантиссы
+        self.fmt = fmt
     
     @staticmethod
-    def from_decimal(decimal: float) -> 'IEEE754Float':
+    def from_decimal(decimal: float, fmt: FloatFormat = BINARY32) -> 'IEEE754Float':
         """
-        Преобразует десятичное число в формат IEEE-754 (32 бита).
+        Преобразует десятичное число в формат IEEE-754 (по умолчанию 32 бита).
         """
+        man_bits = fmt.man_bits
         if decimal < 0:
             raise ValueError("Ожидается положительное число")
         if decimal == 0:
-            return IEEE754Float(0, 0, [0] * 23)
+            return IEEE754Float(0, 0, [0] * man_bits, fmt)
         
         int_part = int(decimal)
         frac_part = decimal - int_part
@@ -32,7 +39,7 @@ class IEEE754Float:
                 int_part //= 2
         
         frac_bits = []
-        precision = 23
+        precision = man_bits
         while frac_part > 0 and len(frac_bits) < precision:
             frac_part *= 2
             bit = int(frac_part)
@@ -52,18 +59,26 @@ class IEEE754Float:
                     mantissa = bits[i + 1:]
                     break
             else:
-                return IEEE754Float(0, 0, [0] * 23)
+                return IEEE754Float(0, 0, [0] * man_bits, fmt)
         
-        mantissa = mantissa + [0] * (23 - len(mantissa)) if len(mantissa) < 23 else mantissa[:23]
-        exponent += 127
+        mantissa = mantissa + [0] * (man_bits - len(mantissa)) if len(mantissa) < man_bits else mantissa[:man_bits]
+        exponent += fmt.bias
         
-        if exponent > 255:
-            raise ValueError("Число слишком большое для IEEE-754 (32 бита)")
+        if exponent > fmt.exp_max:
+            raise ValueError(f"Число слишком большое для формата {fmt.name}")
         if exponent < 0:
-            return IEEE754Float(0, 0, [0] * 23)
+            return IEEE754Float(0, 0, [0] * man_bits, fmt)
         
-        return IEEE754Float(0, exponent, mantissa)
+        return IEEE754Float(0, exponent, mantissa, fmt)
     
+    @staticmethod
+    def from_exact(value, fmt: FloatFormat = BINARY32, rounding: str = ROUND_NEAREST_EVEN) -> 'IEEE754Float':
+        """
+        Правильно округлённое число для десятичной строки, Fraction, Decimal или int
+        (в том числе отрицательного или денормализованного).
+        """
+        return IEEE754Float.from_word(from_value(value, fmt, rounding), fmt)
+
     def to_decimal(self) -> float:
         """
         Преобразует число в формате IEEE-754 обратно в десятичное.
@@ -71,21 +86,46 @@ class IEEE754Float:
         if self.exponent == 0 and all(bit == 0 for bit in self.mantissa):
             return 0.0
         
-        true_exponent = self.exponent - 127
+        true_exponent = self.exponent - self.fmt.bias
         mantissa_value = 1.0
         for i, bit in enumerate(self.mantissa):
             mantissa_value += bit * (2 ** -(i + 1))
         
         return mantissa_value * (2 ** true_exponent)
     
+    def to_word(self) -> int:
+        """
+        Возвращает двоичное представление числа как целое.
+        """
+        man_bits = self.fmt.man_bits
+        mantissa = 0
+        for bit in self.mantissa + [0] * (man_bits - len(self.mantissa)):
+            mantissa = (mantissa << 1) | bit
+        return (self.sign << self.fmt.sign_shift) | (self.exponent << man_bits) | mantissa
+
+    @staticmethod
+    def from_word(word: int, fmt: FloatFormat = BINARY32) -> 'IEEE754Float':
+        """
+        Строит число по двоичному представлению в формате fmt.
+        """
+        man_bits = fmt.man_bits
+        mantissa = [(word >> (man_bits - 1 - i)) & 1 for i in range(man_bits)]
+        return IEEE754Float(word >> fmt.sign_shift, (word >> man_bits) & fmt.exp_max, mantissa, fmt)
+
+    def convert(self, fmt: FloatFormat, rounding: str = ROUND_NEAREST_EVEN) -> 'IEEE754Float':
+        """
+        Переводит число в другой формат с округлением.
+        """
+        return IEEE754Float.from_word(convert(self.to_word(), self.fmt, fmt, rounding), fmt)
+
     def to_bits(self) -> list:
         """
-        Возвращает 32-битное представление числа в виде списка бит.
+        Возвращает двоичное представление числа в виде списка бит.
         """
         bits = [self.sign]
         exp_bits = []
         exp = self.exponent
-        for _ in range(8):
+        for _ in range(self.fmt.exp_bits):
             exp_bits.insert(0, exp % 2)
             exp //= 2
         bits.extend(exp_bits)
@@ -94,12 +134,23 @@ class IEEE754Float:
 
 def add_ieee754(num1: IEEE754Float, num2: IEEE754Float) -> IEEE754Float:
     """
-    Складывает два числа в формате IEEE-754 (32 бита).
+    Складывает два числа в формате IEEE-754 (оба операнда в одном формате).
     """
+    fmt = num1.fmt
+    man_bits = fmt.man_bits
+    if num2.fmt != fmt:
+        raise ValueError("Операнды должны быть в одном формате")
+
+    recorder = current_recorder()
+
     # Проверяем нули
     if num1.exponent == 0 and all(bit == 0 for bit in num1.mantissa):
+        if recorder is not None:
+            recorder.record('add_ieee754', {'iterations': 0})
         return num2
     if num2.exponent == 0 and all(bit == 0 for bit in num2.mantissa):
+        if recorder is not None:
+            recorder.record('add_ieee754', {'iterations': 0})
         return num1
 
     # Получаем истинные мантиссы (неявная 1 впереди)
@@ -121,10 +172,15 @@ def add_ieee754(num1: IEEE754Float, num2: IEEE754Float) -> IEEE754Float:
             mant1 = [0] + mant1[:-1]  # сдвиг вправо
         exp = exp2
 
+    align_shifts = shift
+
     # Сложение мантисс
+    chain = CarryChain() if recorder is not None else None
     carry = 0
     result_mant = []
     for i in range(len(mant1) - 1, -1, -1):
+        if chain is not None:
+            chain.step(mant1[i], mant2[i], carry)
         bit_sum = mant1[i] + mant2[i] + carry
         result_mant.insert(0, bit_sum % 2)
         carry = bit_sum // 2
@@ -142,19 +198,26 @@ def add_ieee754(num1: IEEE754Float, num2: IEEE754Float) -> IEEE754Float:
 
     exp -= shift
     result_mant = result_mant[shift:]
+    if recorder is not None:
+        recorder.record('add_ieee754', {'full_adders': len(mant1), 'carry_chain': chain.longest,
+                                        'shifts': align_shifts, 'normalisation': carry + shift,
+                                        'iterations': align_shifts + len(mant1)})
 
     # Убираем неявную 1
     if len(result_mant) > 1:
         result_mant = result_mant[1:]
     else:
-        result_mant = [0] * 23
+        result_mant = [0] * man_bits
 
     # Дополняем или обрезаем мантиссу
-    result_mant = result_mant + [0] * (23 - len(result_mant)) if len(result_mant) < 23 else result_mant[:23]
+    if len(result_mant) < man_bits:
+        result_mant = result_mant + [0] * (man_bits - len(result_mant))
+    else:
+        result_mant = result_mant[:man_bits]
 
     if exp <= 0:
-        return IEEE754Float(0, 0, [0] * 23)
-    if exp >= 255:
+        return IEEE754Float(0, 0, [0] * man_bits, fmt)
+    if exp >= fmt.exp_max:
         raise ValueError("Переполнение экспоненты")
 
-    return IEEE754Float(0, exp, result_mant)
+    return IEEE754Float(0, exp, result_mant, fmt)
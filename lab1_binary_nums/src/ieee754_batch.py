@@ -0,0 +1,90 @@
+import numpy as np
+
+from src.bitops import int_to_bits, bits_to_int
+from src.ieee754 import IEEE754Float
+
+_MANTISSA_MASK = np.uint32((1 << 23) - 1)
+
+
+def as_uint32(buffer) -> np.ndarray:
+    """
+    Представляет буфер float32 (массив NumPy, memoryview, bytes, mmap) как массив uint32
+    без копирования данных. Порядок байт - машинный.
+    """
+    if isinstance(buffer, np.ndarray):
+        if buffer.dtype not in (np.float32, np.uint32):
+            raise ValueError("Ожидается массив float32 или uint32")
+        return buffer.view(np.uint32)
+    return np.frombuffer(buffer, dtype=np.uint32)
+
+
+def decompose(buffer) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Разбирает буфер float32 на массивы знаков, смещённых порядков и мантисс"""
+    words = as_uint32(buffer)
+    sign = (words >> np.uint32(31)).astype(np.uint8)
+    exponent = ((words >> np.uint32(23)) & np.uint32(0xFF)).astype(np.uint8)
+    mantissa = words & _MANTISSA_MASK
+    return sign, exponent, mantissa
+
+
+def compose(sign, exponent, mantissa) -> np.ndarray:
+    """Собирает массив float32 из массивов полей"""
+    sign = np.asarray(sign, dtype=np.uint32)
+    exponent = np.asarray(exponent, dtype=np.uint32)
+    mantissa = np.asarray(mantissa, dtype=np.uint32)
+    if np.any(sign > 1) or np.any(exponent > 0xFF) or np.any(mantissa > _MANTISSA_MASK):
+        raise ValueError("Значение поля выходит за пределы формата IEEE-754 (32 бита)")
+    words = (sign << np.uint32(31)) | (exponent << np.uint32(23)) | mantissa
+    return words.view(np.float32)
+
+
+class IEEE754Batch:
+    """
+    Пачка чисел IEEE-754 (32 бита) в виде структуры массивов:
+    отдельные массивы знаков, порядков и мантисс (мантисса как 23-битное целое).
+    """
+
+    def __init__(self, sign: np.ndarray, exponent: np.ndarray, mantissa: np.ndarray):
+        if not len(sign) == len(exponent) == len(mantissa):
+            raise ValueError("Массивы полей должны иметь одинаковую длину")
+        self.sign = np.asarray(sign, dtype=np.uint8)
+        self.exponent = np.asarray(exponent, dtype=np.uint8)
+        self.mantissa = np.asarray(mantissa, dtype=np.uint32)
+
+    @staticmethod
+    def from_buffer(buffer) -> 'IEEE754Batch':
+        """Строит пачку из буфера float32"""
+        return IEEE754Batch(*decompose(buffer))
+
+    @staticmethod
+    def from_values(values) -> 'IEEE754Batch':
+        """Строит пачку из последовательности чисел, округляя их до float32"""
+        return IEEE754Batch.from_buffer(np.asarray(values, dtype=np.float32))
+
+    @staticmethod
+    def from_floats(numbers: list[IEEE754Float]) -> 'IEEE754Batch':
+        """Строит пачку из списка IEEE754Float"""
+        sign = np.array([num.sign for num in numbers], dtype=np.uint8)
+        exponent = np.array([num.exponent for num in numbers], dtype=np.uint8)
+        mantissa = np.array([bits_to_int(num.mantissa + [0] * (23 - len(num.mantissa))) for num in numbers],
+                            dtype=np.uint32)
+        return IEEE754Batch(sign, exponent, mantissa)
+
+    def __len__(self) -> int:
+        return len(self.sign)
+
+    def __getitem__(self, index: int) -> IEEE754Float:
+        return IEEE754Float(int(self.sign[index]), int(self.exponent[index]),
+                            int_to_bits(int(self.mantissa[index]), 23))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_float32(self) -> np.ndarray:
+        """Собирает пачку обратно в массив float32"""
+        return compose(self.sign, self.exponent, self.mantissa)
+
+    def to_words(self) -> np.ndarray:
+        """32-битные представления чисел"""
+        return self.to_float32().view(np.uint32)
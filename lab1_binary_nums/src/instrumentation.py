@@ -0,0 +1,137 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import NamedTuple
+
+
+class MetricSummary(NamedTuple):
+    calls: int
+    total: int
+    mean: float
+    min: int
+    max: int
+
+
+class CarryChain:
+    """
+    Длина самой длинной цепочки распространения переноса, считаемая по разрядам
+    прямо в цикле сложения: step вызывается для каждого разряда с переносом в него.
+    """
+
+    __slots__ = ('run', 'longest')
+
+    def __init__(self, carry_in: int = 0):
+        self.run = self.longest = carry_in
+
+    def step(self, a: int, b: int, carry: int) -> None:
+        if a & b:
+            self.run = 1 # перенос порождается в этом разряде
+        elif (a ^ b) and carry:
+            self.run += 1
+        else:
+            self.run = 0
+        if self.run > self.longest:
+            self.longest = self.run
+
+
+def carry_chain(word1: int, word2: int, width: int, carry_in: int = 0) -> int:
+    """
+    Длина самой длинной цепочки распространения переноса при сложении word1 + word2:
+    число подряд идущих разрядов, через которые прошёл один перенос.
+    """
+    chain = CarryChain(carry_in)
+    carry = carry_in
+    for i in range(width):
+        a, b = (word1 >> i) & 1, (word2 >> i) & 1
+        chain.step(a, b, carry)
+        carry = (a & b) | ((a ^ b) & carry)
+    return chain.longest
+
+
+class Recorder:
+    """Накапливает метрики вызовов в гистограммы по операциям"""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.histograms = defaultdict(lambda: defaultdict(Counter)) # операция -> метрика -> значение -> число вызовов
+
+    def record(self, operation: str, metrics: dict[str, int]) -> None:
+        self.calls[operation] += 1
+        for name, value in metrics.items():
+            self.histograms[operation][name][value] += 1
+
+    def summary(self) -> dict[str, dict[str, MetricSummary]]:
+        result = {}
+        for operation, metrics in self.histograms.items():
+            result[operation] = {}
+            for name, histogram in metrics.items():
+                calls = sum(histogram.values())
+                total = sum(value * count for value, count in histogram.items())
+                result[operation][name] = MetricSummary(calls, total, total / calls, min(histogram), max(histogram))
+        return result
+
+    def report(self, bar_width: int = 40) -> str:
+        """Текстовый отчёт: сводка и гистограмма по степеням двойки для каждой метрики"""
+        lines = []
+        for operation, metrics in self.summary().items():
+            lines.append(f'{operation}: вызовов {self.calls[operation]}')
+            for name, item in metrics.items():
+                lines.append(f'  {name}: всего {item.total}, среднее {item.mean:.2f}, мин {item.min}, макс {item.max}')
+                buckets = Counter()
+                for value, count in self.histograms[operation][name].items():
+                    buckets[value.bit_length()] += count # 0, 1, 2-3, 4-7, ...
+                largest = max(buckets.values())
+                for bucket in sorted(buckets):
+                    low, high = (0, 0) if bucket == 0 else (1 << (bucket - 1), (1 << bucket) - 1)
+                    label = str(low) if low == high else f'{low}-{high}'
+                    bar = '#' * max(1, buckets[bucket] * bar_width // largest)
+                    lines.append(f'    {label:>11} | {bar} {buckets[bucket]}')
+        return '\n'.join(lines)
+
+
+# Активный накопитель метрик; у каждого потока и задачи asyncio свой контекст
+_active: ContextVar[Recorder | None] = ContextVar('instrumentation_recorder', default=None)
+
+
+def current() -> Recorder | None:
+    """
+    Накопитель, в который инструментированные функции (utils.sum_with_flags, utils.multiplication,
+    utils.division, ieee754.add_ieee754) пишут метрики своих циклов. None - учёт выключен.
+    """
+    return _active.get()
+
+
+def enable(recorder: Recorder | None = None) -> Recorder:
+    """
+    Включает учёт в текущем контексте. Функции не подменяются: каждая из них сама считает
+    разряды и сдвиги в своих циклах, а при выключенном учёте делает одну проверку ContextVar.
+    """
+    if _active.get() is not None:
+        raise RuntimeError("Инструментирование уже включено")
+    recorder = recorder or Recorder()
+    _active.set(recorder)
+    return recorder
+
+
+def disable() -> Recorder | None:
+    """Выключает учёт в текущем контексте и отдаёт накопленный отчёт"""
+    recorder = _active.get()
+    _active.set(None)
+    return recorder
+
+
+def is_enabled() -> bool:
+    return _active.get() is not None
+
+
+@contextmanager
+def instrumented(recorder: Recorder | None = None):
+    """Включает учёт на время блока with"""
+    if _active.get() is not None:
+        raise RuntimeError("Инструментирование уже включено")
+    recorder = recorder or Recorder()
+    token = _active.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _active.reset(token)
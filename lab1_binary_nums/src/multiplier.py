@@ -0,0 +1,87 @@
+from typing import NamedTuple
+
+from src.bitops import fits_in, to_signed
+
+# Ниже этой разрядности метод Карацубы переходит на встроенное умножение
+KARATSUBA_THRESHOLD = 64
+
+# Цифры рекодирования Бута по основанию 4 для тройки бит (b[i+1], b[i], b[i-1])
+_BOOTH_DIGITS = (0, 1, 1, 2, -2, -1, -1, 0)
+
+
+class Product(NamedTuple):
+    full: int # полное произведение разрядности 2n
+    truncated: int # младшие n бит произведения в дополнительном коде
+    overflow: bool # не помещается ли произведение в n бит
+
+
+def _shift_add_unsigned(a: int, b: int, width: int) -> int:
+    """Сдвиг и сложение: width тактов, по слагаемому на каждый единичный бит множителя"""
+    result = 0
+    for shift in range(width):
+        if (b >> shift) & 1:
+            result += a << shift
+    return result
+
+
+def shift_add_multiply(a: int, b: int, width: int = 32) -> int:
+    """
+    Умножение модулей сдвигом и сложением, знак вычисляется отдельно.
+    Просматриваются width бит модуля множителя.
+    """
+    product = _shift_add_unsigned(abs(a), abs(b), width)
+    return -product if (a < 0) != (b < 0) else product
+
+
+def booth_multiply(a: int, b: int, width: int = 32) -> int:
+    """
+    Умножение по алгоритму Бута с основанием 4 для чисел в дополнительном коде.
+    Множитель перекодируется в ceil(width / 2) цифр из {-2, -1, 0, 1, 2}.
+    """
+    extended = b << 1 # добавляем b[-1] = 0, знак расширяется сдвигом
+    result = 0
+    for i in range(0, width, 2):
+        digit = _BOOTH_DIGITS[(extended >> i) & 0b111]
+        if digit:
+            partial = a << 1 if digit in (2, -2) else a
+            result += (-partial if digit < 0 else partial) << i
+    return result
+
+
+def _karatsuba_unsigned(a: int, b: int, width: int) -> int:
+    if width <= KARATSUBA_THRESHOLD:
+        return a * b
+    half = width // 2
+    low_mask = (1 << half) - 1
+    a_high, a_low = a >> half, a & low_mask
+    b_high, b_low = b >> half, b & low_mask
+    high = _karatsuba_unsigned(a_high, b_high, width - half)
+    low = _karatsuba_unsigned(a_low, b_low, half)
+    middle = _karatsuba_unsigned(a_high + a_low, b_high + b_low, width - half + 1) - high - low
+    return (high << (2 * half)) + (middle << half) + low
+
+
+def karatsuba_multiply(a: int, b: int, width: int = 32) -> int:
+    """Умножение модулей методом Карацубы для широких операндов"""
+    product = _karatsuba_unsigned(abs(a), abs(b), width)
+    return -product if (a < 0) != (b < 0) else product
+
+
+MULTIPLIERS = {
+    'shift_add': shift_add_multiply,
+    'booth': booth_multiply,
+    'karatsuba': karatsuba_multiply,
+}
+
+
+def multiply(a: int, b: int, width: int = 32, mode: str = 'shift_add') -> Product:
+    """
+    Перемножает два числа разрядности width выбранным методом.
+    Возвращает полное произведение, его усечение до width бит и флаг переполнения.
+    """
+    if mode not in MULTIPLIERS:
+        raise ValueError(f"Неизвестный метод умножения: {mode}")
+    if not (fits_in(a, width) and fits_in(b, width)):
+        raise ValueError("Операнд не помещается в заданную разрядность")
+    full = MULTIPLIERS[mode](a, b, width)
+    return Product(full, to_signed(full, width), not fits_in(full, width))
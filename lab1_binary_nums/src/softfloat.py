@@ -0,0 +1,305 @@
+from fractions import Fraction
+from math import isqrt
+
+from src.float_format import FloatFormat, BINARY32
+
+# Режимы округления IEEE-754
+ROUND_NEAREST_EVEN = 'nearest_even'
+ROUND_TOWARD_ZERO = 'toward_zero'
+ROUND_UP = 'toward_positive'
+ROUND_DOWN = 'toward_negative'
+ROUNDING_MODES = (ROUND_NEAREST_EVEN, ROUND_TOWARD_ZERO, ROUND_UP, ROUND_DOWN)
+
+# Параметры формата binary32, используемые по умолчанию
+EXP_BITS = BINARY32.exp_bits
+MAN_BITS = BINARY32.man_bits
+BIAS = BINARY32.bias
+EXP_MAX = BINARY32.exp_max
+EMIN = BINARY32.emin
+EMAX = BINARY32.emax
+
+SIGN_MASK = BINARY32.sign_mask
+MAN_MASK = BINARY32.man_mask
+HIDDEN_BIT = BINARY32.hidden_bit
+QUIET_BIT = BINARY32.quiet_bit
+INF = BINARY32.inf
+DEFAULT_NAN = BINARY32.default_nan # NaN, возвращаемый недопустимыми операциями
+MAX_FINITE = BINARY32.max_finite
+
+# Дополнительные разряды (guard, round, sticky) при выравнивании порядков
+_GRS_BITS = 3
+
+
+def pack(sign: int, exponent: int, mantissa: int, fmt: FloatFormat = BINARY32) -> int:
+    """Собирает слово формата из полей"""
+    return (sign << fmt.sign_shift) | (exponent << fmt.man_bits) | mantissa
+
+
+def unpack(word: int, fmt: FloatFormat = BINARY32) -> tuple[int, int, int]:
+    """Разбирает слово формата на (знак, смещённый порядок, мантиссу)"""
+    return word >> fmt.sign_shift, (word >> fmt.man_bits) & fmt.exp_max, word & fmt.man_mask
+
+
+def is_nan(word: int, fmt: FloatFormat = BINARY32) -> bool:
+    return (word & ~fmt.sign_mask) > fmt.inf
+
+
+def is_inf(word: int, fmt: FloatFormat = BINARY32) -> bool:
+    return (word & ~fmt.sign_mask) == fmt.inf
+
+
+def is_zero(word: int, fmt: FloatFormat = BINARY32) -> bool:
+    return (word & ~fmt.sign_mask) == 0
+
+
+def _significand(word: int, fmt: FloatFormat) -> tuple[int, int]:
+    """
+    Представляет конечное число как sig * 2 ** exp с целым sig.
+    Для денормализованных чисел скрытая единица не добавляется.
+    """
+    exponent = (word >> fmt.man_bits) & fmt.exp_max
+    mantissa = word & fmt.man_mask
+    if exponent == 0:
+        return mantissa, fmt.emin - fmt.man_bits
+    return mantissa | fmt.hidden_bit, exponent - fmt.bias - fmt.man_bits
+
+
+def _overflow(sign: int, rounding: str, fmt: FloatFormat) -> int:
+    """Результат переполнения: бесконечность или наибольшее конечное число"""
+    if rounding == ROUND_TOWARD_ZERO or (rounding == ROUND_UP and sign) or (rounding == ROUND_DOWN and not sign):
+        return pack(sign, 0, 0, fmt) | fmt.max_finite
+    return pack(sign, 0, 0, fmt) | fmt.inf
+
+
+def round_pack(sign: int, sig: int, exp: int, rounding: str = ROUND_NEAREST_EVEN, sticky: bool = False,
+               fmt: FloatFormat = BINARY32) -> int:
+    """
+    Округляет положительное значение sig * 2 ** exp до формата и упаковывает его.
+    sticky означает, что точное значение чуть больше sig * 2 ** exp
+    (отброшенные при вычислении разряды были ненулевыми).
+    """
+    if sig == 0:
+        return pack(sign, 0, 0, fmt)
+    man_bits = fmt.man_bits
+    exponent = sig.bit_length() - 1 + exp # порядок старшего единичного бита
+    if exponent < fmt.emin:
+        exponent = fmt.emin # денормализованный результат
+    shift = exponent - man_bits - exp
+
+    if shift > 0:
+        kept = sig >> shift
+        round_bit = (sig >> (shift - 1)) & 1
+        sticky = sticky or (sig & ((1 << (shift - 1)) - 1)) != 0
+    else:
+        kept = sig << -shift
+        round_bit = 0
+
+    if rounding == ROUND_NEAREST_EVEN:
+        increment = round_bit and (sticky or kept & 1)
+    elif rounding == ROUND_TOWARD_ZERO:
+        increment = False
+    elif rounding == ROUND_UP:
+        increment = (round_bit or sticky) and not sign
+    elif rounding == ROUND_DOWN:
+        increment = (round_bit or sticky) and sign
+    else:
+        raise ValueError(f"Неизвестный режим округления: {rounding}")
+
+    if increment:
+        kept += 1
+        if kept >> (man_bits + 1):
+            kept >>= 1
+            exponent += 1
+
+    if exponent > fmt.emax:
+        return _overflow(sign, rounding, fmt)
+    if kept & fmt.hidden_bit:
+        return pack(sign, exponent + fmt.bias, kept & fmt.man_mask, fmt)
+    return pack(sign, 0, kept, fmt) # денормализованное число или ноль
+
+
+def _propagate_nan(a: int, b: int | None = None, fmt: FloatFormat = BINARY32) -> int:
+    """Возвращает первый из NaN-операндов, сделав его тихим"""
+    for word in (a, b):
+        if word is not None and is_nan(word, fmt):
+            return word | fmt.quiet_bit
+    return fmt.default_nan
+
+
+def _exact_zero_sign(rounding: str) -> int:
+    """Знак точного нулевого результата суммы противоположных чисел"""
+    return 1 if rounding == ROUND_DOWN else 0
+
+
+def float_add(a: int, b: int, rounding: str = ROUND_NEAREST_EVEN, fmt: FloatFormat = BINARY32) -> int:
+    """Сложение двух чисел формата fmt, заданных словами"""
+    if is_nan(a, fmt) or is_nan(b, fmt):
+        return _propagate_nan(a, b, fmt)
+    sign_a, sign_b = a >> fmt.sign_shift, b >> fmt.sign_shift
+    if is_inf(a, fmt) or is_inf(b, fmt):
+        if is_inf(a, fmt) and is_inf(b, fmt) and sign_a != sign_b:
+            return fmt.default_nan
+        return a if is_inf(a, fmt) else b
+    if is_zero(a, fmt) and is_zero(b, fmt):
+        return pack(sign_a if sign_a == sign_b else _exact_zero_sign(rounding), 0, 0, fmt)
+    if is_zero(a, fmt):
+        return b
+    if is_zero(b, fmt):
+        return a
+
+    sig_a, exp_a = _significand(a, fmt)
+    sig_b, exp_b = _significand(b, fmt)
+    if exp_a < exp_b:
+        sig_a, exp_a, sign_a, sig_b, exp_b, sign_b = sig_b, exp_b, sign_b, sig_a, exp_a, sign_a
+
+    # Выравнивание порядков: меньшее число сдвигается вправо,
+    # выдвинутые единицы собираются в sticky-бит
+    sig_a <<= _GRS_BITS
+    sig_b <<= _GRS_BITS
+    shift = exp_a - exp_b
+    if shift > fmt.man_bits + _GRS_BITS + 1:
+        sig_b = 1
+    elif shift:
+        sig_b = (sig_b >> shift) | ((sig_b & ((1 << shift) - 1)) != 0)
+    exp = exp_a - _GRS_BITS
+
+    total = (-sig_a if sign_a else sig_a) + (-sig_b if sign_b else sig_b)
+    if total == 0:
+        return pack(_exact_zero_sign(rounding), 0, 0, fmt)
+    return round_pack(1 if total < 0 else 0, abs(total), exp, rounding, fmt=fmt)
+
+
+def float_sub(a: int, b: int, rounding: str = ROUND_NEAREST_EVEN, fmt: FloatFormat = BINARY32) -> int:
+    """Вычитание: сложение с числом противоположного знака"""
+    if is_nan(b, fmt):
+        return _propagate_nan(a, b, fmt)
+    return float_add(a, b ^ fmt.sign_mask, rounding, fmt)
+
+
+def float_mul(a: int, b: int, rounding: str = ROUND_NEAREST_EVEN, fmt: FloatFormat = BINARY32) -> int:
+    """Умножение: точное произведение мантисс округляется один раз"""
+    if is_nan(a, fmt) or is_nan(b, fmt):
+        return _propagate_nan(a, b, fmt)
+    sign = (a ^ b) >> fmt.sign_shift
+    if is_inf(a, fmt) or is_inf(b, fmt):
+        if is_zero(a, fmt) or is_zero(b, fmt):
+            return fmt.default_nan
+        return pack(sign, 0, 0, fmt) | fmt.inf
+    if is_zero(a, fmt) or is_zero(b, fmt):
+        return pack(sign, 0, 0, fmt)
+    sig_a, exp_a = _significand(a, fmt)
+    sig_b, exp_b = _significand(b, fmt)
+    return round_pack(sign, sig_a * sig_b, exp_a + exp_b, rounding, fmt=fmt)
+
+
+def float_div(a: int, b: int, rounding: str = ROUND_NEAREST_EVEN, fmt: FloatFormat = BINARY32) -> int:
+    """Деление: частное мантисс с запасом разрядов и sticky-битом по остатку"""
+    if is_nan(a, fmt) or is_nan(b, fmt):
+        return _propagate_nan(a, b, fmt)
+    sign = (a ^ b) >> fmt.sign_shift
+    if is_inf(a, fmt):
+        return fmt.default_nan if is_inf(b, fmt) else pack(sign, 0, 0, fmt) | fmt.inf
+    if is_inf(b, fmt):
+        return pack(sign, 0, 0, fmt)
+    if is_zero(b, fmt):
+        return fmt.default_nan if is_zero(a, fmt) else pack(sign, 0, 0, fmt) | fmt.inf
+    if is_zero(a, fmt):
+        return pack(sign, 0, 0, fmt)
+    sig_a, exp_a = _significand(a, fmt)
+    sig_b, exp_b = _significand(b, fmt)
+    # Частное должно содержать не меньше man_bits + 3 значащих бит
+    scale = max(0, fmt.man_bits + _GRS_BITS + sig_b.bit_length() - sig_a.bit_length())
+    quotient, remainder = divmod(sig_a << scale, sig_b)
+    return round_pack(sign, quotient, exp_a - exp_b - scale, rounding, remainder != 0, fmt)
+
+
+def float_sqrt(a: int, rounding: str = ROUND_NEAREST_EVEN, fmt: FloatFormat = BINARY32) -> int:
+    """Квадратный корень: целочисленный корень из мантиссы с чётным порядком"""
+    if is_nan(a, fmt):
+        return _propagate_nan(a, fmt=fmt)
+    if is_zero(a, fmt):
+        return a
+    if a >> fmt.sign_shift:
+        return fmt.default_nan
+    if is_inf(a, fmt):
+        return a
+    sig, exp = _significand(a, fmt)
+    # Порядок делается чётным, мантисса расширяется так,
+    # чтобы корень содержал не меньше man_bits + 3 значащих бит
+    scale = max(0, 2 * (fmt.man_bits + _GRS_BITS) - sig.bit_length() + 2)
+    if (exp - scale) & 1:
+        scale += 1
+    sig <<= scale
+    root = isqrt(sig)
+    return round_pack(0, root, (exp - scale) // 2, rounding, root * root != sig, fmt)
+
+
+def f32_add(a: int, b: int, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    """Сложение двух чисел binary32, заданных 32-битными словами"""
+    return float_add(a, b, rounding)
+
+
+def f32_sub(a: int, b: int, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    return float_sub(a, b, rounding)
+
+
+def f32_mul(a: int, b: int, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    return float_mul(a, b, rounding)
+
+
+def f32_div(a: int, b: int, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    return float_div(a, b, rounding)
+
+
+def f32_sqrt(a: int, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    return float_sqrt(a, rounding)
+
+
+def convert(word: int, source: FloatFormat, target: FloatFormat, rounding: str = ROUND_NEAREST_EVEN) -> int:
+    """
+    Переводит число из формата source в формат target с округлением.
+    У NaN сохраняются старшие разряды полезной нагрузки.
+    """
+    sign = word >> source.sign_shift
+    if is_nan(word, source):
+        payload = word & source.man_mask
+        shift = target.man_bits - source.man_bits
+        payload = payload << shift if shift >= 0 else payload >> -shift
+        return pack(sign, 0, 0, target) | target.inf | target.quiet_bit | payload
+    if is_inf(word, source):
+        return pack(sign, 0, 0, target) | target.inf
+    sig, exp = _significand(word, source)
+    return round_pack(sign, sig, exp, rounding, fmt=target)
+
+
+def to_fraction(word: int, fmt: FloatFormat = BINARY32) -> Fraction:
+    """Точное значение конечного числа"""
+    if is_nan(word, fmt) or is_inf(word, fmt):
+        raise ValueError("Бесконечность и NaN не имеют точного рационального значения")
+    sig, exp = _significand(word, fmt)
+    value = Fraction(sig << exp) if exp >= 0 else Fraction(sig, 1 << -exp)
+    return -value if word >> fmt.sign_shift else value
+
+
+def ulp(word: int, fmt: FloatFormat = BINARY32) -> Fraction:
+    """Вес младшего разряда мантиссы конечного числа"""
+    exponent = max((word >> fmt.man_bits) & fmt.exp_max, 1)
+    exp = exponent - fmt.bias - fmt.man_bits
+    return Fraction(1 << exp) if exp >= 0 else Fraction(1, 1 << -exp)
+
+
+def from_fraction(value: Fraction, rounding: str = ROUND_NEAREST_EVEN, fmt: FloatFormat = BINARY32) -> int:
+    """
+    Точное рациональное значение, округлённое до формата.
+    Частное целых содержит не меньше man_bits + 2 значащих бит, остаток даёт sticky-бит.
+    """
+    sign = 1 if value < 0 else 0
+    numerator, denominator = abs(value.numerator), value.denominator
+    if numerator == 0:
+        return pack(sign, 0, 0, fmt)
+    shift = fmt.man_bits + 2 + denominator.bit_length() - numerator.bit_length()
+    if shift >= 0:
+        quotient, remainder = divmod(numerator << shift, denominator)
+    else:
+        quotient, remainder = divmod(numerator, denominator << -shift)
+    return round_pack(sign, quotient, -shift, rounding, remainder != 0, fmt)
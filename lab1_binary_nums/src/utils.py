@@ -1,102 +1,165 @@
-from src.binary_codes import BinaryNumber
+from src.adders import add as adder_add, netlist as adder_netlist
+from src.binary_codes import BinaryNumber, PackedBinaryNumber, FrozenBinaryNumber
+from src.bitops import bits_to_int, int_to_bits, mask, to_signed, word_params
+from src.instrumentation import CarryChain, carry_chain, current as current_recorder
 from itertools import dropwhile
 
 def dec_to_bin_positive(n, bits=32):
-    """Перевод десятичного целого положительного числа в двоичный вид как массив бит"""
-    if n == 0:
-        return [0] * bits
-    result = []
-    while n > 0:
-        result.insert(0, n % 2)
-        n //= 2
-    return [0] * (bits - len(result)) + result
-
-def convert_all_tipes(num: BinaryNumber) -> None:
-    num.dec_to_bin()
+    """
+    Перевод десятичного целого положительного числа в двоичный вид как массив бит.
+    Для отрицательного числа, как и раньше, возвращаются нули.
+    """
+    return int_to_bits(max(n, 0), bits)
+
+# Числа, хранящие дополнительный код как целое
+_PACKED_TYPES = (PackedBinaryNumber, FrozenBinaryNumber)
+
+def convert_all_tipes(num: BinaryNumber, bits: int | None = None) -> None:
+    if isinstance(num, FrozenBinaryNumber):
+        return # коды неизменяемого числа строятся при обращении
+    if isinstance(num, PackedBinaryNumber):
+        num.convert_packed(bits)
+        return
+    num.dec_to_bin(bits)
     num.bin_to_reverse_code()
     num.rev_code_to_compl_code()
 
-def twos_complement_to_decimal(bits: list[int]) -> int:
+def twos_complement_to_decimal(bits: list[int], width: int | None = None) -> int:
     """
-    Переводит 32-битное число в дополнительном коде (в виде списка из 0 и 1) в десятичное число.
+    Переводит число в дополнительном коде (в виде списка из 0 и 1) в десятичное число.
+    Разрядность по умолчанию равна длине списка.
     """
-    result = 0
-    is_negative = bits[0] == 1
+    if width is None:
+        width = len(bits)
+    return to_signed(bits_to_int(bits[:width]), width)
 
-    for i in range(32):
-        bit = bits[31 - i]
-        if is_negative:
-            bit = 1 - bit
-        result += bit * (1 << i)
+def _overflow_flag(word1: int, word2: int, result: int, width: int) -> int:
+    """Переполнение при сложении: слагаемые одного знака, а сумма другого"""
+    sign = word_params(width)[1]
+    return 1 if ~(word1 ^ word2) & (word1 ^ result) & sign else 0
 
-    if is_negative:
-        result = -(result + 1)
+def operand_word(num: BinaryNumber, width: int) -> int:
+    """
+    Дополнительный код числа в разрядности width как целое, без изменения самого числа:
+    код собственной разрядности числа расширяется знаком или усекается.
+    """
+    return to_signed(num.decimal_num, num.bits) & word_params(width)[0]
 
-    return result
+def sum_with_flags(num1: BinaryNumber, num2: BinaryNumber, width: int | None = None,
+                   adder: str | None = None) -> tuple[list[int], int, int]:
+    """
+    Складываем 2 числа в дополнительном коде.
+    Возвращает (сумма, перенос из старшего разряда, флаг переполнения).
+    Операнды сначала приводятся к разрядности width, поэтому все способы сложения дают одно и то же.
+    adder выбирает схему сумматора из adders.ARCHITECTURES вместо цикла с переносом;
+    её метрики пишутся отдельно, как операция sum_with_flags[<схема>].
+    """
+    if width is None:
+        width = num1.bits
+    word_mask = word_params(width)[0]
+    word1 = operand_word(num1, width)
+    word2 = operand_word(num2, width)
+    recorder = current_recorder()
 
-def sum_in_compl_code(num1: BinaryNumber, num2: BinaryNumber) -> list[int]:
-    """Складываем 2 числа в дополнительном коде"""
-    compl_1 = num1.compl_code[::-1]
-    compl_2 = num2.compl_code[::-1]
+    if adder is not None:
+        result = adder_add(word1, word2, width, adder)
+        if recorder is not None:
+            # метрики выбранной схемы: площадь и глубина сети и задержка на этих операндах
+            net = adder_netlist(adder, width)
+            recorder.record(f'sum_with_flags[{adder}]', {'gates': net.cost.gates, 'depth': net.cost.depth,
+                                                         'delay': net.settle_time(word1, word2)})
+        return int_to_bits(result.sum, width), result.carry_out, result.overflow
+
+    if isinstance(num1, _PACKED_TYPES) and isinstance(num2, _PACKED_TYPES):
+        total = word1 + word2
+        result = total & word_mask
+        if recorder is not None:
+            recorder.record('sum_with_flags', {'word_additions': 1})
+        return int_to_bits(result, width), total >> width, _overflow_flag(word1, word2, result, width)
+
+    compl_1 = int_to_bits(word1, width)[::-1]
+    compl_2 = int_to_bits(word2, width)[::-1]
+    chain = CarryChain() if recorder is not None else None
     overflow = 0
     res = []
     for buff in zip(compl_1, compl_2):
+        if chain is not None:
+            chain.step(buff[0], buff[1], overflow)
         value = buff[0] + buff[1] + overflow
         overflow = value // 2
         res.append(value % 2)
     res = res[::-1]
-    return res[:32]  # Ограничиваем длину до 32 бит
+    if recorder is not None:
+        recorder.record('sum_with_flags', {'full_adders': len(res), 'carry_chain': chain.longest, 'iterations': len(res)})
+    return res, overflow, _overflow_flag(word1, word2, bits_to_int(res), width)
 
-def subtraction(num1: BinaryNumber, num2: BinaryNumber) -> list[int]:
-    """Ищет разность, отрицая отнимаемое число"""
-    convert_all_tipes(num2)
-    num2.negation_of_decimal_num()
-    convert_all_tipes(num1)
-    convert_all_tipes(num2)
-    substr = sum_in_compl_code(num1, num2)
-    num2.negation_of_decimal_num()
-    convert_all_tipes(num2)
-    return substr
+def sum_in_compl_code(num1: BinaryNumber, num2: BinaryNumber, width: int | None = None,
+                      adder: str | None = None) -> list[int]:
+    """Складываем 2 числа в дополнительном коде"""
+    return sum_with_flags(num1, num2, width, adder)[0]
 
-def binary_to_decimal(bits: list[int]) -> int:
+def subtraction_with_flags(num1: BinaryNumber, num2: BinaryNumber, width: int | None = None) -> tuple[list[int], int, int]:
     """
-    Переводит число в прямом двоичном коде (список из 0 и 1) в десятичное число.
-    Работает с битами произвольной длины, дополняя нули слева, если нужно.
+    Ищет разность, отрицая отнимаемое число.
+    Возвращает (разность, перенос из старшего разряда, флаг переполнения).
+    Операнды не меняются: работа идёт с их словами разрядности width.
     """
-    result = 0
-    bits = [0] * (32 - len(bits)) + bits if len(bits) < 32 else bits[-32:]
+    if width is None:
+        width = num1.bits
+    word1 = operand_word(num1, width)
+    word2 = operand_word(num2, width)
+    negative = type(num2)(-to_signed(word2, width), width)
+    substr, carry, _ = sum_with_flags(num1, negative, width)
+    # Флаг считается по исходному вычитаемому: a - b переполняется,
+    # если знаки a и b различны, а знак разности не совпадает со знаком a
+    sign = word_params(width)[1]
+    overflow = 1 if (word1 ^ word2) & (word1 ^ bits_to_int(substr)) & sign else 0
+    return substr, carry, overflow
 
-    if bits[0] == 1:
-        sign = -1
-        bits = bits[:]  # Создаем копию, чтобы не менять оригинал
-        bits[0] = 0
-    else:
-        sign = 1
-
-    for i in range(32):
-        bit = bits[31 - i]
-        result += bit * (1 << i)
+def subtraction(num1: BinaryNumber, num2: BinaryNumber, width: int | None = None) -> list[int]:
+    """Ищет разность, отрицая отнимаемое число"""
+    return subtraction_with_flags(num1, num2, width)[0]
 
-    return sign * result
+def binary_to_decimal(bits: list[int], width: int = 32) -> int:
+    """
+    Переводит число в прямом двоичном коде (список из 0 и 1) в десятичное число.
+    Работает с битами произвольной длины, дополняя нули слева до разрядности width
+    или оставляя width младших бит.
+    """
+    bits = [0] * (width - len(bits)) + list(bits) if len(bits) < width else bits[-width:]
+    magnitude = bits_to_int(bits[1:])
+    return -magnitude if bits[0] == 1 else magnitude
 
-def multiplication(num1: BinaryNumber, num2: BinaryNumber) -> list[int]:
-    """Перемножает 2 числа"""
-    convert_all_tipes(num1)
-    convert_all_tipes(num2)
-    num1_bits = num1.binary_num[::-1]
-    num2_bits = num2.binary_num[::-1]
-    res = [0] * 32
+def multiplication(num1: BinaryNumber, num2: BinaryNumber, width: int | None = None) -> list[int]:
+    """Перемножает 2 числа, результат в прямом коде разрядности width; операнды не меняются"""
+    if width is None:
+        width = num1.bits
+    num1_bits = int_to_bits(abs(num1.decimal_num), width)[::-1]
+    num2_bits = int_to_bits(abs(num2.decimal_num), width)[::-1]
+    recorder = current_recorder()
+    adders = shifts = longest = 0
+    res = [0] * width
     for i, bit in enumerate(num2_bits):
         if bit == 1:
             shifted_num1 = [0] * i + num1_bits
             overflow = 0
             temp_res = res[:]
-            for j in range(32):
+            chain = CarryChain() if recorder is not None else None
+            for j in range(width):
                 bit1 = temp_res[j] if j < len(temp_res) else 0
                 bit2 = shifted_num1[j] if j < len(shifted_num1) else 0
+                if chain is not None:
+                    chain.step(bit1, bit2, overflow)
                 value = bit1 + bit2 + overflow
                 res[j] = value % 2
                 overflow = value // 2
+            if chain is not None:
+                shifts += 1
+                adders += width
+                longest = max(longest, chain.longest)
+    if recorder is not None:
+        recorder.record('multiplication', {'full_adders': adders, 'carry_chain': longest, 'shifts': shifts,
+                                           'iterations': len(num2_bits)})
     res = res[::-1]
     if (num1.sign_bit == [1] and num2.sign_bit == [0]) or (num1.sign_bit == [0] and num2.sign_bit == [1]):
         res[0] = 1
@@ -104,10 +167,10 @@ def multiplication(num1: BinaryNumber, num2: BinaryNumber) -> list[int]:
         res[0] = 0
     return res
 
-def binary_fraction_to_decimal(binary_result: tuple) -> float:
+def binary_fraction_to_decimal(binary_result: tuple, frac_bits: int = 5) -> float:
     """
     Переводит двоичное дробное число в формате ([целая часть, None, дробная часть], знак)
-    в десятичное дробное число.
+    в десятичное дробное число. Дробная часть должна содержать ровно frac_bits бит.
     """
     binary, sign = binary_result
     if sign not in (0, 1):
@@ -117,8 +180,8 @@ def binary_fraction_to_decimal(binary_result: tuple) -> float:
     separator_index = binary.index(None)
     integer_part = binary[:separator_index]
     fractional_part = binary[separator_index + 1:]
-    if len(fractional_part) != 5:
-        raise ValueError("Дробная часть должна содержать ровно 5 бит")
+    if len(fractional_part) != frac_bits:
+        raise ValueError(f"Дробная часть должна содержать ровно {frac_bits} бит")
     integer_value = 0
     for i, bit in enumerate(integer_part):
         if bit not in (0, 1):
@@ -136,45 +199,60 @@ def division(num1: 'BinaryNumber', num2: 'BinaryNumber'):
     """
     Выполняет деление двух чисел в двоичной форме (BinaryNumber).
     Возвращает кортеж: (список бит [целая часть, None, дробная часть (5 бит)], знак результата)
+    Остатки сравниваются как беззнаковые, поэтому разрядность операндов не ограничена.
     """
     convert_all_tipes(num1)
     convert_all_tipes(num2)
     sign1 = num1.sign_bit[0]
     sign2 = num2.sign_bit[0]
     result_sign = 0 if sign1 == sign2 else 1
-    num1_abs = BinaryNumber(abs(num1.decimal_num))
-    num2_abs = BinaryNumber(abs(num2.decimal_num))
-    convert_all_tipes(num1_abs)
-    convert_all_tipes(num2_abs)
-    num2_bits = list(dropwhile(lambda x: x == 0, num2_abs.binary_num))
+    # Прямой код уже хранит модуль числа
+    num2_bits = list(dropwhile(lambda x: x == 0, num2.binary_num))
     if not num2_bits:
         raise ValueError("Деление на ноль невозможно")
-    num1_bits = list(dropwhile(lambda x: x == 0, num1_abs.binary_num))
-    if len(num1_bits) < len(num2_bits) or binary_to_decimal(num1_bits) < binary_to_decimal(num2_bits):
+    num1_bits = list(dropwhile(lambda x: x == 0, num1.binary_num))
+    recorder = current_recorder()
+    metrics = {'full_adders': 0, 'carry_chain': 0, 'shifts': 0, 'normalisation': 0}
+
+    def subtract(current: list[int]) -> list[int]:
+        minuend, divisor = bits_to_int(current), bits_to_int(num2_bits)
+        if recorder is not None:
+            # вычитание как сложение с инверсией делителя и входным переносом
+            width = len(current)
+            metrics['full_adders'] += width
+            metrics['carry_chain'] = max(metrics['carry_chain'],
+                                         carry_chain(minuend, ~divisor & mask(width), width, 1))
+        return list(dropwhile(lambda x: x == 0, dec_to_bin_positive(minuend - divisor)))
+
+    if len(num1_bits) < len(num2_bits) or bits_to_int(num1_bits) < bits_to_int(num2_bits):
         result = [0]
         current = num1_bits
     else:
         current = []
         result = []
         for bit in num1_bits:
+            metrics['shifts'] += 1
             current.append(bit)
             current = list(dropwhile(lambda x: x == 0, current))
-            if binary_to_decimal(current) >= binary_to_decimal(num2_bits):
+            if bits_to_int(current) >= bits_to_int(num2_bits):
                 result.append(1)
-                current = dec_to_bin_positive(binary_to_decimal(current) - binary_to_decimal(num2_bits))
-                current = list(dropwhile(lambda x: x == 0, current))
+                current = subtract(current)
             else:
                 result.append(0)
     result.append(None)
     for _ in range(5):
+        metrics['shifts'] += 1
         current.append(0)
         current = list(dropwhile(lambda x: x == 0, current))
-        if binary_to_decimal(current) >= binary_to_decimal(num2_bits):
+        if bits_to_int(current) >= bits_to_int(num2_bits):
             result.append(1)
-            current = dec_to_bin_positive(binary_to_decimal(current) - binary_to_decimal(num2_bits))
-            current = list(dropwhile(lambda x: x == 0, current))
+            current = subtract(current)
         else:
             result.append(0)
     while len(result) > 1 and result[0] == 0 and result[1] != None:
         result.pop(0)
+        metrics['normalisation'] += 1
+    if recorder is not None:
+        metrics['iterations'] = metrics['shifts']
+        recorder.record('division', metrics)
     return result, result_sign
\ No newline at end of file
@@ -57,9 +57,9 @@ class TestBinaryCodes(unittest.TestCase):
 
         self.assertEqual(self.binary_num1.decimal_num, -5)
         self.assertEqual(self.binary_num1.sign_bit, [1])
-        self.assertEqual(self.binary_num1.binary_num, [])
-        self.assertEqual(self.binary_num1.reverse_code, [])
-        self.assertEqual(self.binary_num1.compl_code, [])
+        self.assertEqual(self.binary_num1.binary_num, [0] * 29 + [1, 0, 1])
+        self.assertEqual(self.binary_num1.reverse_code, [1] * 29 + [0, 1, 0])
+        self.assertEqual(self.binary_num1.compl_code, [1] * 29 + [0, 1, 1])
 
         self.assertEqual(self.binary_num2.decimal_num, 5)
         self.assertEqual(self.binary_num2.sign_bit, [0])
@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from src.adders import ARCHITECTURES, add, add_batch, cost, netlist, trace_stats
+from src.binary_codes import BinaryNumber
+from src.utils import sum_with_flags
+
+
+class TestAdders(unittest.TestCase):
+
+    def test_all_architectures_add_correctly(self):
+        rng = random.Random(9)
+        for width in (1, 2, 3, 7, 8, 16, 33, 64, 128):
+            values1 = [rng.getrandbits(width) for _ in range(100)] + [(1 << width) - 1, 0]
+            values2 = [rng.getrandbits(width) for _ in range(100)] + [1, 0]
+            for architecture in ARCHITECTURES:
+                for carry_in in (0, 1):
+                    results = add_batch(values1, values2, width, architecture, carry_in)
+                    for a, b, result in zip(values1, values2, results):
+                        total = a + b + carry_in
+                        self.assertEqual((result.sum, result.carry_out), (total & ((1 << width) - 1), total >> width),
+                                         (architecture, width, a, b, carry_in))
+
+    def test_overflow_flag(self):
+        self.assertEqual(add(0x7F, 0x01, 8, 'kogge_stone'), (0x80, 0, 1))
+        self.assertEqual(add(0xFF, 0x01, 8, 'brent_kung'), (0x00, 1, 0))
+        self.assertEqual(add(0x80, 0x80, 8, 'carry_select'), (0x00, 1, 1))
+
+    def test_cost(self):
+        self.assertEqual(cost('ripple', 8), (17, 40)) # 5 вентилей на разряд, 2 уровня на разряд переноса
+        for width in (32, 128):
+            depths = {architecture: cost(architecture, width).depth for architecture in ARCHITECTURES}
+            self.assertEqual(min(depths, key=depths.get), 'kogge_stone')
+            self.assertEqual(max(depths, key=depths.get), 'ripple')
+            self.assertLess(cost('brent_kung', width).gates, cost('kogge_stone', width).gates)
+        self.assertIs(netlist('ripple', 8), netlist('ripple', 8))
+        with self.assertRaises(ValueError):
+            cost('wallace', 8)
+
+    def test_settle_time(self):
+        ripple = netlist('ripple', 8)
+        self.assertLess(ripple.settle_time(0, 0), ripple.cost.depth)
+        # перенос порождается в нулевом разряде и проходит через все остальные
+        self.assertEqual(ripple.settle_time(0xFF, 0x01), ripple.cost.depth - 1)
+        self.assertEqual(ripple.settle_time(0xFF, 0x00, carry_in=1), ripple.cost.depth)
+        stats = trace_stats([(0xFF, 0x01), (0x0F, 0x10)], 8, ['ripple', 'kogge_stone'])
+        self.assertEqual([item.architecture for item in stats], ['ripple', 'kogge_stone'])
+        for item in stats:
+            self.assertLessEqual(item.max_delay, item.depth)
+
+    def test_sum_with_flags_adder(self):
+        for a, b in ((5, 7), (-100, -100), (127, 1), (-3, 2)):
+            expected = sum_with_flags(BinaryNumber(a, 8), BinaryNumber(b, 8))
+            for architecture in ARCHITECTURES:
+                self.assertEqual(sum_with_flags(BinaryNumber(a, 8), BinaryNumber(b, 8), adder=architecture), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
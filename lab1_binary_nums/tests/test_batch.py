@@ -0,0 +1,96 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.binary_codes import BinaryNumber
+from src.batch import batch_sum, batch_subtraction, batch_multiplication, to_words, words_to_bits
+from src.utils import (
+    convert_all_tipes,
+    sum_with_flags,
+    subtraction,
+    multiplication,
+    twos_complement_to_decimal,
+    binary_to_decimal
+)
+
+
+def _operands(width, count=200, seed=0):
+    rng = random.Random(seed)
+    low, high = -2 ** (width - 1), 2 ** (width - 1) - 1
+    edges = [0, 1, -1, low, high, low + 1, high - 1]
+    values1 = edges + [rng.randint(low, high) for _ in range(count)]
+    values2 = edges[::-1] + [rng.randint(low, high) for _ in range(count)]
+    return values1, values2
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_sum_matches_scalar(self):
+        for width in (8, 16, 32, 64):
+            values1, values2 = _operands(width)
+            result = batch_sum(np.array(values1), np.array(values2), width)
+            for i, (a, b) in enumerate(zip(values1, values2)):
+                num1, num2 = BinaryNumber(a, width), BinaryNumber(b, width)
+                convert_all_tipes(num1)
+                convert_all_tipes(num2)
+                bits, _, overflow = sum_with_flags(num1, num2)
+                self.assertEqual(result.bits[i].tolist(), bits)
+                self.assertEqual(result.decimal[i], twos_complement_to_decimal(bits))
+                self.assertEqual(result.overflow[i], bool(overflow))
+
+    def test_subtraction_matches_scalar(self):
+        for width in (8, 32, 64):
+            values1, values2 = _operands(width, seed=1)
+            result = batch_subtraction(np.array(values1), np.array(values2), width)
+            for i, (a, b) in enumerate(zip(values1, values2)):
+                bits = subtraction(BinaryNumber(a, width), BinaryNumber(b, width))
+                self.assertEqual(result.bits[i].tolist(), bits)
+                self.assertEqual(result.decimal[i], twos_complement_to_decimal(bits))
+
+    def test_multiplication_matches_scalar(self):
+        for width in (8, 16, 32, 64):
+            values1, values2 = _operands(width, seed=2)
+            result = batch_multiplication(np.array(values1), np.array(values2), width)
+            for i, (a, b) in enumerate(zip(values1, values2)):
+                bits = multiplication(BinaryNumber(a, width), BinaryNumber(b, width))
+                self.assertEqual(result.bits[i].tolist(), bits)
+                self.assertEqual(result.decimal[i], binary_to_decimal(bits, width))
+                self.assertEqual(result.overflow[i], abs(a * b) >= 2 ** (width - 1))
+
+    def test_bit_matrix_input(self):
+        values = np.array([5, -5, 0, 127, -128])
+        matrix = words_to_bits(to_words(values, 8), 8)
+        self.assertEqual(matrix[1].tolist(), [1, 1, 1, 1, 1, 0, 1, 1])
+        result = batch_sum(matrix, matrix, 8)
+        self.assertEqual(result.decimal.tolist(), [10, -10, 0, -2, 0])
+        self.assertEqual(result.overflow.tolist(), [False, False, False, True, True])
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            batch_sum(np.array([128]), np.array([1]), 8)
+        with self.assertRaises(ValueError):
+            batch_sum(np.array([1, 2]), np.array([1]), 8)
+        with self.assertRaises(ValueError):
+            batch_sum(np.array([1]), np.array([1]), 65)
+        with self.assertRaises(ValueError):
+            batch_sum(np.array([0.5]), np.array([1]), 8)
+
+    def test_word_range_64(self):
+        self.assertEqual(to_words([-2 ** 63, 2 ** 63 - 1, -1], 64).tolist(), [2 ** 63, 2 ** 63 - 1, 2 ** 64 - 1])
+        self.assertEqual(to_words(np.array([2 ** 63 - 1], dtype=np.uint64), 64).tolist(), [2 ** 63 - 1])
+        for operands in ([2 ** 63], [-2 ** 63 - 1], [2 ** 70], np.array([2 ** 63], dtype=np.uint64)):
+            with self.subTest(operands=operands), self.assertRaises(ValueError):
+                to_words(operands, 64)
+        with self.assertRaises(ValueError):
+            to_words(np.array([128], dtype=np.uint8), 8)
+
+    def test_bit_matrix_values(self):
+        with self.assertRaises(ValueError):
+            to_words(np.array([[0, 2, 0, 1]]), 4)
+        with self.assertRaises(ValueError):
+            to_words(np.array([[0, -1, 0, 1]]), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import io
+import json
+import unittest
+
+from scripts.main import run_batch, process_line
+
+
+def _strict_loads(line: str):
+    """json.loads без расширений Infinity и NaN"""
+    def reject(constant):
+        raise ValueError(f'Недопустимая в JSON константа: {constant}')
+    return json.loads(line, parse_constant=reject)
+
+
+class TestBatchMode(unittest.TestCase):
+
+    def test_csv_lines(self):
+        self.assertEqual(process_line('add,-17,42', 'csv'), 'add,-17,42,25')
+        self.assertEqual(process_line('sub, 5, 7', 'csv'), 'sub,5,7,-2')
+        self.assertEqual(process_line('mul,-5,5', 'csv'), 'mul,-5,5,-25')
+        self.assertEqual(process_line('div,7,3', 'csv'), 'div,7,3,2.3125')
+        self.assertEqual(process_line('fadd,1.5,2.25', 'csv'), 'fadd,1.5,2.25,3.75')
+        self.assertTrue(process_line('div,1,0', 'csv').startswith('div,1,0,error: '))
+        self.assertTrue(process_line('pow,1,2', 'csv').startswith('pow,1,2,error: '))
+
+    def test_float_sum_uses_softfloat(self):
+        self.assertEqual(process_line('fadd,-1.5,0.25', 'csv'), 'fadd,-1.5,0.25,-1.25')
+        self.assertEqual(process_line('fadd,inf,1', 'csv'), 'fadd,inf,1,inf')
+        self.assertEqual(process_line('fadd,1e39,1', 'csv'), 'fadd,1e39,1,inf') # переполнение binary32
+        record = _strict_loads(process_line('{"op": "fadd", "a": 1e999, "b": 1}', 'jsonl'))
+        self.assertEqual(record, {'op': 'fadd', 'a': 'inf', 'b': 1, 'result': 'inf'})
+
+    def test_jsonl_non_finite_results_are_strict_json(self):
+        record = _strict_loads(process_line('{"op": "fadd", "a": "3e38", "b": "3e38"}', 'jsonl')) # переполнение
+        self.assertEqual(record['result'], 'inf')
+        record = _strict_loads(process_line('{"op": "fadd", "a": "-3e38", "b": -3e38}', 'jsonl'))
+        self.assertEqual(record['result'], '-inf')
+        record = _strict_loads(process_line('{"op": "fadd", "a": "inf", "b": "-inf"}', 'jsonl'))
+        self.assertEqual(record['result'], 'nan')
+        record = _strict_loads(process_line('{"op": "fadd", "a": NaN, "b": 1}', 'jsonl'))
+        self.assertEqual((record['a'], record['result']), ('nan', 'nan'))
+
+    def test_operands_out_of_range(self):
+        self.assertTrue(process_line('mul,99999999999,2', 'csv').startswith('mul,99999999999,2,error: '))
+        self.assertTrue(process_line('mul,65536,65536', 'csv').startswith('mul,65536,65536,error: '))
+        self.assertTrue(process_line('add,2147483648,0', 'csv').startswith('add,2147483648,0,error: '))
+        self.assertEqual(process_line('add,2147483647,-2147483648', 'csv'), 'add,2147483647,-2147483648,-1')
+
+    def test_bad_line_does_not_stop_batch(self):
+        target = io.StringIO()
+        self.assertEqual(run_batch(io.StringIO('add,1,2\nfadd,x,1\nadd,3,4\n'), target), 3)
+        output = target.getvalue().splitlines()
+        self.assertEqual([output[0], output[2]], ['add,1,2,3', 'add,3,4,7'])
+        self.assertIn('error: ', output[1])
+
+    def test_jsonl_lines(self):
+        record = json.loads(process_line('{"op": "add", "a": -17, "b": 42}', 'jsonl'))
+        self.assertEqual(record, {'op': 'add', 'a': -17, 'b': 42, 'result': 25})
+        record = json.loads(process_line('{"op": "add", "a": 1}', 'jsonl'))
+        self.assertIn('error', record)
+
+    def test_run_batch_streams_in_chunks(self):
+        lines = ['# журнал операций', ''] + [f'add,{i},{-2 * i}' for i in range(25)]
+        target = io.StringIO()
+        processed = run_batch(io.StringIO('\n'.join(lines)), target, chunk_size=4)
+        self.assertEqual(processed, 25)
+        output = target.getvalue().splitlines()
+        self.assertEqual(output[3], 'add,3,-6,-3')
+        self.assertEqual(len(output), 25)
+
+    def test_run_batch_process_pool_keeps_order(self):
+        lines = [json.dumps({'op': 'mul', 'a': i, 'b': 3}) for i in range(40)]
+        target = io.StringIO()
+        run_batch(io.StringIO('\n'.join(lines)), target, chunk_size=7, workers=2)
+        results = [json.loads(line)['result'] for line in target.getvalue().splitlines()]
+        self.assertEqual(results, [3 * i for i in range(40)])
+
+    def test_empty_input(self):
+        target = io.StringIO()
+        self.assertEqual(run_batch(io.StringIO(''), target), 0)
+        self.assertEqual(target.getvalue(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
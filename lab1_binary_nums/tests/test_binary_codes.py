@@ -4,41 +4,43 @@ from src.binary_codes import BinaryNumber
 class TestBinaryNumber(unittest.TestCase):
     
     def test_init_positive_number(self):
-        """Тестирование инициализации с положительным числом."""
+        """Тестирование инициализации с положительным числом: коды строятся при обращении."""
         bn = BinaryNumber(42)
+        code = [0] * 26 + [1, 0, 1, 0, 1, 0]
         self.assertEqual(bn.decimal_num, 42)
         self.assertEqual(bn.sign_bit, [0])
-        self.assertEqual(bn.binary_num, [])
-        self.assertEqual(bn.reverse_code, [])
-        self.assertEqual(bn.compl_code, [])
+        self.assertEqual(bn.binary_num, code)
+        self.assertEqual(bn.reverse_code, code)
+        self.assertEqual(bn.compl_code, code)
 
     def test_init_negative_number(self):
-        """Тестирование инициализации с отрицательным числом."""
+        """Тестирование инициализации с отрицательным числом: коды строятся при обращении."""
         bn = BinaryNumber(-42)
         self.assertEqual(bn.decimal_num, -42)
-        self.assertEqual(bn.sign_bit, [0])
-        self.assertEqual(bn.binary_num, [])
-        self.assertEqual(bn.reverse_code, [])
-        self.assertEqual(bn.compl_code, [])
+        self.assertEqual(bn.sign_bit, [1])
+        self.assertEqual(bn.binary_num, [0] * 26 + [1, 0, 1, 0, 1, 0])
+        self.assertEqual(bn.reverse_code, [1] * 26 + [0, 1, 0, 1, 0, 1])
+        self.assertEqual(bn.compl_code, [1] * 26 + [0, 1, 0, 1, 1, 0])
 
     def test_init_zero(self):
         """Тестирование инициализации с нулем."""
         bn = BinaryNumber(0)
         self.assertEqual(bn.decimal_num, 0)
         self.assertEqual(bn.sign_bit, [0])
-        self.assertEqual(bn.binary_num, [])
-        self.assertEqual(bn.reverse_code, [])
-        self.assertEqual(bn.compl_code, [])
+        self.assertEqual(bn.binary_num, [0] * 32)
+        self.assertEqual(bn.reverse_code, [0] * 32)
+        self.assertEqual(bn.compl_code, [0] * 32)
 
     def test_negation_positive_to_negative(self):
-        """Тестирование инверсии с положительного на отрицательное число."""
+        """Тестирование инверсии с положительного на отрицательное число: кэш кодов сбрасывается."""
         bn = BinaryNumber(42)
+        self.assertEqual(bn.compl_code, [0] * 26 + [1, 0, 1, 0, 1, 0])
         bn.negation_of_decimal_num()
         self.assertEqual(bn.decimal_num, -42)
         self.assertEqual(bn.sign_bit, [1])
-        self.assertEqual(bn.binary_num, [])
-        self.assertEqual(bn.reverse_code, [])
-        self.assertEqual(bn.compl_code, [])
+        self.assertEqual(bn.binary_num, [0] * 26 + [1, 0, 1, 0, 1, 0])
+        self.assertEqual(bn.reverse_code, [1] * 26 + [0, 1, 0, 1, 0, 1])
+        self.assertEqual(bn.compl_code, [1] * 26 + [0, 1, 0, 1, 1, 0])
 
     def test_negation_negative_to_positive(self):
         """Тестирование инверсии с отрицательного на положительное число."""
@@ -47,9 +49,9 @@ class TestBinaryNumber(unittest.TestCase):
         bn.negation_of_decimal_num()
         self.assertEqual(bn.decimal_num, 42)
         self.assertEqual(bn.sign_bit, [0])
-        self.assertEqual(bn.binary_num, [])
-        self.assertEqual(bn.reverse_code, [])
-        self.assertEqual(bn.compl_code, [])
+        self.assertEqual(bn.binary_num, [0] * 26 + [1, 0, 1, 0, 1, 0])
+        self.assertEqual(bn.reverse_code, [0] * 26 + [1, 0, 1, 0, 1, 0])
+        self.assertEqual(bn.compl_code, [0] * 26 + [1, 0, 1, 0, 1, 0])
 
     def test_negation_zero(self):
         """Тестирование инверсии нуля (должен остаться нулем)."""
@@ -57,9 +59,29 @@ class TestBinaryNumber(unittest.TestCase):
         bn.negation_of_decimal_num()
         self.assertEqual(bn.decimal_num, 0)
         self.assertEqual(bn.sign_bit, [1])
-        self.assertEqual(bn.binary_num, [])
-        self.assertEqual(bn.reverse_code, [])
-        self.assertEqual(bn.compl_code, [])
+        self.assertEqual(bn.binary_num, [0] * 32)
+        self.assertEqual(bn.sign_bit, [0])
+        self.assertEqual(bn.compl_code, [0] * 32)
+
+    def test_negated_does_not_mutate(self):
+        """negated() возвращает новое число и не трогает исходное."""
+        bn = BinaryNumber(-42, 8)
+        compl = bn.compl_code
+        negated = bn.negated()
+        self.assertEqual(bn.decimal_num, -42)
+        self.assertIs(bn.compl_code, compl)
+        self.assertEqual(negated.decimal_num, 42)
+        self.assertEqual(negated.bits, 8)
+        self.assertEqual(negated.compl_code, [0, 0, 1, 0, 1, 0, 1, 0])
+
+    def test_codes_are_cached(self):
+        """Повторное преобразование возвращает закэшированные коды."""
+        bn = BinaryNumber(-5)
+        compl = bn.compl_code
+        self.assertIs(bn.rev_code_to_compl_code(), compl)
+        self.assertIs(bn.dec_to_bin(), bn.binary_num)
+        self.assertEqual(bn.dec_to_bin(bits=8), [0, 0, 0, 0, 0, 1, 0, 1])
+        self.assertEqual(bn.compl_code, [1, 1, 1, 1, 1, 0, 1, 1])
 
     def test_dec_to_bin_positive_number(self):
         """Тестирование преобразования десятичного числа в двоичное для положительного числа."""
@@ -154,6 +176,24 @@ class TestBinaryNumber(unittest.TestCase):
         self.assertEqual(result, expected)
         self.assertEqual(bn.compl_code, expected)
 
+    def test_compl_code_uses_word_width(self):
+        """Дополнительный код строится в разрядности слова, а не в 32 битах."""
+        for bits in (8, 16, 64, 128):
+            bn = BinaryNumber(-1, bits)
+            bn.dec_to_bin()
+            bn.bin_to_reverse_code()
+            self.assertEqual(bn.rev_code_to_compl_code(), [1] * bits)
+            self.assertEqual(bn.bits, bits)
+
+    def test_overflow_flag(self):
+        """Флаг переполнения для значений вне диапазона разрядности."""
+        self.assertFalse(BinaryNumber(127, 8).overflow)
+        self.assertFalse(BinaryNumber(-128, 8).overflow)
+        self.assertTrue(BinaryNumber(128, 8).overflow)
+        self.assertTrue(BinaryNumber(-2 ** 63 - 1, 64).overflow)
+        with self.assertRaises(ValueError):
+            BinaryNumber(1, 0)
+
     def test_properties_immutability(self):
         """Тестирование невозможности изменения свойств напрямую."""
         bn = BinaryNumber(42)
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.bitops import int_to_bits, bits_to_int, to_signed, fits_in, word_params
+
+
+class TestBitops(unittest.TestCase):
+
+    def test_int_to_bits_matches_reference(self):
+        rng = random.Random(9)
+        for length in (1, 4, 8, 9, 16, 32, 64, 100):
+            for _ in range(50):
+                value = rng.getrandbits(rng.randint(0, 110))
+                with self.subTest(value=value, length=length):
+                    expected = [int(c) for c in format(value, f'0{length}b')]
+                    self.assertEqual(int_to_bits(value, length), expected)
+                    self.assertEqual(bits_to_int(expected), value)
+
+    def test_edge_cases(self):
+        self.assertEqual(int_to_bits(0, 0), [])
+        self.assertEqual(int_to_bits(0, 3), [0, 0, 0])
+        self.assertEqual(int_to_bits(5, 2), [1, 0, 1]) # без обрезки
+        self.assertEqual(bits_to_int([]), 0)
+        self.assertEqual(bits_to_int([0, 0, 1]), 1)
+
+    def test_bits_to_int_sequences(self):
+        bits = [1, 0, 1, 1, 0, 0, 1, 0, 1]
+        for sequence in (tuple(bits), np.array(bits), np.array(bits, dtype=np.uint8), np.array(bits, dtype=np.int64),
+                         [True, False, True, True, False, False, True, False, True]):
+            with self.subTest(sequence=sequence):
+                self.assertEqual(bits_to_int(sequence), 0b101100101)
+        self.assertEqual(bits_to_int(np.array([], dtype=np.uint8)), 0)
+        # значения кроме 0 и 1 складываются с весами разрядов, а не теряются
+        self.assertEqual(bits_to_int([1, 48, 49]), 4 + 48 * 2 + 49)
+        self.assertEqual(bits_to_int([2, 0]), 4)
+        self.assertEqual(bits_to_int([300, 1]), 601)
+
+    def test_word_helpers(self):
+        self.assertEqual(word_params(8), (0xFF, 0x80))
+        self.assertEqual(word_params(12), (0xFFF, 0x800))
+        self.assertEqual(to_signed(0xFF, 8), -1)
+        self.assertEqual(to_signed(0x17F, 8), 127)
+        self.assertTrue(fits_in(-128, 8))
+        self.assertFalse(fits_in(128, 8))
+        with self.assertRaises(ValueError):
+            word_params(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import random
+import unittest
+
+from src.binary_codes import BinaryNumber
+from src.bitslice import transpose, untranspose, bitsliced_add, bitsliced_subtraction, bitsliced_negate
+from src.utils import convert_all_tipes, sum_with_flags, twos_complement_to_decimal
+
+
+class TestBitslice(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(4)
+        self.width = 16
+        edges = [0, 1, -1, -2 ** 15, 2 ** 15 - 1]
+        self.values1 = edges + [rng.randint(-2 ** 15, 2 ** 15 - 1) for _ in range(95)]
+        self.values2 = edges[::-1] + [rng.randint(-2 ** 15, 2 ** 15 - 1) for _ in range(95)]
+
+    def test_transpose_round_trip(self):
+        words = [0b1010, 0b0110, 0b1111]
+        slices = transpose(words, 4)
+        self.assertEqual(slices, [0b100, 0b111, 0b110, 0b101])
+        self.assertEqual(untranspose(slices, 3), words)
+
+    def test_add_matches_ripple_adder(self):
+        result = bitsliced_add(self.values1, self.values2, self.width)
+        for lane, (a, b) in enumerate(zip(self.values1, self.values2)):
+            num1, num2 = BinaryNumber(a, self.width), BinaryNumber(b, self.width)
+            convert_all_tipes(num1)
+            convert_all_tipes(num2)
+            bits, carry, overflow = sum_with_flags(num1, num2)
+            self.assertEqual(result.sums[lane], twos_complement_to_decimal(bits))
+            self.assertEqual(result.carry_out[lane], carry)
+            self.assertEqual(result.overflow[lane], overflow)
+
+    def test_subtraction(self):
+        result = bitsliced_subtraction(self.values1, self.values2, self.width)
+        for lane, (a, b) in enumerate(zip(self.values1, self.values2)):
+            expected = (a - b + 2 ** 15) % 2 ** 16 - 2 ** 15
+            self.assertEqual(result.sums[lane], expected)
+            self.assertEqual(result.overflow[lane], int(not -2 ** 15 <= a - b < 2 ** 15))
+
+    def test_negate_matches_compl_code(self):
+        values = [5, 42, 1, 2 ** 15 - 1, 0, -2 ** 15]
+        result = bitsliced_negate(values, self.width)
+        self.assertEqual(result.sums, [-5, -42, -1, -2 ** 15 + 1, 0, -2 ** 15])
+        self.assertEqual(result.overflow, [0, 0, 0, 0, 0, 1])
+        bn = BinaryNumber(-42, self.width)
+        convert_all_tipes(bn)
+        self.assertEqual(twos_complement_to_decimal(bn.compl_code), result.sums[1])
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            bitsliced_add([1, 2], [1], 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
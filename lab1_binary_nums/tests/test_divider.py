@@ -0,0 +1,57 @@
+import random
+import unittest
+from fractions import Fraction
+
+from src.binary_codes import BinaryNumber
+from src.divider import divide, DIVIDERS
+from src.utils import division, binary_fraction_to_decimal
+
+
+class TestDivider(unittest.TestCase):
+
+    def test_matches_current_division(self):
+        pairs = [(42, 2), (-42, 2), (5, 2), (0, 7), (1, 3), (-7, -3), (1000, -7), (3, 1000)]
+        for method in DIVIDERS:
+            for a, b in pairs:
+                with self.subTest(method=method, a=a, b=b):
+                    expected = division(BinaryNumber(a), BinaryNumber(b))
+                    self.assertEqual(divide(a, b, method=method).to_bit_list(), expected)
+
+    def test_wide_operands_and_precision(self):
+        rng = random.Random(6)
+        for method in DIVIDERS:
+            for _ in range(100):
+                a = rng.randint(-2 ** 200, 2 ** 200)
+                b = rng.choice([1, -1]) * rng.randint(1, 2 ** rng.randint(1, 150))
+                frac_bits = rng.randint(0, 300)
+                with self.subTest(method=method, a=a, b=b, frac_bits=frac_bits):
+                    quotient = divide(a, b, frac_bits, method)
+                    expected, remainder = divmod(abs(a) << frac_bits, abs(b))
+                    self.assertEqual(quotient.magnitude, expected)
+                    self.assertEqual(quotient.remainder, remainder)
+
+    def test_rounding(self):
+        self.assertEqual(divide(2, 3, 2).magnitude, 2) # 0.10 (отбрасывание)
+        self.assertEqual(divide(2, 3, 2, rounding=True).magnitude, 3) # 0.11
+        self.assertEqual(divide(1, 8, 2, rounding=True).magnitude, 0) # 0.005 -> к чётному
+        self.assertEqual(divide(3, 8, 2, rounding=True).magnitude, 2) # 0.011 -> к чётному
+        self.assertEqual(divide(-2, 3, 200, 'srt', rounding=True).to_fraction(),
+                         -Fraction(round(Fraction(2 << 200, 3)), 1 << 200))
+
+    def test_decimal_conversion(self):
+        quotient = divide(-5, 2, 8)
+        self.assertEqual(binary_fraction_to_decimal(quotient.to_bit_list(), 8), -2.5)
+        with self.assertRaises(ValueError):
+            binary_fraction_to_decimal(quotient.to_bit_list())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            divide(1, 0)
+        with self.assertRaises(ValueError):
+            divide(1, 2, -1)
+        with self.assertRaises(ValueError):
+            divide(1, 2, method='goldschmidt')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import random
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+import src.fixed_point as fx
+import src.fixed_point_batch as fxb
+from src.binary_codes import BinaryNumber
+from src.fixed_point import FixedPoint, QFormat
+from src.utils import division
+
+Q0_15 = QFormat(0, 15)
+Q7_8 = QFormat(7, 8)
+
+
+class TestFixedPoint(unittest.TestCase):
+
+    def test_format(self):
+        self.assertEqual((Q7_8.width, Q7_8.min_raw, Q7_8.max_raw), (16, -32768, 32767))
+        self.assertEqual(QFormat.parse('UQ8.8'), QFormat(8, 8, False))
+        self.assertEqual(QFormat(8, 8, False).max_raw, 65535)
+        self.assertEqual(str(Q0_15), 'Q0.15')
+        with self.assertRaises(ValueError):
+            QFormat.parse('Q8')
+
+    def test_rounding(self):
+        cases = {fx.ROUND_FLOOR: [-3, -3, 2, 2], fx.ROUND_TOWARD_ZERO: [-2, -2, 2, 2],
+                 fx.ROUND_HALF_UP: [-2, -2, 2, 3], fx.ROUND_NEAREST_EVEN: [-2, -2, 2, 2]}
+        for rounding, expected in cases.items():
+            # -2.5, -2.25, 2.25, 2.5
+            self.assertEqual([fx.round_shift(v, 2, rounding) for v in (-10, -9, 9, 10)], expected, rounding)
+        self.assertEqual(fx.round_div(7, -2, fx.ROUND_NEAREST_EVEN), -4)
+        with self.assertRaises(ValueError):
+            fx.round_shift(5, 1, 'stochastic')
+
+    def test_overflow_modes(self):
+        self.assertEqual(fx.q_add(30000, 30000, Q7_8), 32767)
+        self.assertEqual(fx.q_add(30000, 30000, Q7_8, fx.OVERFLOW_WRAP), 60000 - 65536)
+        with self.assertRaises(ValueError):
+            fx.q_sub(-30000, 30000, Q7_8, fx.OVERFLOW_ERROR)
+        self.assertEqual(fx.q_sub(-30000, 30000, Q7_8), -32768)
+
+    def test_arithmetic(self):
+        a = FixedPoint.from_fraction('1.5', Q7_8)
+        b = FixedPoint.from_fraction(Fraction(-1, 3), Q7_8)
+        self.assertEqual(a.raw, 384)
+        self.assertEqual(b.raw, -85) # -85.33 -> -85
+        self.assertEqual((a + b).to_fraction(), Fraction(299, 256))
+        self.assertEqual((a - b).raw, 469)
+        self.assertEqual((a * b).raw, fx.round_div(384 * -85, 256))
+        self.assertEqual((a / b).raw, fx.round_div(384 * 256, -85))
+        self.assertEqual((a * 2).raw, 768)
+        self.assertEqual(float(-a), -1.5)
+        self.assertEqual(FixedPoint.from_fraction(200, Q7_8).raw, Q7_8.max_raw)
+        with self.assertRaises(ValueError):
+            a + FixedPoint.from_fraction(1, Q0_15)
+        with self.assertRaises(ValueError):
+            a / FixedPoint(0, Q7_8)
+
+    def test_random_against_fractions(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            a, b = rng.randint(Q7_8.min_raw, Q7_8.max_raw), rng.randint(Q7_8.min_raw, Q7_8.max_raw)
+            exact = Fraction(a * b, 1 << 16)
+            raw = fx.q_mul(a, b, Q7_8, fx.ROUND_NEAREST_EVEN, fx.OVERFLOW_WRAP)
+            nearest = round(exact * 256) # round() в Python округляет к чётному
+            self.assertEqual(raw, fx.fit(nearest, Q7_8, fx.OVERFLOW_WRAP))
+
+    def test_division_interop(self):
+        result = division(BinaryNumber(-7, 8), BinaryNumber(3, 8))
+        value = FixedPoint.from_division(result, QFormat(7, 5))
+        self.assertEqual(value.to_fraction(), Fraction(-74, 32)) # -2.3125, дробь отброшена в utils.division
+        self.assertEqual(value.to_bit_list(), result)
+        self.assertEqual(FixedPoint.from_division(result, QFormat(7, 2)).raw, -9) # -2.3125 -> -2.25
+        self.assertEqual(value.convert(Q7_8).raw, -74 << 3)
+
+
+class TestFixedPointBatch(unittest.TestCase):
+
+    def test_matches_scalar(self):
+        rng = random.Random(8)
+        a = [rng.randint(Q7_8.min_raw, Q7_8.max_raw) for _ in range(3000)]
+        b = [rng.randint(Q7_8.min_raw, Q7_8.max_raw) or 1 for _ in range(3000)]
+        for rounding in fx.ROUNDING_MODES:
+            for overflow in (fx.OVERFLOW_SATURATE, fx.OVERFLOW_WRAP):
+                self.assertEqual(fxb.batch_mul(a, b, Q7_8, rounding, overflow).tolist(),
+                                 [fx.q_mul(x, y, Q7_8, rounding, overflow) for x, y in zip(a, b)])
+                self.assertEqual(fxb.batch_div(a, b, Q7_8, rounding, overflow).tolist(),
+                                 [fx.q_div(x, y, Q7_8, rounding, overflow) for x, y in zip(a, b)])
+                self.assertEqual(fxb.batch_convert(a, Q7_8, QFormat(7, 3), rounding, overflow).tolist(),
+                                 [fx.q_convert(x, Q7_8, QFormat(7, 3), rounding, overflow) for x in a])
+        self.assertEqual(fxb.batch_add(a, b, Q7_8).tolist(), [fx.q_add(x, y, Q7_8) for x, y in zip(a, b)])
+        self.assertEqual(fxb.batch_sub(a, b, Q7_8, fx.OVERFLOW_WRAP).tolist(),
+                         [fx.q_sub(x, y, Q7_8, fx.OVERFLOW_WRAP) for x, y in zip(a, b)])
+
+    def test_32_bit_formats(self):
+        rng = random.Random(32)
+        for fmt in (QFormat(0, 31), QFormat(1, 30), QFormat(16, 15), QFormat(0, 31, False)):
+            a = [fmt.min_raw, fmt.max_raw] + [rng.randint(fmt.min_raw, fmt.max_raw) for _ in range(500)]
+            b = [fmt.max_raw, fmt.min_raw or 1] + [rng.randint(fmt.min_raw, fmt.max_raw) or 1 for _ in range(500)]
+            with self.subTest(fmt=str(fmt)):
+                self.assertEqual(fxb.batch_mul(a, b, fmt).tolist(), [fx.q_mul(x, y, fmt) for x, y in zip(a, b)])
+                self.assertEqual(fxb.batch_div(a, b, fmt).tolist(), [fx.q_div(x, y, fmt) for x, y in zip(a, b)])
+        with self.assertRaises(ValueError):
+            fxb.batch_mul([1], [1], QFormat(0, 32, False)) # произведение не помещается в int64
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            fxb.batch_div([1], [0], Q7_8)
+        with self.assertRaises(ValueError):
+            fxb.batch_add([1], [1], QFormat(20, 20))
+        with self.assertRaises(ValueError):
+            fxb.batch_add([30000], [30000], Q7_8, fx.OVERFLOW_ERROR)
+        self.assertEqual(fxb.batch_mul(np.array([1 << 8]), np.array([-(1 << 8)]), Q7_8).dtype, np.int64)
+
+    def test_operands_out_of_range(self):
+        q0_31 = QFormat(0, 31)
+        calls = [
+            lambda a, b: fxb.batch_add(a, b, Q7_8),
+            lambda a, b: fxb.batch_sub(a, b, Q7_8),
+            lambda a, b: fxb.batch_mul(a, b, Q7_8),
+            lambda a, b: fxb.batch_div(a, b, Q7_8),
+            lambda a, b: fxb.batch_convert(a, Q7_8, q0_31),
+        ]
+        for values in ([Q7_8.max_raw + 1], [Q7_8.min_raw - 1], [1 << 40], [1 << 70]):
+            for call in calls:
+                with self.assertRaises(ValueError):
+                    call(values, [1])
+        with self.assertRaises(ValueError):
+            fxb.batch_mul([1], [q0_31.max_raw + 1], q0_31) # без проверки завернулось бы в int64
+        with self.assertRaises(ValueError):
+            fxb.batch_add([0], [-1], QFormat(7, 8, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import random
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from src.float_convert import convert_batch, conversion_report, convert_with_error
+from src.float_format import FloatFormat, BINARY16, BFLOAT16, BINARY32, BINARY64, FORMATS, get_format
+from src.ieee754 import IEEE754Float, add_ieee754
+from src.softfloat import (
+    float_add, float_sub, float_mul, float_div, float_sqrt, convert, is_nan, to_fraction, ROUND_TOWARD_ZERO
+)
+
+HOST_TYPES = [(BINARY16, np.float16, np.uint16), (BINARY64, np.float64, np.uint64)]
+
+
+def _random_words(fmt: FloatFormat, count: int, seed: int) -> list[int]:
+    rng = random.Random(seed)
+    words = []
+    for _ in range(count):
+        if rng.random() < 0.3:
+            exponent = rng.choice([0, 1, 2, fmt.bias, fmt.exp_max - 1])
+            words.append(((rng.getrandbits(1) << fmt.exp_bits | exponent) << fmt.man_bits) | rng.getrandbits(fmt.man_bits))
+        else:
+            words.append(rng.getrandbits(fmt.width))
+    return words
+
+
+class TestFloatFormat(unittest.TestCase):
+
+    def test_parameters(self):
+        self.assertEqual((BINARY16.bias, BINARY16.width, BINARY16.inf), (15, 16, 0x7C00))
+        self.assertEqual((BFLOAT16.bias, BFLOAT16.max_finite), (127, 0x7F7F))
+        self.assertEqual((BINARY64.bias, BINARY64.emin), (1023, -1022))
+        self.assertEqual(get_format('binary32'), BINARY32)
+        self.assertEqual(get_format('e4m3'), FloatFormat(4, 3))
+        self.assertIn('bfloat16', FORMATS)
+        with self.assertRaises(ValueError):
+            get_format('float8')
+
+    def test_operations_match_host(self):
+        for fmt, float_type, word_type in HOST_TYPES:
+            a_words, b_words = _random_words(fmt, 2000, 1), _random_words(fmt, 2000, 2)
+            a = np.array(a_words, dtype=word_type).view(float_type)
+            b = np.array(b_words, dtype=word_type).view(float_type)
+            with np.errstate(all='ignore'):
+                expected = {float_add: a + b, float_sub: a - b, float_mul: a * b, float_div: a / b}
+                roots = np.sqrt(a).view(word_type)
+            for operation, values in expected.items():
+                values = values.view(word_type)
+                for i, (x, y) in enumerate(zip(a_words, b_words)):
+                    result = operation(x, y, fmt=fmt)
+                    if is_nan(int(values[i]), fmt):
+                        self.assertTrue(is_nan(result, fmt))
+                    else:
+                        self.assertEqual(result, int(values[i]), (fmt.name, operation.__name__, hex(x), hex(y)))
+            for i, x in enumerate(a_words):
+                if not is_nan(int(roots[i]), fmt):
+                    self.assertEqual(float_sqrt(x, fmt=fmt), int(roots[i]))
+
+    def test_convert_matches_host(self):
+        words = _random_words(BINARY64, 3000, 3)
+        with np.errstate(all='ignore'):
+            singles = np.array(words, dtype=np.uint64).view(np.float64).astype(np.float32).view(np.uint32)
+            halves = np.array(words, dtype=np.uint64).view(np.float64).astype(np.float16).view(np.uint16)
+        for word, single, half in zip(words, singles, halves):
+            if is_nan(word, BINARY64):
+                continue
+            self.assertEqual(convert(word, BINARY64, BINARY32), int(single), hex(word))
+            self.assertEqual(convert(word, BINARY64, BINARY16), int(half), hex(word))
+            self.assertEqual(convert(convert(word, BINARY64, BINARY32), BINARY32, BINARY64),
+                             int(np.array(single, dtype=np.uint32).view(np.float32).astype(np.float64).view(np.uint64)))
+
+    def test_bfloat16_rounding(self):
+        for word in _random_words(BINARY32, 2000, 4):
+            if is_nan(word):
+                continue
+            expected = (word + 0x7FFF + ((word >> 16) & 1)) >> 16 # округление к чётному отбрасыванием 16 бит
+            self.assertEqual(convert(word, BINARY32, BFLOAT16), expected, hex(word))
+            self.assertEqual(convert(word, BINARY32, BFLOAT16, ROUND_TOWARD_ZERO), word >> 16)
+
+    def test_conversion_report(self):
+        one_third = 0x3EAAAAAB # ближайшее к 1/3 число binary32
+        conversions = convert_batch([0x3F800000, one_third, 0x7F7FFFFF, 0x00000001], BINARY32, BINARY16)
+        self.assertEqual([item.result for item in conversions], [0x3C00, 0x3555, 0x7C00, 0x0000])
+        self.assertEqual(conversions[0].abs_error, 0)
+        self.assertEqual(conversions[1].abs_error, abs(to_fraction(0x3555, BINARY16) - to_fraction(one_third)))
+        self.assertLessEqual(conversions[1].ulp_error, 0.5)
+        self.assertTrue(conversions[2].overflow)
+        self.assertTrue(conversions[3].underflow)
+
+        report = conversion_report(conversions)
+        self.assertEqual((report.count, report.exact, report.overflow, report.underflow), (4, 1, 1, 1))
+        self.assertEqual(report.max_abs_error, max(item.abs_error for item in conversions))
+        self.assertEqual(convert_with_error(0x3C00, BINARY16, BINARY64).abs_error, Fraction(0))
+
+    def test_ieee754float_formats(self):
+        num = IEEE754Float.from_decimal(1.5, BINARY16)
+        self.assertEqual((num.exponent, len(num.mantissa)), (15, 10))
+        self.assertEqual(len(num.to_bits()), 16)
+        self.assertEqual(num.to_word(), 0x3E00)
+        total = add_ieee754(num, IEEE754Float.from_decimal(0.25, BINARY16))
+        self.assertEqual(total.to_decimal(), 1.75)
+        self.assertEqual(total.convert(BINARY64).to_word(), 0x3FFC000000000000)
+        self.assertEqual(IEEE754Float.from_word(0x3FFC000000000000, BINARY64).to_decimal(), 1.75)
+        with self.assertRaises(ValueError):
+            add_ieee754(num, IEEE754Float.from_decimal(1.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
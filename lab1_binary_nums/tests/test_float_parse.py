@@ -0,0 +1,90 @@
+import random
+import struct
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+from src.float_format import BINARY16, BINARY32, BINARY64, FloatFormat
+from src.float_parse import parse_float, from_value
+from src.ieee754 import IEEE754Float
+from src.softfloat import from_fraction, to_fraction, is_nan, ROUND_TOWARD_ZERO, ROUND_UP, ROUND_DOWN
+
+
+def _host_word(text: str) -> int:
+    return struct.unpack('>I', struct.pack('>f', float(text)))[0]
+
+
+def _nearest(value: Fraction, fmt: FloatFormat = BINARY32) -> int:
+    """Эталон: перебор соседей округления к нулю"""
+    low = from_fraction(value, ROUND_TOWARD_ZERO, fmt)
+    high = from_fraction(value, ROUND_UP if value > 0 else ROUND_DOWN, fmt)
+    if low == high:
+        return low
+    if (high & ~fmt.sign_mask) == fmt.inf:
+        threshold = to_fraction(fmt.max_finite, fmt) + Fraction(2) ** (fmt.emax - fmt.man_bits - 1)
+        return high if abs(value) >= threshold else low
+    distance_low = abs(value - to_fraction(low, fmt))
+    distance_high = abs(to_fraction(high, fmt) - value)
+    if distance_low != distance_high:
+        return low if distance_low < distance_high else high
+    return low if low & 1 == 0 else high
+
+
+class TestFloatParse(unittest.TestCase):
+
+    def test_matches_host_for_random_decimals(self):
+        rng = random.Random(5)
+        for _ in range(5000):
+            text = f"{rng.choice(['', '-'])}{rng.randint(0, 10 ** rng.randint(1, 20))}e{rng.randint(-60, 45)}"
+            if abs(float(text)) < 3e38:
+                self.assertEqual(parse_float(text), _host_word(text), text)
+
+    def test_midpoints_are_rounded_exactly(self):
+        # 1 + 2 ** -24 - середина между 1 и следующим числом binary32,
+        # чуть большее значение должно округляться вверх, хотя binary64 его не различает
+        midpoint = Fraction(1) + Fraction(1, 1 << 24)
+        above = midpoint + Fraction(1, 10 ** 30)
+        self.assertEqual(from_value(midpoint), 0x3F800000)
+        self.assertEqual(from_value(above), 0x3F800001)
+        self.assertEqual(parse_float('1.000000059604644775390625000000000000001'), 0x3F800001)
+        self.assertEqual(parse_float('1.000000059604644775390625'), 0x3F800000)
+        self.assertEqual(parse_float('1.000000178813934326171875'), 0x3F800002) # середина, к чётному
+
+    def test_random_fractions_match_reference(self):
+        rng = random.Random(6)
+        for fmt in (BINARY16, BINARY32, FloatFormat(4, 3)):
+            for _ in range(1000):
+                value = Fraction(rng.randint(-10 ** 12, 10 ** 12), rng.randint(1, 10 ** 12)) * Fraction(2) ** rng.randint(-30, 10)
+                self.assertEqual(from_value(value, fmt), _nearest(value, fmt), (fmt.name, value))
+                self.assertEqual(parse_float(str(Decimal(value.numerator) / Decimal(value.denominator)), fmt),
+                                 from_value(Decimal(value.numerator) / Decimal(value.denominator), fmt))
+
+    def test_special_inputs(self):
+        self.assertEqual(parse_float('-0'), 0x80000000)
+        self.assertEqual(parse_float('1e-46'), 0x00000000)
+        self.assertEqual(parse_float('1e-46', rounding=ROUND_UP), 0x00000001)
+        self.assertEqual(parse_float('1.4e-45'), 0x00000001)
+        self.assertEqual(parse_float('-1e999999999'), 0xFF800000)
+        self.assertEqual(parse_float('1e-999999999', BINARY64), 0)
+        self.assertEqual(parse_float('3.4028235e38', rounding=ROUND_TOWARD_ZERO), 0x7F7FFFFF)
+        self.assertEqual(parse_float('1' + '0' * 5000 + 'e-5000'), 0x3F800000)
+        self.assertEqual(parse_float(' Infinity '), 0x7F800000)
+        self.assertTrue(is_nan(parse_float('nan')))
+        self.assertEqual(from_value(Decimal('-0.1')), _host_word('-0.1'))
+        self.assertEqual(from_value(3), 0x40400000)
+        self.assertEqual(from_value('0.1', BINARY64), struct.unpack('>Q', struct.pack('>d', 0.1))[0])
+        for text in ('', '.', 'e5', '1e', '0x10', '1_000'):
+            with self.assertRaises(ValueError):
+                parse_float(text)
+        with self.assertRaises(TypeError):
+            from_value(0.1)
+
+    def test_ieee754float_from_exact(self):
+        num = IEEE754Float.from_exact('-0.1')
+        self.assertEqual(num.sign, 1)
+        self.assertEqual(num.to_word(), _host_word('-0.1'))
+        self.assertEqual(IEEE754Float.from_exact(Fraction(1, 3), BINARY16).to_word(), 0x3555)
+
+
+if __name__ == '__main__':
+    unittest.main()
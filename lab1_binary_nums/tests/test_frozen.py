@@ -0,0 +1,95 @@
+import pickle
+import sys
+import unittest
+
+from src.binary_codes import BinaryNumber, PackedBinaryNumber, FrozenBinaryNumber
+from src.utils import sum_in_compl_code, subtraction, multiplication, division, convert_all_tipes
+
+
+class TestFrozenBinaryNumber(unittest.TestCase):
+
+    def test_codes_match_binary_number(self):
+        """Коды совпадают с BinaryNumber для разных разрядностей."""
+        for value in [0, 1, -1, 42, -42, 1023, -1024, 5000, -5000, 2 ** 40, -2 ** 40]:
+            for bits in (8, 32, 64):
+                with self.subTest(value=value, bits=bits):
+                    frozen = FrozenBinaryNumber(value, bits)
+                    reference = BinaryNumber(value, bits)
+                    self.assertEqual(frozen.sign_bit, reference.sign_bit)
+                    self.assertEqual(frozen.binary_num, reference.binary_num)
+                    self.assertEqual(frozen.reverse_code, reference.reverse_code)
+                    self.assertEqual(frozen.compl_code, reference.compl_code)
+
+    def test_negated_zero_matches(self):
+        """После смены знака нуля все три класса дают одинаковые коды."""
+        frozen = FrozenBinaryNumber(0).negated()
+        for cls in (BinaryNumber, PackedBinaryNumber):
+            with self.subTest(cls=cls.__name__):
+                num = cls(0).negated()
+                self.assertEqual(num.binary_num, frozen.binary_num)
+                self.assertEqual(num.sign_bit, frozen.sign_bit)
+                self.assertEqual(num.reverse_code, frozen.reverse_code)
+                self.assertEqual(num.compl_code, frozen.compl_code)
+
+    def test_interning(self):
+        """Малые значения разделяют один экземпляр, большие - нет."""
+        self.assertIs(FrozenBinaryNumber(-1024), FrozenBinaryNumber(-1024))
+        self.assertIs(FrozenBinaryNumber(7, 8), FrozenBinaryNumber(7, 8))
+        self.assertIsNot(FrozenBinaryNumber(7, 8), FrozenBinaryNumber(7, 16))
+        self.assertIsNot(FrozenBinaryNumber(5000), FrozenBinaryNumber(5000))
+        self.assertEqual(FrozenBinaryNumber(5000), FrozenBinaryNumber(5000))
+        self.assertIs(pickle.loads(pickle.dumps(FrozenBinaryNumber(3))), FrozenBinaryNumber(3))
+
+    def test_interning_per_class(self):
+        """Подкласс не получает экземпляр базового класса из кэша."""
+        class Derived(FrozenBinaryNumber):
+            __slots__ = ()
+
+        base = FrozenBinaryNumber(9, 8)
+        derived = Derived(9, 8)
+        self.assertIs(type(derived), Derived)
+        self.assertIsNot(derived, base)
+        self.assertIs(Derived(9, 8), derived)
+
+    def test_compl_int_is_masked(self):
+        """Слово дополнительного кода усекается до разрядности при любом знаке."""
+        self.assertEqual(FrozenBinaryNumber(300, 8).compl_int, 300 & 0xFF)
+        self.assertEqual(FrozenBinaryNumber(-300, 8).compl_int, -300 & 0xFF)
+        self.assertEqual(FrozenBinaryNumber(5000, 8).compl_int, 5000 & 0xFF)
+        self.assertEqual(FrozenBinaryNumber(42, 8).compl_int, 42)
+
+    def test_immutable_and_slotted(self):
+        """Нет __dict__, атрибуты и знак изменить нельзя."""
+        num = FrozenBinaryNumber(42)
+        self.assertFalse(hasattr(num, '__dict__'))
+        with self.assertRaises(AttributeError):
+            num.decimal_num = 1
+        with self.assertRaises(AttributeError):
+            num._decimal_num = 1
+        with self.assertRaises(TypeError):
+            num.negation_of_decimal_num()
+        self.assertEqual(num.negated().decimal_num, -42)
+        self.assertLess(sys.getsizeof(num), sys.getsizeof(BinaryNumber(42).__dict__))
+
+    def test_dict_keys_for_memoisation(self):
+        """Числа можно использовать как ключи словаря."""
+        memo = {}
+        for a, b in [(3, 4), (3, 4), (-3, 4)]:
+            key = (FrozenBinaryNumber(a), FrozenBinaryNumber(b))
+            if key not in memo:
+                memo[key] = sum_in_compl_code(*key)
+        self.assertEqual(len(memo), 2)
+
+    def test_arithmetic_matches_binary_number(self):
+        for a, b in [(5, 3), (-5, 3), (42, -42), (0, 7), (-17, -4)]:
+            for operation in (sum_in_compl_code, subtraction, multiplication, division):
+                with self.subTest(a=a, b=b, operation=operation.__name__):
+                    reference = (BinaryNumber(a), BinaryNumber(b))
+                    for num in reference:
+                        convert_all_tipes(num)
+                    frozen = (FrozenBinaryNumber(a), FrozenBinaryNumber(b))
+                    self.assertEqual(operation(*frozen), operation(*reference))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
+
+from scripts.fuzz import main
+from src.fuzz import (OPERATIONS, generate_cases, int_edge_values, is_mismatch, run_harness, run_operation,
+                      format_report)
+
+
+class TestFuzz(unittest.TestCase):
+
+    def test_edge_values(self):
+        values = int_edge_values(8)
+        for value in (0, 1, -1, -128, 127, 64, -64):
+            self.assertIn(value, values)
+        self.assertEqual(len(values), len(set(values)))
+
+    def test_edge_cases_come_first(self):
+        cases = generate_cases(OPERATIONS['sum_in_compl_code'], (8,))
+        edges = int_edge_values(8)
+        first = [next(cases) for _ in range(len(edges) ** 2)]
+        self.assertEqual(first[0], (0, 0, 8))
+        self.assertEqual({(a, b) for a, b, _ in first}, {(a, b) for a in edges for b in edges})
+
+    def test_integer_operations_match_references(self):
+        stats = run_harness(['sum_in_compl_code', 'subtraction', 'multiplication', 'division'],
+                            budget=60, widths=(8, 16), max_cases=1500)
+        for item in stats:
+            self.assertEqual(item.cases, 1500)
+            self.assertEqual(item.mismatches, 0, item.examples)
+            self.assertGreater(item.ops_per_sec, 0)
+            self.assertLessEqual(item.p50_us, item.p99_us)
+
+    def test_float_adders(self):
+        self.assertEqual(run_operation(OPERATIONS['f32_add'], 60, max_cases=3000).mismatches, 0)
+        # add_ieee754 отбрасывает разряды вместо округления к ближайшему
+        operation = OPERATIONS['add_ieee754']
+        legacy = run_operation(operation, 60, max_cases=3000, max_examples=2)
+        self.assertGreater(legacy.mismatches, 0)
+        self.assertEqual(len(legacy.examples), 2)
+        for example in legacy.examples:
+            self._assert_shrunk(operation, example)
+
+    def test_float_domains(self):
+        f32 = OPERATIONS['f32_add']
+        edges = f32.edge_values(32)
+        for word in (0x00000000, 0x80000000, 0xBF800000, 0x00000001, 0x007FFFFF, 0x7F800000, 0xFF800000):
+            self.assertIn(word, edges)
+        rng = random.Random(3)
+        words = [f32.random_value(rng, 32) for _ in range(2000)]
+        self.assertTrue(any(word >> 31 for word in words))
+        self.assertTrue(any(word & 0x7F800000 == 0 for word in words)) # денормализованные и нули
+        self.assertFalse(any(word & 0x7F800000 == 0x7F800000 and word & 0x7FFFFF for word in words)) # без NaN
+        # add_ieee754 проверяется только на положительных нормализованных числах
+        legacy = OPERATIONS['add_ieee754']
+        for word in legacy.edge_values(32) + [legacy.random_value(rng, 32) for _ in range(2000)]:
+            self.assertTrue(0 < word >> 23 < 255, hex(word))
+        self.assertEqual(legacy.shrink_values(0x3F800001, 32), [0x3F800000])
+        self.assertEqual(f32.shrink_values(0xBF800001, 32)[:2], [0x00000000, 0x3F800001])
+
+    def _assert_shrunk(self, operation, example):
+        """Расхождение воспроизводится, и ни один более простой операнд его уже не даёт."""
+        a, b, width = example.a, example.b, example.width
+        self.assertNotEqual(example.actual, example.expected)
+        self.assertTrue(is_mismatch(operation, a, b, width))
+        self.assertTrue(is_mismatch(operation, *example.found, width))
+        for x, y in [(value, b) for value in operation.shrink_values(a, width)] + \
+                    [(a, value) for value in operation.shrink_values(b, width)]:
+            self.assertFalse(is_mismatch(operation, x, y, width), (x, y))
+
+    def test_mismatch_is_shrunk(self):
+        # сумма ошибается, как только первый операнд больше 100
+        reference = OPERATIONS['sum_in_compl_code']
+        broken = reference._replace(name='broken', run=lambda a, b, width: reference.reference(a + (a > 100), b, width))
+        stats = run_operation(broken, 60, widths=(16,), max_cases=2000, max_examples=3)
+        self.assertGreater(stats.mismatches, 0)
+        for example in stats.examples:
+            self._assert_shrunk(broken, example)
+            self.assertEqual((example.a, example.b), (101, 0))
+            self.assertGreater(example.found[0], 100)
+        self.assertIn('найдено на', format_report([stats]))
+
+    def test_budget_and_report(self):
+        stats = run_harness(['f32_add'], budget=0.05)
+        self.assertGreater(stats[0].cases, 0)
+        self.assertIn('f32_add', format_report(stats))
+        with self.assertRaises(ValueError):
+            run_harness(['unknown'])
+
+    def test_script(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            code = main(['--ops', 'subtraction', '--widths', '8', '--max-cases', '200', '--budget', '30'])
+        self.assertEqual(code, 0)
+        self.assertIn('subtraction', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
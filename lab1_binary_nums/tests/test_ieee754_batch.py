@@ -0,0 +1,62 @@
+import mmap
+import random
+import struct
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.ieee754 import IEEE754Float
+from src.ieee754_batch import as_uint32, decompose, compose, IEEE754Batch
+
+
+class TestIEEE754Batch(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        values = [0.0, -0.0, 1.0, -2.5, 3.4e38, 1e-45, float('inf'), float('nan')]
+        values += [rng.uniform(-1e6, 1e6) for _ in range(200)]
+        self.array = np.array(values, dtype=np.float32)
+
+    def test_zero_copy_views(self):
+        self.assertTrue(np.shares_memory(as_uint32(self.array), self.array))
+        view = as_uint32(memoryview(self.array))
+        self.assertTrue(np.shares_memory(view, self.array))
+        with self.assertRaises(ValueError):
+            as_uint32(np.zeros(3))
+
+    def test_fields_match_struct(self):
+        sign, exponent, mantissa = decompose(self.array)
+        for i, value in enumerate(self.array):
+            word = struct.unpack('>I', struct.pack('>f', value))[0]
+            self.assertEqual(sign[i], word >> 31)
+            self.assertEqual(exponent[i], (word >> 23) & 0xFF)
+            self.assertEqual(mantissa[i], word & 0x7FFFFF)
+
+    def test_round_trip(self):
+        restored = compose(*decompose(self.array))
+        self.assertTrue(np.array_equal(restored.view(np.uint32), self.array.view(np.uint32)))
+        with self.assertRaises(ValueError):
+            compose([0], [256], [0])
+
+    def test_mmap_buffer(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(self.array.tobytes())
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                batch = IEEE754Batch.from_buffer(mapped)
+                self.assertEqual(len(batch), len(self.array))
+                self.assertTrue(np.array_equal(batch.to_words(), self.array.view(np.uint32)))
+                del batch
+
+    def test_items_are_ieee754_floats(self):
+        batch = IEEE754Batch.from_values([2.0, 0.75, 0.5])
+        self.assertEqual(batch[0].to_bits(), IEEE754Float(0, 128, [0] * 23).to_bits())
+        self.assertEqual(batch[1].to_bits(), [0] + [0, 1, 1, 1, 1, 1, 1, 0] + [1] + [0] * 22)
+        self.assertEqual([num.to_decimal() for num in batch], [2.0, 0.75, 0.5])
+        rebuilt = IEEE754Batch.from_floats(list(batch))
+        self.assertTrue(np.array_equal(rebuilt.to_float32(), batch.to_float32()))
+
+
+if __name__ == '__main__':
+    unittest.main()
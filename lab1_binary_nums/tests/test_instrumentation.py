@@ -0,0 +1,97 @@
+import threading
+import unittest
+
+import src.ieee754 as ieee754
+import src.instrumentation as instrumentation
+import src.utils as utils
+from src.binary_codes import BinaryNumber, PackedBinaryNumber
+from src.ieee754 import IEEE754Float
+from src.instrumentation import carry_chain, instrumented, Recorder
+from src.utils import multiplication
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_carry_chain(self):
+        self.assertEqual(carry_chain(0b0000, 0b0000, 4), 0)
+        self.assertEqual(carry_chain(0b0001, 0b0001, 4), 1)
+        self.assertEqual(carry_chain(0b0111, 0b0001, 4), 3) # перенос порождён в нулевом разряде и прошёл ещё два
+        self.assertEqual(carry_chain(0b1111, 0b0000, 4, carry_in=1), 5)
+
+    def test_functions_are_not_replaced(self):
+        original = utils.sum_in_compl_code
+        with instrumented() as recorder:
+            self.assertIs(utils.sum_in_compl_code, original)
+            self.assertTrue(instrumentation.is_enabled())
+            multiplication(BinaryNumber(3, 8), BinaryNumber(5, 8)) # импортирована по имени до включения
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual(recorder.calls['multiplication'], 1)
+        utils.sum_in_compl_code(BinaryNumber(1, 8), BinaryNumber(1, 8))
+        self.assertNotIn('sum_with_flags', recorder.calls)
+
+    def test_results_and_metrics(self):
+        plain = utils.sum_in_compl_code(BinaryNumber(7, 8), BinaryNumber(1, 8))
+        with instrumented() as recorder:
+            total = utils.sum_in_compl_code(BinaryNumber(7, 8), BinaryNumber(1, 8))
+            utils.multiplication(BinaryNumber(3, 8), BinaryNumber(5, 8))
+            utils.division(BinaryNumber(1, 8), BinaryNumber(4, 8))
+            ieee754.add_ieee754(IEEE754Float.from_decimal(1.5), IEEE754Float.from_decimal(0.75))
+        self.assertEqual(total, plain)
+        histograms = recorder.histograms
+        self.assertEqual(histograms['sum_with_flags']['full_adders'], {8: 1})
+        self.assertEqual(histograms['sum_with_flags']['carry_chain'], {3: 1})
+        # 5 = 101: два частичных произведения по 8 сумматоров
+        self.assertEqual(histograms['multiplication']['shifts'], {2: 1})
+        self.assertEqual(histograms['multiplication']['full_adders'], {16: 1})
+        # 1 / 4 < 1: только 5 шагов дробной части
+        self.assertEqual(histograms['division']['iterations'], {5: 1})
+        self.assertEqual(histograms['add_ieee754']['shifts'], {1: 1})
+        self.assertEqual(histograms['add_ieee754']['normalisation'], {1: 1}) # 1.5 + 0.75 = 2.25
+
+    def test_width_keyword_and_summary(self):
+        with instrumented() as recorder:
+            for value in range(4):
+                utils.sum_in_compl_code(BinaryNumber(value, 16), BinaryNumber(1, 16), width=16)
+        summary = recorder.summary()['sum_with_flags']['full_adders']
+        self.assertEqual((summary.calls, summary.total, summary.mean), (4, 64, 16.0))
+        report = recorder.report()
+        self.assertIn('sum_with_flags: вызовов 4', report)
+        self.assertIn('16-31', report)
+
+    def test_packed_path_is_one_word_addition(self):
+        with instrumented() as recorder:
+            utils.sum_in_compl_code(PackedBinaryNumber(7, 8), PackedBinaryNumber(1, 8))
+        self.assertEqual(recorder.histograms['sum_with_flags'], {'word_additions': {1: 1}})
+
+    def test_adder_architectures(self):
+        with instrumented() as recorder:
+            for adder in ('ripple', 'kogge_stone'):
+                utils.sum_in_compl_code(BinaryNumber(-1, 32), BinaryNumber(1, 32), adder=adder)
+        ripple = recorder.summary()['sum_with_flags[ripple]']
+        kogge_stone = recorder.summary()['sum_with_flags[kogge_stone]']
+        self.assertLess(kogge_stone['depth'].max, ripple['depth'].max)
+        self.assertGreater(kogge_stone['gates'].max, ripple['gates'].max)
+        self.assertLess(kogge_stone['delay'].max, ripple['delay'].max) # перенос через все 32 разряда
+        self.assertNotIn('sum_with_flags', recorder.calls)
+
+    def test_recorder_is_per_thread(self):
+        def work():
+            utils.sum_in_compl_code(BinaryNumber(1, 8), BinaryNumber(1, 8))
+        with instrumented() as recorder:
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+            work()
+        self.assertEqual(recorder.calls['sum_with_flags'], 1)
+
+    def test_nested_enable(self):
+        recorder = Recorder()
+        with instrumented(recorder) as active:
+            self.assertIs(active, recorder)
+            with self.assertRaises(RuntimeError):
+                instrumentation.enable()
+        self.assertIsNone(instrumentation.disable())
+
+
+if __name__ == '__main__':
+    unittest.main()
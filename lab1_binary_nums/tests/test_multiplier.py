@@ -0,0 +1,46 @@
+import random
+import unittest
+
+from src.binary_codes import BinaryNumber
+from src.multiplier import multiply, shift_add_multiply, MULTIPLIERS, Product
+from src.utils import multiplication, binary_to_decimal
+
+
+class TestMultiplier(unittest.TestCase):
+
+    def test_modes_match_native_product(self):
+        rng = random.Random(5)
+        for width in (5, 8, 16, 32, 64, 128, 300):
+            low, high = -2 ** (width - 1), 2 ** (width - 1) - 1
+            pairs = [(low, low), (low, high), (high, high), (0, low), (-1, -1), (1, low)]
+            pairs += [(rng.randint(low, high), rng.randint(low, high)) for _ in range(50)]
+            for mode in MULTIPLIERS:
+                for a, b in pairs:
+                    with self.subTest(width=width, mode=mode, a=a, b=b):
+                        self.assertEqual(multiply(a, b, width, mode).full, a * b)
+
+    def test_truncated_and_overflow(self):
+        self.assertEqual(multiply(12, 11, 8), Product(132, -124, True))
+        self.assertEqual(multiply(-8, 16, 8, 'booth'), Product(-128, -128, False))
+        self.assertEqual(multiply(-128, -1, 8, 'booth'), Product(128, -128, True))
+
+    def test_matches_current_implementation_without_overflow(self):
+        for a, b in [(5, 5), (5, -5), (0, 42), (-300, 200), (46340, 46340)]:
+            bits = multiplication(BinaryNumber(a), BinaryNumber(b))
+            product = multiply(a, b)
+            self.assertFalse(product.overflow)
+            self.assertEqual(product.truncated, binary_to_decimal(bits))
+
+    def test_shift_add_uses_width(self):
+        self.assertEqual(shift_add_multiply(3, 5, 2), 3) # просматриваются только младшие 2 бита множителя
+        self.assertEqual(shift_add_multiply(3, -5, 3), -15)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            multiply(128, 1, 8)
+        with self.assertRaises(ValueError):
+            multiply(1, 1, 8, 'wallace')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from src.binary_codes import BinaryNumber, PackedBinaryNumber
+from src.utils import (
+    convert_all_tipes,
+    sum_in_compl_code,
+    subtraction,
+    multiplication,
+    division
+)
+
+VALUES = [0, 1, -1, 5, -5, 42, -42, 127, -128, 255, -256, 2 ** 31 - 1, -2 ** 31, 2 ** 33, -2 ** 33]
+
+
+class TestPackedBinaryNumber(unittest.TestCase):
+
+    def test_codes_match_list_backend(self):
+        """Коды упакованного варианта совпадают с исходной реализацией."""
+        for value in VALUES:
+            for bits in (4, 8, 32, 64, 128):
+                with self.subTest(value=value, bits=bits):
+                    reference = BinaryNumber(value)
+                    packed = PackedBinaryNumber(value)
+                    self.assertEqual(packed.dec_to_bin(bits), reference.dec_to_bin(bits))
+                    self.assertEqual(packed.bin_to_reverse_code(), reference.bin_to_reverse_code())
+                    self.assertEqual(packed.rev_code_to_compl_code(), reference.rev_code_to_compl_code())
+                    self.assertEqual(packed.sign_bit, reference.sign_bit)
+
+    def test_lists_are_lazy(self):
+        """Списки бит не строятся, пока их не прочитали."""
+        packed = PackedBinaryNumber(-42)
+        packed.convert_packed(bits=8)
+        self.assertIsNone(packed._binary_num)
+        self.assertIsNone(packed._compl_code)
+        self.assertEqual(packed.compl_int, 0b11010110)
+        self.assertEqual(packed.compl_code, [1, 1, 0, 1, 0, 1, 1, 0])
+        self.assertIsNone(packed._reverse_code)
+
+    def test_initial_and_negated_state(self):
+        """Коды вычисляются при обращении и пересчитываются после смены знака."""
+        packed = PackedBinaryNumber(42)
+        self.assertEqual(packed.compl_int, 42)
+        self.assertEqual(packed.compl_code, [0] * 26 + [1, 0, 1, 0, 1, 0])
+        packed.negation_of_decimal_num()
+        self.assertEqual(packed.decimal_num, -42)
+        self.assertEqual(packed.sign_bit, [1])
+        self.assertIsNone(packed._compl_int)
+        self.assertEqual(packed.binary_num, [0] * 26 + [1, 0, 1, 0, 1, 0])
+        self.assertEqual(packed.compl_code, [1] * 26 + [0, 1, 0, 1, 1, 0])
+        self.assertIsInstance(packed.negated(), PackedBinaryNumber)
+        self.assertEqual(packed.negated().compl_int, 42)
+
+    def test_arithmetic_matches_list_backend(self):
+        """Арифметика из utils даёт одинаковые результаты для обоих вариантов."""
+        pairs = [(5, 3), (-5, 3), (42, -42), (0, 7), (-17, -4)]
+        for a, b in pairs:
+            with self.subTest(a=a, b=b):
+                for operation in (sum_in_compl_code, subtraction, multiplication, division):
+                    reference = (BinaryNumber(a), BinaryNumber(b))
+                    packed = (PackedBinaryNumber(a), PackedBinaryNumber(b))
+                    for num in reference + packed:
+                        convert_all_tipes(num)
+                    self.assertEqual(operation(*packed), operation(*reference))
+
+
+if __name__ == '__main__':
+    unittest.main()
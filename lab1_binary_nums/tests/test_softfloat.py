@@ -0,0 +1,115 @@
+import random
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from src.ieee754 import IEEE754Float
+from src.softfloat import (
+    f32_add, f32_sub, f32_mul, f32_div, f32_sqrt, is_nan,
+    ROUND_NEAREST_EVEN, ROUND_TOWARD_ZERO, ROUND_UP, ROUND_DOWN, INF, MAX_FINITE
+)
+
+SPECIAL = [0x00000000, 0x80000000, 0x00000001, 0x80000001, 0x007FFFFF, 0x00800000, 0x3F800000, 0xBF800000,
+           0x7F7FFFFF, 0xFF7FFFFF, 0x7F800000, 0xFF800000, 0x7FC00000, 0x3F800001, 0x4B800000, 0x33800000]
+
+
+def _random_words(count: int, seed: int) -> list[int]:
+    rng = random.Random(seed)
+    words = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.1:
+            words.append(rng.getrandbits(23) | (rng.getrandbits(1) << 31)) # денормализованные
+        elif kind < 0.3:
+            exponent = rng.choice([1, 2, 100, 127, 128, 200, 253, 254])
+            words.append((rng.getrandbits(1) << 31) | (exponent << 23) | rng.getrandbits(23))
+        else:
+            words.append(rng.getrandbits(32))
+    return words
+
+
+def _host(words: list[int]) -> np.ndarray:
+    return np.array(words, dtype=np.uint32).view(np.float32)
+
+
+def _value(word: int) -> Fraction:
+    sign, exponent, mantissa = word >> 31, (word >> 23) & 0xFF, word & 0x7FFFFF
+    if exponent == 0:
+        value = Fraction(mantissa, 1 << 149)
+    else:
+        value = Fraction(mantissa | 1 << 23) * Fraction(2) ** (exponent - 150)
+    return -value if sign else value
+
+
+class TestSoftFloat(unittest.TestCase):
+
+    def setUp(self):
+        self.a = SPECIAL * len(SPECIAL) + _random_words(4000, 1)
+        self.b = [w for w in SPECIAL for _ in SPECIAL] + _random_words(4000, 2)
+
+    def _assert_bit_exact(self, operation, expected: np.ndarray, *operands):
+        expected = expected.view(np.uint32)
+        for i, args in enumerate(zip(*operands)):
+            result = operation(*args)
+            if is_nan(int(expected[i])):
+                self.assertTrue(is_nan(result), (args, hex(result)))
+            else:
+                self.assertEqual(result, int(expected[i]), [hex(w) for w in args])
+
+    def test_add_sub_mul_div_match_host(self):
+        a, b = _host(self.a), _host(self.b)
+        with np.errstate(all='ignore'):
+            self._assert_bit_exact(f32_add, a + b, self.a, self.b)
+            self._assert_bit_exact(f32_sub, a - b, self.a, self.b)
+            self._assert_bit_exact(f32_mul, a * b, self.a, self.b)
+            self._assert_bit_exact(f32_div, a / b, self.a, self.b)
+
+    def test_sqrt_matches_host(self):
+        with np.errstate(all='ignore'):
+            self._assert_bit_exact(f32_sqrt, np.sqrt(_host(self.a)), self.a)
+
+    def test_directed_rounding(self):
+        """Направленные режимы дают соседнее представимое число с нужной стороны от точного значения."""
+        rng = random.Random(3)
+        operations = [(f32_add, lambda x, y: x + y), (f32_mul, lambda x, y: x * y), (f32_div, lambda x, y: x / y)]
+        for _ in range(1500):
+            a = rng.getrandbits(31) | (rng.getrandbits(1) << 31)
+            b = rng.getrandbits(31) | (rng.getrandbits(1) << 31)
+            if (a & 0x7F800000) == 0x7F800000 or (b & 0x7F800000) == 0x7F800000 or b & 0x7FFFFFFF == 0:
+                continue
+            for soft, exact in operations:
+                value = exact(_value(a), _value(b))
+                down = soft(a, b, ROUND_DOWN)
+                up = soft(a, b, ROUND_UP)
+                toward_zero = soft(a, b, ROUND_TOWARD_ZERO)
+                if (down & 0x7FFFFFFF) < INF:
+                    self.assertLessEqual(_value(down), value)
+                if (up & 0x7FFFFFFF) < INF:
+                    self.assertGreaterEqual(_value(up), value)
+                if value == _value(soft(a, b)):
+                    self.assertEqual(_value(down), _value(up))
+                else:
+                    self.assertEqual(toward_zero, down if value > 0 else up)
+
+    def test_signed_zeros_and_overflow(self):
+        self.assertEqual(f32_add(0x3F800000, 0xBF800000), 0x00000000)
+        self.assertEqual(f32_add(0x3F800000, 0xBF800000, ROUND_DOWN), 0x80000000)
+        self.assertEqual(f32_mul(0x7F7FFFFF, 0x40000000), INF)
+        self.assertEqual(f32_mul(0x7F7FFFFF, 0x40000000, ROUND_TOWARD_ZERO), MAX_FINITE)
+        self.assertEqual(f32_mul(0xFF7FFFFF, 0x40000000, ROUND_UP), 0x80000000 | MAX_FINITE)
+        self.assertEqual(f32_sqrt(0x80000000), 0x80000000)
+        self.assertTrue(is_nan(f32_sqrt(0xBF800000)))
+        with self.assertRaises(ValueError):
+            f32_add(0x3F800000, 0x3F800001, 'stochastic')
+
+    def test_ieee754float_words(self):
+        num = IEEE754Float(0, 126, [1] + [0] * 22)
+        self.assertEqual(num.to_word(), 0x3F400000)
+        self.assertEqual(IEEE754Float.from_word(0x3F400000).to_bits(), num.to_bits())
+        total = IEEE754Float.from_word(f32_add(num.to_word(), num.to_word()))
+        self.assertEqual(total.to_decimal(), 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
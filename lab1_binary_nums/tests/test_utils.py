@@ -1,5 +1,9 @@
 import unittest
-from src.binary_codes import BinaryNumber
+
+import numpy as np
+
+from src.binary_codes import BinaryNumber, PackedBinaryNumber
+from src.bitops import int_to_bits
 from src.utils import (
     dec_to_bin_positive,
     convert_all_tipes,
@@ -9,7 +13,9 @@ from src.utils import (
     binary_to_decimal,
     multiplication,
     binary_fraction_to_decimal,
-    division
+    division,
+    sum_with_flags,
+    subtraction_with_flags
 )
 
 class TestUtils(unittest.TestCase):
@@ -26,6 +32,7 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(dec_to_bin_positive(0, bits=8), [0, 0, 0, 0, 0, 0, 0, 0])
         self.assertEqual(dec_to_bin_positive(5, bits=4), [0, 1, 0, 1])
         self.assertEqual(dec_to_bin_positive(255, bits=8), [1, 1, 1, 1, 1, 1, 1, 1])
+        self.assertEqual(dec_to_bin_positive(-5, bits=4), [0, 0, 0, 0])
 
     def test_convert_all_tipes(self):
         bn = BinaryNumber(42)
@@ -48,6 +55,11 @@ class TestUtils(unittest.TestCase):
         compl_code_neg = [1] * 24 + [1, 1, 0, 1, 0, 1, 1, 0]
         self.assertEqual(twos_complement_to_decimal(compl_code_neg), -42)
         self.assertEqual(twos_complement_to_decimal([0] * 32), 0)
+        # любые индексируемые последовательности бит, как и раньше
+        self.assertEqual(twos_complement_to_decimal(tuple(compl_code_neg)), -42)
+        self.assertEqual(twos_complement_to_decimal(np.array(compl_code_neg, dtype=np.int64)), -42)
+        self.assertEqual(binary_to_decimal(np.array([1, 0, 1, 0, 1, 0], dtype=np.uint8), 6), -10)
+        self.assertEqual(binary_to_decimal(np.array([1] + [0] * 29 + [1, 1])), -3)
 
     def test_multiplication(self):
         result = multiplication(self.bn_small, self.bn_small)
@@ -84,5 +96,64 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             division(self.bn_positive, self.bn_zero)
 
+    def test_sum_with_flags_widths(self):
+        for width in (8, 16, 32, 64, 128):
+            low, high = -2 ** (width - 1), 2 ** (width - 1) - 1
+            for a, b in [(5, -3), (high, 1), (low, -1), (-1, -1), (low, high)]:
+                with self.subTest(width=width, a=a, b=b):
+                    num1, num2 = BinaryNumber(a, width), BinaryNumber(b, width)
+                    convert_all_tipes(num1)
+                    convert_all_tipes(num2)
+                    res, carry, overflow = sum_with_flags(num1, num2)
+                    self.assertEqual(len(res), width)
+                    expected = (a + b + 2 ** (width - 1)) % 2 ** width - 2 ** (width - 1)
+                    self.assertEqual(twos_complement_to_decimal(res), expected)
+                    self.assertEqual(overflow, int(not low <= a + b <= high))
+                    self.assertEqual(carry, ((a % 2 ** width) + (b % 2 ** width)) >> width)
+
+    def test_sum_with_flags_backends_other_width(self):
+        # width отличается от разрядности операндов: все способы сложения дают одно и то же
+        cases = [(128, 128, 8, 8), (-3, 1, 8, 16), (-128, -1, 8, 16), (100, 27, 8, 4), (-5, 7, 32, 8)]
+        for a, b, bits, width in cases:
+            with self.subTest(a=a, b=b, bits=bits, width=width):
+                word1, word2 = a % 2 ** bits, b % 2 ** bits
+                word1, word2 = [(w - 2 ** bits if w >> (bits - 1) else w) % 2 ** width for w in (word1, word2)]
+                expected = (int_to_bits((word1 + word2) % 2 ** width, width), (word1 + word2) >> width)
+                for cls, adder in ((BinaryNumber, None), (PackedBinaryNumber, None), (BinaryNumber, 'kogge_stone')):
+                    num1, num2 = cls(a, bits), cls(b, bits)
+                    res, carry, _ = sum_with_flags(num1, num2, width, adder)
+                    self.assertEqual((res, carry), expected)
+                    self.assertEqual((num1.bits, num2.bits), (bits, bits))
+
+    def test_width_does_not_change_operands(self):
+        for cls in (BinaryNumber, PackedBinaryNumber):
+            num1, num2 = cls(-100, 32), cls(27, 32)
+            with self.subTest(cls=cls.__name__):
+                self.assertEqual(twos_complement_to_decimal(subtraction(num1, num2, 8)), -127)
+                self.assertEqual(binary_to_decimal(multiplication(num1, num2, 16), 16), -2700)
+                self.assertEqual((num1.bits, num2.bits), (32, 32))
+                self.assertEqual(len(num1.compl_code), 32)
+
+    def test_subtraction_with_flags_widths(self):
+        for width in (8, 16, 64, 128):
+            low, high = -2 ** (width - 1), 2 ** (width - 1) - 1
+            for a, b in [(5, 3), (low, 1), (0, low), (high, -1), (-7, -7)]:
+                with self.subTest(width=width, a=a, b=b):
+                    num1, num2 = BinaryNumber(a, width), BinaryNumber(b, width)
+                    res, _, overflow = subtraction_with_flags(num1, num2)
+                    expected = (a - b + 2 ** (width - 1)) % 2 ** width - 2 ** (width - 1)
+                    self.assertEqual(twos_complement_to_decimal(res), expected)
+                    self.assertEqual(overflow, int(not low <= a - b <= high))
+                    self.assertEqual(num2.decimal_num, b)
+
+    def test_multiplication_and_division_wide(self):
+        a, b = 3 * 2 ** 40 + 5, -2 ** 20
+        result = multiplication(BinaryNumber(a, 128), BinaryNumber(b, 128))
+        self.assertEqual(len(result), 128)
+        self.assertEqual(binary_to_decimal(result, 128), a * b)
+        result, sign = division(BinaryNumber(2 ** 62, 64), BinaryNumber(2 ** 61 + 2 ** 60, 64))
+        self.assertEqual(result, [1, None, 0, 1, 0, 1, 0])
+        self.assertEqual(sign, 0)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,46 @@
+import sys
+import time
+
+from parser.logic_parser import IterativeParser, Parser, tokenize, collect_variables
+
+
+def wide_expression(terms: int) -> str:
+    """Длинная плоская формула: (x0 & !y0) | (x1 & !y1) | ..."""
+    return ' | '.join(f'(x{i} & !y{i})' for i in range(terms))
+
+
+def deep_parentheses(depth: int) -> str:
+    return '(' * depth + 'a' + ')' * depth
+
+
+def negation_chain(length: int) -> str:
+    return '!' * length + 'a'
+
+
+def measure(parser_class, tokens) -> str:
+    start = time.perf_counter()
+    try:
+        root = parser_class(tokens).parse()
+        collect_variables(root)
+    except RecursionError:
+        return 'RecursionError'
+    return f'{time.perf_counter() - start:.3f} с'
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 5, 10 ** 6]
+    cases = [('плоская', wide_expression, 7), ('скобки', deep_parentheses, 2), ('отрицания', negation_chain, 1)]
+    print(f'{"вид":>10} | {"токенов":>8} | {"токенизация":>11} | {"рекурсивный":>14} | {"итеративный":>11}')
+    print('-' * 66)
+    for size in sizes:
+        for name, build, tokens_per_unit in cases:
+            expression = build(size // tokens_per_unit)
+            start = time.perf_counter()
+            tokens = tokenize(expression)
+            scan_time = time.perf_counter() - start
+            print(f'{name:>10} | {len(tokens):>8} | {scan_time:>9.3f} с | {measure(Parser, tokens):>14} | '
+                  f'{measure(IterativeParser, tokens):>11}')
+
+
+if __name__ == '__main__':
+    main()
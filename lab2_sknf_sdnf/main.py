@@ -1,7 +1,10 @@
+import sys
+
 from parser.logic_parser import parse_expression
 from truth_table.generator import generate_truth_table
-from normal_forms.builder import build_sdnf, build_sknf
+from normal_forms.builder import write_sdnf, write_sknf
 from utils.expression_utils import get_numeric_form, get_index_form
+from utils.stream_output import ChunkedWriter, write_table
 
 def main():
     expr = None
@@ -18,7 +21,8 @@ def main():
         print("5. Числовая форма СДНФ")
         print("6. Числовая форма СКНФ")
         print("7. Индексная форма функции")
-        print("8. Выйти")
+        print("8. Записать таблицу, СДНФ и СКНФ в файл")
+        print("9. Выйти")
         choice = input("Выберите действие: ")
 
         if choice == "1":
@@ -34,23 +38,24 @@ def main():
                 print("Сначала введите выражение.")
                 continue
             print("\nТаблица истинности:")
-            header = " | ".join(variables + ['result'])
-            print(header)
-            print("-" * len(header))
-            for row in truth_table:
-                print(" | ".join(['1' if row[v] else '0' for v in variables] + ['1' if row['result'] else '0']))
+            with ChunkedWriter(sys.stdout) as out:
+                write_table(truth_table, variables, out)
         elif choice == "3":
             if not truth_table:
                 print("Сначала введите выражение.")
                 continue
-            sdnf = build_sdnf(truth_table, variables)
-            print("СДНФ:", sdnf)
+            with ChunkedWriter(sys.stdout) as out:
+                out.write("СДНФ: ")
+                write_sdnf(truth_table, variables, out)
+                out.write("\n")
         elif choice == "4":
             if not truth_table:
                 print("Сначала введите выражение.")
                 continue
-            sknf = build_sknf(truth_table, variables)
-            print("СКНФ:", sknf)
+            with ChunkedWriter(sys.stdout) as out:
+                out.write("СКНФ: ")
+                write_sknf(truth_table, variables, out)
+                out.write("\n")
         elif choice == '5':
             indices = get_numeric_form(root, variables, mode='sdnf')
             print(f"Числовая форма СДНФ: !({', '.join(map(str, indices))})")
@@ -61,6 +66,22 @@ def main():
             binary = get_index_form(root, variables)
             print(f"Индексная форма: {binary}")
         elif choice == "8":
+            if not truth_table:
+                print("Сначала введите выражение.")
+                continue
+            path = input("Введите имя файла: ")
+            try:
+                with ChunkedWriter(path) as out:
+                    write_table(truth_table, variables, out)
+                    out.write("\nСДНФ: ")
+                    write_sdnf(truth_table, variables, out)
+                    out.write("\n\nСКНФ: ")
+                    write_sknf(truth_table, variables, out)
+                    out.write("\n")
+                print(f"Записано в файл {path}")
+            except OSError as e:
+                print(f"Ошибка при записи файла: {e}")
+        elif choice == "9":
             print("Выход из программы.")
             break
         else:
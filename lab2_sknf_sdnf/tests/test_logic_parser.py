@@ -1,5 +1,14 @@
 import unittest
-from parser.logic_parser import parse_expression
+import random
+from parser.logic_parser import (
+    parse_expression, scan, tokenize, Parser, IterativeParser, VarNode, children, collect_variables
+)
+
+
+def tree_shape(node):
+    if isinstance(node, VarNode):
+        return node.name
+    return (type(node).__name__,) + tuple(tree_shape(child) for child in children(node))
 
 class TestLogicParser(unittest.TestCase):
     def test_single_variable(self):
@@ -57,5 +66,62 @@ class TestLogicParser(unittest.TestCase):
         with self.assertRaises(SyntaxError):
             parse_expression(expr)
 
+    def test_unicode_operators(self):
+        tokens = tokenize("¬(a∧b)∨c→d↔e")
+        self.assertEqual([tag for tag, _ in tokens],
+                         ['NOT', 'LPAREN', 'VAR', 'AND', 'VAR', 'RPAREN', 'OR', 'VAR', 'IMPL', 'VAR', 'EQUIV', 'VAR'])
+        root, _ = parse_expression("¬a∨b")
+        ascii_root, _ = parse_expression("!a|b")
+        for a in (False, True):
+            for b in (False, True):
+                env = {"a": a, "b": b}
+                self.assertEqual(root.evaluate(env), ascii_root.evaluate(env))
+
+    def test_xor_operator(self):
+        root, variables = parse_expression("a ⊕ b")
+        self.assertEqual(variables, ["a", "b"])
+        self.assertEqual(root.evaluate({"a": True, "b": False}), True)
+        self.assertEqual(root.evaluate({"a": True, "b": True}), False)
+
+    def test_scan_offsets(self):
+        self.assertEqual(list(scan("a -> !b")), [('VAR', 'a', 0), ('IMPL', '->', 2), ('NOT', '!', 5), ('VAR', 'b', 6)])
+        tokens = scan("a & $")
+        self.assertEqual(next(tokens), ('VAR', 'a', 0)) # токены выдаются лениво
+        with self.assertRaises(SyntaxError):
+            list(tokens)
+
+    def test_iterative_parser_builds_same_trees(self):
+        rng = random.Random(1)
+
+        def generate(depth):
+            if depth == 0 or rng.random() < 0.2:
+                return rng.choice('abcd')
+            kind = rng.random()
+            if kind < 0.2:
+                return '!' * rng.randint(1, 3) + generate(depth - 1)
+            if kind < 0.4:
+                return '(' + generate(depth - 1) + ')'
+            return generate(depth - 1) + rng.choice([' & ', ' | ', ' -> ', ' ~ ', ' ⊕ ']) + generate(depth - 1)
+
+        for _ in range(500):
+            tokens = tokenize(generate(6))
+            self.assertEqual(tree_shape(IterativeParser(tokens).parse()), tree_shape(Parser(tokens).parse()))
+
+    def test_iterative_parser_errors(self):
+        for expr in ("(a & b", "a &", "", "!", "()"):
+            with self.assertRaises(SyntaxError):
+                IterativeParser(tokenize(expr)).parse()
+        parser = IterativeParser(tokenize("a & b) | c"))
+        self.assertEqual(tree_shape(parser.parse()), ('AndNode', 'a', 'b'))
+        self.assertEqual(parser.pos, 3) # как и Parser, останавливается на лишней скобке
+
+    def test_deep_nesting(self):
+        depth = 50000
+        root, variables = parse_expression('(' * depth + 'a' + ')' * depth)
+        self.assertEqual(variables, ['a'])
+        root, variables = parse_expression('!' * depth + 'b & c')
+        self.assertEqual(variables, ['b', 'c'])
+        self.assertEqual(collect_variables(root), {'b', 'c'})
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,10 @@
 # tests/test_normal_forms.py
 
+import io
 import unittest
 from parser.logic_parser import parse_expression
 from truth_table.generator import generate_truth_table
-from normal_forms.builder import build_sdnf, build_sknf
+from normal_forms.builder import build_sdnf, build_sknf, iter_sdnf_terms, write_sdnf, write_sknf
 
 class TestNormalFormsBuilder(unittest.TestCase):
     def setUp(self):
@@ -25,6 +26,23 @@ class TestNormalFormsBuilder(unittest.TestCase):
         for term in expected_terms:
             self.assertIn(term, sknf)
 
+    def test_write_matches_build(self):
+        for expr in ("a | b", "a & b", "a ⊕ b ⊕ c", "a -> b"):
+            truth_table = self._parse_and_generate(expr)
+            variables = truth_table.variables
+            sdnf, sknf = io.StringIO(), io.StringIO()
+            write_sdnf(truth_table, variables, sdnf)
+            write_sknf(truth_table, variables, sknf)
+            self.assertEqual(sdnf.getvalue(), build_sdnf(truth_table, variables))
+            self.assertEqual(sknf.getvalue(), build_sknf(truth_table, variables))
+
+    def test_write_constant(self):
+        rows = [{'a': False, 'result': False}, {'a': True, 'result': False}]
+        stream = io.StringIO()
+        self.assertEqual(write_sdnf(rows, ['a'], stream), 0)
+        self.assertEqual(stream.getvalue(), "0")
+        self.assertEqual(list(iter_sdnf_terms(rows, ['a'])), [])
+
 
 if __name__ == '__main__':
     unittest.main()
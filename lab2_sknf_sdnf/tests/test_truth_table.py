@@ -1,8 +1,11 @@
 # tests/test_truth_table.py
 
 import unittest
+from itertools import product
 from parser.logic_parser import parse_expression
-from truth_table.generator import generate_truth_table
+from truth_table.generator import generate_truth_table, truth_vector, variable_column, table_from_vector
+from truth_table.table import TruthTable
+from truth_table.incremental import IncrementalEvaluator, gray_truth_vector
 
 class TestTruthTableGenerator(unittest.TestCase):
     def test_single_variable(self):
@@ -46,5 +49,98 @@ class TestTruthTableGenerator(unittest.TestCase):
             expected_result = a and (not b or c)
             self.assertEqual(row['result'], expected_result)
 
+    def test_deep_expression(self):
+        depth = 5001
+        root, variables = parse_expression('!' * depth + 'a & ' + '(' * 300 + 'b | c' + ')' * 300)
+        table = generate_truth_table(root, variables)
+        self.assertEqual([row['result'] for row in table], [False, True, True, True] + [False] * 4)
+
+    def test_variable_column(self):
+        self.assertEqual(format(variable_column(0, 3), '08b'), '00001111')
+        self.assertEqual(format(variable_column(1, 3), '08b'), '00110011')
+        self.assertEqual(format(variable_column(2, 3), '08b'), '01010101')
+
+    def test_truth_vector_matches_evaluate(self):
+        for expr in ('!(a & b) -> c ~ d', 'a ⊕ b ⊕ c', '(a -> b) & (b -> a) | !c', '!a'):
+            root, variables = parse_expression(expr)
+            bits = ''.join('1' if root.evaluate(dict(zip(variables, values))) else '0'
+                           for values in product([False, True], repeat=len(variables)))
+            self.assertEqual(truth_vector(root, variables), int(bits, 2))
+
+    def test_table_from_vector(self):
+        root, variables = parse_expression('a -> b')
+        table = table_from_vector(truth_vector(root, variables), variables)
+        self.assertEqual(table, [
+            {'a': False, 'b': False, 'result': True},
+            {'a': False, 'b': True, 'result': True},
+            {'a': True, 'b': False, 'result': False},
+            {'a': True, 'b': True, 'result': True},
+        ])
+
+    def test_truth_vector_many_variables(self):
+        variables = [f'x{i}' for i in range(20)]
+        root, variables = parse_expression(' ⊕ '.join(variables))
+        vector = truth_vector(root, variables)
+        self.assertEqual(vector.bit_count(), 1 << 19)
+        self.assertEqual(vector >> ((1 << 20) - 8), 0b01101001) # чётность первых 8 строк
+
+    def test_truth_table_rows(self):
+        root, variables = parse_expression('a & (!b | c)')
+        table = generate_truth_table(root, variables)
+        self.assertIsInstance(table, TruthTable)
+        self.assertEqual(table, table_from_vector(table.vector, variables))
+        self.assertEqual(table[5], {'a': True, 'b': False, 'c': True, 'result': True})
+        self.assertEqual(table[-1], table[7])
+        with self.assertRaises(IndexError):
+            table[8]
+        self.assertEqual(list(table.indices(True)), [4, 5, 7])
+        self.assertEqual(list(table.indices(False)), [0, 1, 2, 3, 6])
+
+    def test_truth_table_slice_and_hash(self):
+        root, variables = parse_expression('a & (!b | c)')
+        table = generate_truth_table(root, variables)
+        rows = table.to_rows()
+        for idx in (slice(None), slice(2, 6), slice(None, None, -1), slice(-3, None), slice(1, 7, 3)):
+            self.assertEqual(table[idx], rows[idx])
+        with self.assertRaises(TypeError):
+            hash(table)
+
+    def test_truth_table_from_rows(self):
+        rows = [{'a': 1, 'result': True}, {'a': 1, 'result': False}] # второй строки a = 0 нет
+        table = TruthTable.from_rows(rows, ['a'])
+        self.assertEqual(table.vector, 0b01)
+        self.assertEqual(len(table.bits), 1)
+
+    def test_truth_table_many_variables(self):
+        variables = [f'x{i}' for i in range(20)]
+        table = generate_truth_table(*parse_expression(' & '.join(variables)))
+        self.assertEqual(len(table.bits), 1 << 17)
+        self.assertEqual(list(table.indices(True)), [(1 << 20) - 1])
+        self.assertTrue(all(table[-1].values()))
+
+    def test_gray_truth_vector(self):
+        for expr in ('a', '!a', '!(a & b) -> c ~ d', 'a ⊕ b ⊕ c', '(a -> b) & (b -> a) | !c'):
+            root, variables = parse_expression(expr)
+            self.assertEqual(gray_truth_vector(root, variables), truth_vector(root, variables))
+
+    def test_incremental_evaluator(self):
+        root, variables = parse_expression('(a & b) | !c')
+        evaluator = IncrementalEvaluator(root, variables)
+        self.assertTrue(evaluator.result)
+        self.assertFalse(evaluator.set(2, True))
+        self.assertFalse(evaluator.set(0, True))
+        self.assertTrue(evaluator.set(1, True))
+        touched = evaluator.touched
+        evaluator.set(1, True) # значение не изменилось - ничего не пересчитывается
+        self.assertEqual(evaluator.touched, touched)
+
+    def test_incremental_touches_fewer_nodes(self):
+        variables = [f'x{i}' for i in range(12)]
+        root, variables = parse_expression(' | '.join(f'({a} & {b})' for a, b in zip(variables[::2], variables[1::2])))
+        evaluator = IncrementalEvaluator(root, variables)
+        operations = sum(1 for op, _, _ in evaluator.program if op)
+        self.assertEqual(sorted(idx for idx, _ in evaluator.gray_rows()), list(range(1 << 12)))
+        self.assertLess(evaluator.touched * 4, operations << 12)
+
 if __name__ == '__main__':
     unittest.main()
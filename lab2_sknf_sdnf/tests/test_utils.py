@@ -1,5 +1,9 @@
+import io
+import os
+import tempfile
 import unittest
 from utils.expression_utils import get_index_form, get_numeric_form
+from utils.stream_output import ChunkedWriter, write_table
 
 class MockNode:
     """Простой класс для имитации логического дерева."""
@@ -39,5 +43,32 @@ class TestExpressionUtils(unittest.TestCase):
         result = get_numeric_form(root, variables, mode='sknf')
         self.assertEqual(result, [0, 3])  # 00 и 11
 
+    def test_write_table(self):
+        rows = [{'a': False, 'result': True}, {'a': True, 'result': False}]
+        stream = io.StringIO()
+        write_table(rows, ['a'], stream)
+        self.assertEqual(stream.getvalue(), "a | result\n----------\n0 | 1\n1 | 0\n")
+
+    def test_chunked_writer(self):
+        stream = io.StringIO()
+        writer = ChunkedWriter(stream, chunk_size=4)
+        writer.write("ab")
+        self.assertEqual(stream.getvalue(), "")  # кусок ещё не набран
+        writer.write("cd")
+        self.assertEqual(stream.getvalue(), "abcd")
+        writer.write("e")
+        writer.close()
+        self.assertEqual(stream.getvalue(), "abcde")
+        self.assertFalse(stream.closed)  # чужой поток не закрывается
+
+    def test_chunked_writer_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'out.txt')
+            with ChunkedWriter(path, chunk_size=16) as writer:
+                for i in range(100):
+                    writer.write(f"{i};")
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(file.read(), ''.join(f"{i};" for i in range(100)))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,28 +1,18 @@
 from itertools import product
 
+from truth_table.generator import truth_vector
+
+def _index_bits(root, variables):
+    """Значения функции строкой из 0 и 1, по символу на строку таблицы"""
+    return format(truth_vector(root, variables), f'0{1 << len(variables)}b')
+
 def get_index_form(root, variables, full_output=False):
-    results = []
-    for values in product([False, True], repeat=len(variables)):
-        context = dict(zip(variables, values))
-        result = root.evaluate(context)
-        bin_str = ''.join(['1' if v else '0' for v in values])
-        if full_output:
-            results.append((bin_str, int(result)))
-        else:
-            results.append(str(int(result)))
+    bits = _index_bits(root, variables)
     if full_output:
-        return results
-    return ''.join(results)
+        rows = product('01', repeat=len(variables))
+        return [(''.join(values), int(bit)) for values, bit in zip(rows, bits)]
+    return bits
 
 def get_numeric_form(root, variables, mode='sdnf'):
-    indices = []
-    for idx, values in enumerate(product([False, True], repeat=len(variables))):
-        context = dict(zip(variables, values))
-        result = root.evaluate(context)
-        if mode == 'sdnf' and result:
-            indices.append(idx)
-        elif mode == 'sknf' and not result:
-            indices.append(idx)
-    return indices
-
-
+    target = '1' if mode == 'sdnf' else '0' if mode == 'sknf' else None
+    return [idx for idx, bit in enumerate(_index_bits(root, variables)) if bit == target]
@@ -0,0 +1,57 @@
+import os
+
+def iter_table_lines(truth_table, variables):
+    """Строки таблицы истинности для вывода: заголовок, разделитель и по строке на набор"""
+    header = " | ".join(variables + ['result'])
+    yield header
+    yield "-" * len(header)
+    for row in truth_table:
+        yield " | ".join(['1' if row[v] else '0' for v in variables] + ['1' if row['result'] else '0'])
+
+def write_table(truth_table, variables, stream):
+    """Записывает таблицу истинности в текстовый поток построчно"""
+    for line in iter_table_lines(truth_table, variables):
+        stream.write(line)
+        stream.write("\n")
+
+class ChunkedWriter:
+    """
+    Текстовый поток, собирающий мелкие записи в куски не короче chunk_size символов.
+    Принимает путь к файлу (файл открывается и закрывается самим писателем) или готовый поток.
+    """
+
+    def __init__(self, target, chunk_size=1 << 16, encoding='utf-8'):
+        if isinstance(target, (str, os.PathLike)):
+            self.stream = open(target, 'w', encoding=encoding)
+            self._owns_stream = True
+        else:
+            self.stream = target
+            self._owns_stream = False
+        self.chunk_size = chunk_size
+        self._parts = []
+        self._length = 0
+
+    def write(self, text):
+        self._parts.append(text)
+        self._length += len(text)
+        if self._length >= self.chunk_size:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self._parts:
+            self.stream.write(''.join(self._parts))
+            self._parts = []
+            self._length = 0
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+        if self._owns_stream:
+            self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,15 +1,13 @@
-from typing import List, Tuple, Dict, Set
+from typing import List, Tuple, Dict, Set, Union
 from minimization.calculation import get_prime_implicants, find_minimal_cover, term_to_bin, bin_to_term, covers_minterm
+from truth_table.table import TruthTable, matching_rows
 from utils.table_printer import print_implicant_stages, print_coverage_table
 from utils.common import term_to_string
 
-def minimize_sknf_calc_table(truth_table: List[Dict], variables: List[str]) -> str:
+def minimize_sknf_calc_table(truth_table: Union[List[Dict], TruthTable], variables: List[str]) -> str:
     """Минимизация СКНФ расчётно-табличным методом."""
-    maxterms = []
-    for row in truth_table:
-        if not row['result']:
-            term = [(var, 1 if row[var] else 0) for var in variables]
-            maxterms.append(term)
+    maxterms = [[(var, int(value)) for var, value in zip(variables, values)]
+                for values in matching_rows(truth_table, variables, False)]
     
     if not maxterms:
         return "1"
@@ -35,13 +33,10 @@ def minimize_sknf_calc_table(truth_table: List[Dict], variables: List[str]) -> s
     result = [term_to_string(imp, is_sknf=True) for imp in minimal_cover]
     return " & ".join(f"({r})" for r in sorted(result)) if result else "1"
 
-def minimize_sdnf_calc_table(truth_table: List[Dict], variables: List[str]) -> str:
+def minimize_sdnf_calc_table(truth_table: Union[List[Dict], TruthTable], variables: List[str]) -> str:
     """Минимизация СДНФ расчётно-табличным методом."""
-    minterms = []
-    for row in truth_table:
-        if row['result']:
-            term = [(var, 1 if row[var] else 0) for var in variables]
-            minterms.append(term)
+    minterms = [[(var, int(value)) for var, value in zip(variables, values)]
+                for values in matching_rows(truth_table, variables, True)]
     
     if not minterms:
         return "0"
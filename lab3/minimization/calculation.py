@@ -1,5 +1,6 @@
-from typing import List, Tuple, Dict, Set
+from typing import List, Tuple, Dict, Set, Union
 from itertools import product, combinations
+from truth_table.table import TruthTable, matching_rows
 from utils.table_printer import print_implicant_stages
 from utils.common import term_to_string
 
@@ -199,14 +200,11 @@ def find_minimal_cover(prime_implicants: List[List[Tuple[str, int]]],
     
     return essential_implicants + selected_remaining
 
-def minimize_sdnf_calculation(truth_table: List[Dict], variables: List[str]) -> str:
+def minimize_sdnf_calculation(truth_table: Union[List[Dict], TruthTable], variables: List[str]) -> str:
     """Минимизация СДНФ расчётным методом."""
     # Получаем минтермы из таблицы истинности
-    minterms = []
-    for row in truth_table:
-        if row['result']:
-            term = [(var, 1 if row[var] else 0) for var in variables]
-            minterms.append(term)
+    minterms = [[(var, int(value)) for var, value in zip(variables, values)]
+                for values in matching_rows(truth_table, variables, True)]
     
     if not minterms:
         return "0"
@@ -222,14 +220,11 @@ def minimize_sdnf_calculation(truth_table: List[Dict], variables: List[str]) ->
     result_terms = [term_to_string(term) for term in minimal_cover]
     return " | ".join(f"({r})" for r in sorted(result_terms)) if result_terms else "0"
 
-def minimize_sknf_calculation(truth_table: List[Dict], variables: List[str]) -> str:
+def minimize_sknf_calculation(truth_table: Union[List[Dict], TruthTable], variables: List[str]) -> str:
     """Минимизация СКНФ расчётным методом."""
     # Получаем макстермы из таблицы истинности
-    maxterms = []
-    for row in truth_table:
-        if not row['result']:
-            term = [(var, 1 if row[var] else 0) for var in variables]
-            maxterms.append(term)
+    maxterms = [[(var, int(value)) for var, value in zip(variables, values)]
+                for values in matching_rows(truth_table, variables, False)]
     
     if not maxterms:
         return "1"
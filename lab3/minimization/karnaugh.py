@@ -1,4 +1,5 @@
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Tuple, Set, Union
+from truth_table.table import TruthTable, as_truth_table
 from utils.table_printer import print_karnaugh_map
 from utils.common import term_to_string
 
@@ -10,7 +11,7 @@ def generate_gray_code(n: int) -> List[str]:
     second_half = first_half[::-1]
     return ["0" + code for code in first_half] + ["1" + code for code in second_half]
 
-def build_karnaugh_map(truth_table: List[Dict], variables: List[str], is_sknf: bool = False) -> tuple:
+def build_karnaugh_map(truth_table: Union[List[Dict], TruthTable], variables: List[str], is_sknf: bool = False) -> tuple:
     """Строит карту Карно для 2-5 переменных."""
     n = len(variables)
     if n > 5:
@@ -38,6 +39,7 @@ def build_karnaugh_map(truth_table: List[Dict], variables: List[str], is_sknf: b
     gray_rows = generate_gray_code(len(row_vars))
     gray_cols = generate_gray_code(len(col_vars))
     
+    table = as_truth_table(truth_table, variables)
     kmap_2d = [[0 for _ in range(cols)] for _ in range(rows)]
     kmap_flat = [0 for _ in range(rows * cols)]
     
@@ -57,21 +59,16 @@ def build_karnaugh_map(truth_table: List[Dict], variables: List[str], is_sknf: b
                     valuation[var] = bool(int(col_code[i - len(row_code)]))
             
             # Находим соответствующий результат в таблице истинности
-            for table_row in truth_table:
-                match = True
-                for var in variables:
-                    if table_row[var] != valuation.get(var, False):
-                        match = False
-                        break
-                if match:
-                    value = table_row['result']
-                    # Правильное заполнение карты
-                    if is_sknf:
-                        kmap_2d[row_idx][col_idx] = 0 if not value else 1
-                    else:
-                        kmap_2d[row_idx][col_idx] = 1 if value else 0
-                    kmap_flat[row_idx * cols + col_idx] = kmap_2d[row_idx][col_idx]
-                    break
+            idx = 0
+            for var in variables:
+                idx = (idx << 1) | valuation.get(var, False)
+            value = table.result(idx)
+            # Правильное заполнение карты
+            if is_sknf:
+                kmap_2d[row_idx][col_idx] = 0 if not value else 1
+            else:
+                kmap_2d[row_idx][col_idx] = 1 if value else 0
+            kmap_flat[row_idx * cols + col_idx] = kmap_2d[row_idx][col_idx]
     
     return kmap_2d, kmap_flat, rows, cols, row_vars, col_vars, gray_rows, gray_cols
 
@@ -228,7 +225,7 @@ def group_to_term(group: Set[Tuple[int, int]], row_vars: List[str], col_vars: Li
     
     return [(var, val) for var, val in constant_vars.items()]
 
-def minimize_sknf_karnaugh(truth_table: List[Dict], variables: List[str]) -> str:
+def minimize_sknf_karnaugh(truth_table: Union[List[Dict], TruthTable], variables: List[str]) -> str:
     """Минимизация СКНФ с помощью карты Карно."""
     result = build_karnaugh_map(truth_table, variables, is_sknf=True)
     if result[0] is None:
@@ -252,7 +249,7 @@ def minimize_sknf_karnaugh(truth_table: List[Dict], variables: List[str]) -> str
     result_terms = [term_to_string(term, is_sknf=True) for term in terms]
     return " & ".join(f"({r})" for r in sorted(result_terms)) if result_terms else "1"
 
-def minimize_sdnf_karnaugh(truth_table: List[Dict], variables: List[str]) -> str:
+def minimize_sdnf_karnaugh(truth_table: Union[List[Dict], TruthTable], variables: List[str]) -> str:
     """Минимизация СДНФ с помощью карты Карно."""
     result = build_karnaugh_map(truth_table, variables, is_sknf=False)
     if result[0] is None:
@@ -1,26 +1,47 @@
+from truth_table.table import matching_rows
+
+
+def iter_sdnf_terms(truth_table, variables):
+    """Конъюнкции СДНФ по одной, без сборки всей формы"""
+    literals = [(f"!{var}", var) for var in variables]  # литерал по значению переменной
+    for values in matching_rows(truth_table, variables, True):
+        yield "(" + " & ".join([literal[value] for literal, value in zip(literals, values)]) + ")"
+
+
+def iter_sknf_clauses(truth_table, variables):
+    """Дизъюнкции СКНФ по одной, без сборки всей формы"""
+    literals = [(var, f"!{var}") for var in variables]
+    for values in matching_rows(truth_table, variables, False):
+        yield "(" + " | ".join([literal[value] for literal, value in zip(literals, values)]) + ")"
+
+
+def _write_joined(parts, separator, empty, stream):
+    count = 0
+    for part in parts:
+        if count:
+            stream.write(separator)
+        stream.write(part)
+        count += 1
+    if not count:
+        stream.write(empty)
+    return count
+
+
+def write_sdnf(truth_table, variables, stream):
+    """Записывает СДНФ в текстовый поток по одному терму, возвращает число термов"""
+    return _write_joined(iter_sdnf_terms(truth_table, variables), " | ", "0", stream)
+
+
+def write_sknf(truth_table, variables, stream):
+    """Записывает СКНФ в текстовый поток по одной дизъюнкции, возвращает их число"""
+    return _write_joined(iter_sknf_clauses(truth_table, variables), " & ", "1", stream)
+
+
 def build_sdnf(truth_table, variables):
-    terms = []
-    for row in truth_table:
-        if row['result']:
-            term_parts = []
-            for var in variables:
-                if row[var]:
-                    term_parts.append(var)
-                else:
-                    term_parts.append(f"!{var}")
-            terms.append("(" + " & ".join(term_parts) + ")")
+    terms = list(iter_sdnf_terms(truth_table, variables))
     return " | ".join(terms) if terms else "0"
 
 
 def build_sknf(truth_table, variables):
-    clauses = []
-    for row in truth_table:
-        if not row['result']:
-            clause_parts = []
-            for var in variables:
-                if row[var]:
-                    clause_parts.append(f"!{var}")
-                else:
-                    clause_parts.append(var)
-            clauses.append("(" + " | ".join(clause_parts) + ")")
+    clauses = list(iter_sknf_clauses(truth_table, variables))
     return " & ".join(clauses) if clauses else "1"
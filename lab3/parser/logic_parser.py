@@ -1,5 +1,5 @@
 import re
-from typing import List, Tuple, Set, Dict
+from typing import Dict, Iterator, List, Set, Tuple
 
 class ExprNode:
     def evaluate(self, variables: Dict[str, bool]) -> bool:
@@ -57,6 +57,19 @@ class OrNode(ExprNode):
         self.right.collect_variables(variables)
 
 
+class XorNode(ExprNode):
+    def __init__(self, left: ExprNode, right: ExprNode):
+        self.left = left
+        self.right = right
+
+    def evaluate(self, variables: Dict[str, bool]) -> bool:
+        return self.left.evaluate(variables) != self.right.evaluate(variables)
+
+    def collect_variables(self, variables: Set[str]) -> None:
+        self.left.collect_variables(variables)
+        self.right.collect_variables(variables)
+
+
 class ImplNode(ExprNode):
     def __init__(self, left: ExprNode, right: ExprNode):
         self.left = left
@@ -85,36 +98,37 @@ class EquivNode(ExprNode):
 # === Парсинг выражения ===
 
 token_spec = [
-    (r'\s+',              None),
+    (r'\s+',              'SKIP'),
     (r'\(',               'LPAREN'),
     (r'\)',               'RPAREN'),
-    (r'!',                'NOT'),
-    (r'&',                'AND'),
-    (r'\|',               'OR'),
-    (r'->',               'IMPL'),
-    (r'~',                'EQUIV'),
+    (r'[!¬]',             'NOT'),
+    (r'[&∧]',             'AND'),
+    (r'[|∨]',             'OR'),
+    (r'->|→',             'IMPL'),
+    (r'[~↔]',             'EQUIV'),
+    (r'⊕',                'XOR'),
     (r'[a-zA-Z_]\w*',     'VAR'),
+    (r'.',                'MISMATCH'),
 ]
 
+# Все шаблоны объединены в одно регулярное выражение с именованными группами
+MASTER_PATTERN = re.compile('|'.join(f'(?P<{tag}>{pattern})' for pattern, tag in token_spec), re.DOTALL)
+
 Token = Tuple[str, str]
+PositionedToken = Tuple[str, str, int]
+
+def scan(expression: str) -> Iterator[PositionedToken]:
+    """Лениво выдаёт токены (тег, текст, позиция в строке)."""
+    for match in MASTER_PATTERN.finditer(expression):
+        tag = match.lastgroup
+        if tag == 'SKIP':
+            continue
+        if tag == 'MISMATCH':
+            raise SyntaxError(f"Недопустимый символ: {match.group()} (позиция {match.start()})")
+        yield tag, match.group(), match.start()
 
 def tokenize(expression: str) -> List[Token]:
-    tokens = []
-    pos = 0
-    while pos < len(expression):
-        match = None
-        for pattern, tag in token_spec:
-            regex = re.compile(pattern)
-            match = regex.match(expression, pos)
-            if match:
-                text = match.group(0)
-                if tag:
-                    tokens.append((tag, text))
-                pos = match.end()
-                break
-        if not match:
-            raise SyntaxError(f"Недопустимый символ: {expression[pos]}")
-    return tokens
+    return [(tag, text) for tag, text, _ in scan(expression)]
 
 
 class Parser:
@@ -127,10 +141,13 @@ class Parser:
 
     def parse_equiv(self):
         node = self.parse_impl()
-        while self._accept('EQUIV'):
-            right = self.parse_impl()
-            node = EquivNode(node, right)
-        return node
+        while True:
+            if self._accept('EQUIV'):
+                node = EquivNode(node, self.parse_impl())
+            elif self._accept('XOR'):
+                node = XorNode(node, self.parse_impl())
+            else:
+                return node
 
     def parse_impl(self):
         node = self.parse_or()
@@ -180,11 +197,109 @@ class Parser:
             raise SyntaxError(f"Ожидался {tag}")
 
 
+# Приоритеты и узлы бинарных операций; все операции левоассоциативны
+BINARY_OPERATORS = {
+    'EQUIV': (1, EquivNode),
+    'XOR':   (1, XorNode),
+    'IMPL':  (2, ImplNode),
+    'OR':    (3, OrNode),
+    'AND':   (4, AndNode),
+}
+PRECEDENCE = {tag: precedence for tag, (precedence, _) in BINARY_OPERATORS.items()}
+
+
+class IterativeParser:
+    """
+    Разбор методом сортировочной станции с явными стеками операндов и операций.
+    Строит те же деревья, что и Parser, за линейное время и без рекурсии,
+    поэтому глубокие скобки и длинные цепочки отрицаний не переполняют стек.
+    """
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self) -> ExprNode:
+        tokens = self.tokens
+        operands: List[ExprNode] = []
+        operators: List[str] = []
+        open_parens = 0
+        expect_operand = True
+        pos = self.pos
+        while pos < len(tokens):
+            tag, text = tokens[pos]
+            if expect_operand:
+                if tag == 'VAR':
+                    operands.append(VarNode(text))
+                    if operators and operators[-1] == 'NOT':
+                        self._apply_negations(operands, operators)
+                    expect_operand = False
+                elif tag == 'NOT' or tag == 'LPAREN':
+                    operators.append(tag)
+                    open_parens += tag == 'LPAREN'
+                else:
+                    break
+            elif tag in PRECEDENCE:
+                precedence = PRECEDENCE[tag]
+                while operators and PRECEDENCE.get(operators[-1], 0) >= precedence:
+                    self._reduce(operands, operators)
+                operators.append(tag)
+                expect_operand = True
+            elif tag == 'RPAREN' and open_parens:
+                while operators[-1] != 'LPAREN':
+                    self._reduce(operands, operators)
+                operators.pop()
+                open_parens -= 1
+                self._apply_negations(operands, operators)
+            else:
+                break # как и Parser, разбор останавливается на первом лишнем токене
+            pos += 1
+        self.pos = pos
+
+        if expect_operand:
+            raise SyntaxError("Ожидалась переменная или скобка")
+        while operators:
+            if operators[-1] == 'LPAREN':
+                raise SyntaxError("Ожидался RPAREN")
+            self._reduce(operands, operators)
+        return operands[0]
+
+    @staticmethod
+    def _apply_negations(operands: List[ExprNode], operators: List[str]) -> None:
+        while operators and operators[-1] == 'NOT':
+            operators.pop()
+            operands[-1] = NotNode(operands[-1])
+
+    @staticmethod
+    def _reduce(operands: List[ExprNode], operators: List[str]) -> None:
+        node_class = BINARY_OPERATORS[operators.pop()][1]
+        right = operands.pop()
+        operands[-1] = node_class(operands[-1], right)
+
+
+def children(node: ExprNode) -> Tuple[ExprNode, ...]:
+    if isinstance(node, NotNode):
+        return (node.child,)
+    if isinstance(node, VarNode):
+        return ()
+    return (node.left, node.right)
+
+
+def iter_nodes(root: ExprNode) -> Iterator[ExprNode]:
+    """Обход дерева в прямом порядке без рекурсии"""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(children(node)))
+
+
+def collect_variables(root: ExprNode) -> Set[str]:
+    return {node.name for node in iter_nodes(root) if isinstance(node, VarNode)}
+
+
 def parse_expression(expression: str) -> Tuple[ExprNode, List[str]]:
     tokens = tokenize(expression)
-    parser = Parser(tokens)
+    parser = IterativeParser(tokens)
     root = parser.parse()
-
-    variables = set()
-    root.collect_variables(variables)
-    return root, sorted(variables)
+    return root, sorted(collect_variables(root))
@@ -5,8 +5,9 @@ from minimization.karnaugh import generate_gray_code, build_karnaugh_map, find_m
 from minimization.calc_table import minimize_sknf_calc_table, minimize_sdnf_calc_table
 from utils.common import term_to_string
 from utils.table_printer import print_truth_table, print_implicant_stages, print_coverage_table, print_karnaugh_map
-from parser.logic_parser import tokenize, Parser, parse_expression
-from truth_table.generator import generate_truth_table
+from parser.logic_parser import tokenize, Parser, parse_expression, NotNode
+from truth_table.generator import generate_truth_table, truth_vector
+from truth_table.incremental import gray_truth_vector
 from normal_forms.builder import build_sknf, build_sdnf
 
 class TestMinimization(unittest.TestCase):
@@ -189,12 +190,22 @@ class TestMinimization(unittest.TestCase):
         ]
         self.assertEqual(tokens, expected)
 
+    def test_tokenize_unicode(self):
+        tokens = tokenize("!(!a→!b)∨c")
+        self.assertEqual(tokens, tokenize("!(!a->!b)|c")[:4] + [('IMPL', '→')] + tokenize("!b)")
+                         + [('OR', '∨'), ('VAR', 'c')])
+
     def test_parser(self):
         tokens = tokenize("a & b")
         parser = Parser(tokens)
         node = parser.parse()
         self.assertIsNotNone(node)
 
+    def test_parse_deep_negation(self):
+        node, variables = parse_expression('!' * 20000 + 'a')
+        self.assertEqual(variables, ['a'])
+        self.assertIsInstance(node, NotNode)
+
     def test_parse_expression(self):
         node, variables = parse_expression("a & b | c")
         self.assertIsNotNone(node)
@@ -204,6 +215,11 @@ class TestMinimization(unittest.TestCase):
         table = generate_truth_table(self.root1, self.variables1)
         self.assertEqual(len(table), 8)
         self.assertIn('result', table[0])
+        for row in table:
+            self.assertIs(row['result'], self.root1.evaluate(row))
+        self.assertEqual(truth_vector(self.root1, self.variables1),
+                         int(''.join('1' if row['result'] else '0' for row in table), 2))
+        self.assertEqual(gray_truth_vector(self.root1, self.variables1), truth_vector(self.root1, self.variables1))
 
     def test_build_sknf(self):
         sknf = build_sknf(self.truth_table1, self.variables1)
@@ -262,5 +278,14 @@ class TestMinimization(unittest.TestCase):
         result = minimize_sknf_karnaugh(always_false, ['a', 'b'])
         self.assertEqual(result, "1")  # Should be empty product
 
+    @patch('builtins.print')
+    def test_truth_table_and_rows_agree(self, mock_print):
+        for table, variables in ((self.truth_table1, self.variables1), (self.truth_table2, self.variables2)):
+            rows = table.to_rows()
+            for minimize in (minimize_sdnf_calculation, minimize_sknf_calculation, minimize_sdnf_calc_table,
+                             minimize_sknf_calc_table, minimize_sdnf_karnaugh, minimize_sknf_karnaugh,
+                             build_sdnf, build_sknf):
+                self.assertEqual(minimize(table, variables), minimize(rows, variables))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
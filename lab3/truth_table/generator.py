@@ -1,14 +1,77 @@
 from itertools import product
 
-def generate_truth_table(root, variables):
+from parser.logic_parser import (
+    ExprNode, VarNode, NotNode, AndNode, OrNode, ImplNode, EquivNode, XorNode, iter_nodes
+)
+from truth_table.table import TruthTable
+
+def variable_column(position, count):
     """
-    Строит таблицу истинности по дереву выражения.
+    Столбец переменной с номером position из count в виде 2**count-битного числа.
+    Строка idx таблицы хранится в разряде 2**count - 1 - idx, то есть первая строка - старший бит.
     """
+    size = 1 << count
+    half = 1 << (count - 1 - position)
+    column = (1 << half) - 1  # в старшей половине каждого периода переменная равна 0
+    period = half << 1
+    while period < size:
+        column |= column << period
+        period <<= 1
+    return column
+
+def truth_vector(root, variables):
+    """
+    Вектор значений функции как 2**n-битное число, старший бит - первая строка таблицы.
+    Каждый узел дерева вычисляется одной операцией над столбцами сразу для всех строк.
+    """
+    count = len(variables)
+    size = 1 << count
+    if not isinstance(root, ExprNode):
+        vector = 0
+        for values in product([False, True], repeat=count):
+            vector = (vector << 1) | bool(root.evaluate(dict(zip(variables, values))))
+        return vector
+
+    mask = (1 << size) - 1
+    columns = {name: variable_column(i, count) for i, name in enumerate(variables)}
+    values = {}
+    # в обратном прямом обходе каждый узел идёт после всех своих потомков
+    for node in reversed(list(iter_nodes(root))):
+        if isinstance(node, VarNode):
+            value = columns[node.name]
+        elif isinstance(node, NotNode):
+            value = values.pop(id(node.child)) ^ mask
+        else:
+            left = values.pop(id(node.left))
+            right = values.pop(id(node.right))
+            if isinstance(node, AndNode):
+                value = left & right
+            elif isinstance(node, OrNode):
+                value = left | right
+            elif isinstance(node, ImplNode):
+                value = (left ^ mask) | right
+            elif isinstance(node, EquivNode):
+                value = left ^ right ^ mask
+            elif isinstance(node, XorNode):
+                value = left ^ right
+            else:
+                raise TypeError(f"Неизвестный тип узла: {type(node).__name__}")
+        values[id(node)] = value
+    return values[id(root)]
+
+def table_from_vector(vector, variables):
+    """Таблица истинности в виде списка словарей по вектору значений"""
+    bits = format(vector, f'0{1 << len(variables)}b')
     table = []
-    for values in product([False, True], repeat=len(variables)):
-        valuation = dict(zip(variables, values))
-        result = root.evaluate(valuation)
-        row = valuation.copy()
-        row['result'] = result
+    for values, bit in zip(product([False, True], repeat=len(variables)), bits):
+        row = dict(zip(variables, values))
+        row['result'] = bit == '1'
         table.append(row)
     return table
+
+def generate_truth_table(root, variables):
+    """
+    Строит таблицу истинности по дереву выражения.
+    Строки не хранятся: TruthTable держит только упакованный столбец результатов.
+    """
+    return TruthTable.from_vector(truth_vector(root, variables), variables)
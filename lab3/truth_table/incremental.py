@@ -0,0 +1,133 @@
+from typing import Iterator, List, Tuple
+
+from parser.logic_parser import (
+    VarNode, NotNode, AndNode, OrNode, ImplNode, EquivNode, XorNode, iter_nodes
+)
+
+_VAR, _NOT, _AND, _OR, _IMPL, _EQUIV, _XOR = range(7)
+
+_OPCODES = {
+    NotNode: _NOT,
+    AndNode: _AND,
+    OrNode: _OR,
+    ImplNode: _IMPL,
+    EquivNode: _EQUIV,
+    XorNode: _XOR,
+}
+
+
+class IncrementalEvaluator:
+    """
+    Вычисляет дерево выражения при смене значения одной переменной.
+    Узлы хранятся в обратном порядке обхода (дети раньше родителей) вместе с кешем значений.
+    Для каждой переменной заранее известны узлы, в поддереве которых она встречается:
+    пересчитываются только они, и только если изменилось значение хотя бы одного ребёнка.
+    """
+
+    def __init__(self, root, variables: List[str]):
+        self.variables = list(variables)
+        position = {name: i for i, name in enumerate(self.variables)}
+        nodes = list(iter_nodes(root))
+        nodes.reverse()
+        index = {id(node): i for i, node in enumerate(nodes)}
+
+        self.program: List[Tuple[int, int, int]] = []  # (код операции, левый ребёнок, правый ребёнок)
+        node_vars: List[frozenset] = []  # номера переменных в поддереве каждого узла
+        self.leaves: List[List[int]] = [[] for _ in self.variables]
+        for i, node in enumerate(nodes):
+            if isinstance(node, VarNode):
+                var = position[node.name]
+                self.leaves[var].append(i)
+                self.program.append((_VAR, var, -1))
+                node_vars.append(frozenset((var,)))
+            elif isinstance(node, NotNode):
+                child = index[id(node.child)]
+                self.program.append((_NOT, child, child))
+                node_vars.append(node_vars[child])
+            else:
+                left, right = index[id(node.left)], index[id(node.right)]
+                self.program.append((_OPCODES[type(node)], left, right))
+                node_vars.append(node_vars[left] | node_vars[right])
+        self.dependents: List[List[int]] = [
+            [i for i, (op, _, _) in enumerate(self.program) if op != _VAR and var in node_vars[i]]
+            for var in range(len(self.variables))
+        ]
+
+        self.inputs = [False] * len(self.variables)
+        self.values = [False] * len(self.program)
+        self._changed = [0] * len(self.program)  # номер шага, на котором значение узла изменилось
+        self._step = 0
+        self.touched = 0  # сколько раз узлы операций были пересчитаны
+        for i in range(len(self.program)):
+            self.values[i] = self._compute(i)
+            self.touched += self.program[i][0] != _VAR
+
+    def _compute(self, i: int) -> bool:
+        op, left, right = self.program[i]
+        if op == _VAR:
+            return self.inputs[left]
+        a = self.values[left]
+        b = self.values[right]
+        if op == _NOT:
+            return not a
+        if op == _AND:
+            return a and b
+        if op == _OR:
+            return a or b
+        if op == _IMPL:
+            return not a or b
+        if op == _EQUIV:
+            return a == b
+        return a != b
+
+    @property
+    def result(self) -> bool:
+        return self.values[-1]
+
+    def set(self, var: int, value: bool) -> bool:
+        """Меняет значение переменной с номером var и возвращает новое значение выражения"""
+        value = bool(value)
+        if self.inputs[var] == value:
+            return self.result
+        self.inputs[var] = value
+        self._step += 1
+        step = self._step
+        values, changed, program = self.values, self._changed, self.program
+        for leaf in self.leaves[var]:
+            values[leaf] = value
+            changed[leaf] = step
+        for i in self.dependents[var]:
+            _, left, right = program[i]
+            if changed[left] != step and changed[right] != step:
+                continue
+            self.touched += 1
+            new_value = self._compute(i)
+            if new_value != values[i]:
+                values[i] = new_value
+                changed[i] = step
+        return self.result
+
+    def gray_rows(self) -> Iterator[Tuple[int, bool]]:
+        """
+        Пары (номер строки, значение) в порядке кода Грея: соседние строки
+        отличаются одной переменной. Номер строки - как в таблице истинности.
+        """
+        count = len(self.variables)
+        for var in range(count):
+            self.set(var, False)
+        yield 0, self.result
+        for step in range(1, 1 << count):
+            bit = (step & -step).bit_length() - 1  # младший единичный бит номера шага
+            var = count - 1 - bit
+            self.set(var, not self.inputs[var])
+            yield step ^ (step >> 1), self.result
+
+
+def gray_truth_vector(root, variables: List[str]) -> int:
+    """Вектор значений, как truth_table.generator.truth_vector, но строками в порядке кода Грея"""
+    size = 1 << len(variables)
+    bits = bytearray((size + 7) // 8)
+    for idx, value in IncrementalEvaluator(root, variables).gray_rows():
+        if value:
+            bits[idx >> 3] |= 0x80 >> (idx & 7)
+    return int.from_bytes(bits, 'big') >> (len(bits) * 8 - size)
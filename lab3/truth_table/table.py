@@ -0,0 +1,122 @@
+from itertools import product
+from typing import Dict, Iterator, List, Tuple, Union
+
+_DIGIT_VALUES = {'0': False, '1': True}
+
+class TruthTable:
+    """
+    Таблица истинности, хранящая только столбец результатов: по биту на строку в bytearray,
+    первая строка - старший бит первого байта. Значения переменных строки idx - биты числа idx,
+    первая переменная - старший бит, как в itertools.product.
+    """
+
+    __slots__ = ('variables', 'size', 'bits')
+
+    def __init__(self, variables: List[str], bits: bytearray):
+        self.variables = list(variables)
+        self.size = 1 << len(self.variables)
+        if len(bits) != (self.size + 7) // 8:
+            raise ValueError("Длина битового вектора не соответствует числу переменных")
+        self.bits = bits
+
+    @classmethod
+    def from_vector(cls, vector: int, variables: List[str]) -> 'TruthTable':
+        """Таблица по вектору значений из truth_table.generator.truth_vector"""
+        size = 1 << len(variables)
+        length = (size + 7) // 8
+        return cls(variables, bytearray((vector << (length * 8 - size)).to_bytes(length, 'big')))
+
+    @classmethod
+    def from_rows(cls, rows, variables: List[str]) -> 'TruthTable':
+        """
+        Таблица по списку словарей. Отсутствующие строки считаются ложными,
+        из повторяющихся берётся первая.
+        """
+        table = cls(variables, bytearray(((1 << len(variables)) + 7) // 8))
+        seen = set()
+        for row in rows:
+            idx = 0
+            for var in variables:
+                idx = (idx << 1) | bool(row[var])
+            if idx not in seen:
+                seen.add(idx)
+                if row['result']:
+                    table.bits[idx >> 3] |= 0x80 >> (idx & 7)
+        return table
+
+    @property
+    def vector(self) -> int:
+        return int.from_bytes(self.bits, 'big') >> (len(self.bits) * 8 - self.size)
+
+    def result(self, idx: int) -> bool:
+        return bool(self.bits[idx >> 3] & (0x80 >> (idx & 7)))
+
+    def values(self, idx: int) -> Tuple[bool, ...]:
+        """Значения переменных в строке idx"""
+        return tuple(map(_DIGIT_VALUES.__getitem__, format(idx, f'0{len(self.variables)}b')))
+
+    def indices(self, value: bool = True) -> Iterator[int]:
+        """Номера строк, в которых функция равна value; однородные байты пропускаются целиком"""
+        skip = 0x00 if value else 0xFF
+        for byte_idx, byte in enumerate(self.bits):
+            if byte == skip:
+                continue
+            start = byte_idx << 3
+            for offset in range(min(8, self.size - start)):
+                if bool(byte & (0x80 >> offset)) == value:
+                    yield start + offset
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Dict[str, bool], List[Dict[str, bool]]]:
+        """Строка по номеру; срез, как у списка строк, возвращает список словарей"""
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.size))]
+        if idx < 0:
+            idx += self.size
+        if not 0 <= idx < self.size:
+            raise IndexError("Номер строки вне таблицы")
+        row = dict(zip(self.variables, self.values(idx)))
+        row['result'] = self.result(idx)
+        return row
+
+    def __iter__(self) -> Iterator[Dict[str, bool]]:
+        for idx, values in enumerate(product([False, True], repeat=len(self.variables))):
+            row = dict(zip(self.variables, values))
+            row['result'] = self.result(idx)
+            yield row
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TruthTable):
+            return self.variables == other.variables and self.bits == other.bits
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    # Таблица изменяема (bits - bytearray) и сравнивается со списками строк, поэтому не хэшируется
+    __hash__ = None
+
+    def to_rows(self) -> List[Dict[str, bool]]:
+        return list(self)
+
+
+def as_truth_table(truth_table, variables: List[str]) -> TruthTable:
+    """TruthTable с заданным порядком переменных из таблицы любого вида"""
+    if isinstance(truth_table, TruthTable) and truth_table.variables == list(variables):
+        return truth_table
+    return TruthTable.from_rows(truth_table, variables)
+
+
+def matching_rows(truth_table, variables: List[str], value: bool = True) -> Iterator[Tuple[bool, ...]]:
+    """
+    Значения переменных в строках, где функция равна value, в порядке таблицы.
+    У TruthTable строки с другим значением не разворачиваются.
+    """
+    if isinstance(truth_table, TruthTable) and truth_table.variables == list(variables):
+        for idx in truth_table.indices(value):
+            yield truth_table.values(idx)
+        return
+    for row in truth_table:
+        if bool(row['result']) == value:
+            yield tuple(bool(row[var]) for var in variables)
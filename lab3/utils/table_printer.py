@@ -1,7 +1,8 @@
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Union
+from truth_table.table import TruthTable
 from utils.common import term_to_string
 
-def print_truth_table(truth_table: List[Dict], variables: List[str]) -> None:
+def print_truth_table(truth_table: Union[List[Dict], TruthTable], variables: List[str]) -> None:
     """Выводит таблицу истинности."""
     header = variables + ["f"]
     print(" | ".join(header))